@@ -5,14 +5,21 @@ Detects ABCD patterns for precise entry and exit timing
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
-from scipy import signal
+from dataclasses import dataclass, field
+from collections import deque
+import bisect
+import functools
+from itertools import takewhile
+from numba import njit, prange
 import math
 
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pattern points B, C and D are searched within this many swings of the previous point
+SWING_SEARCH_SPAN = 8
+
 @dataclass
 class ABCDPoint:
     """Represents a point in the ABCD pattern"""
@@ -39,16 +46,403 @@ class ABCDPattern:
     entry_price: Optional[float]
     pattern_strength: str  # 'weak', 'moderate', 'strong'
 
+@dataclass(slots=True)
+class EntrySignal:
+    """Entry signal from a complete or potential ABCD pattern"""
+    type: str  # 'entry', 'anticipated_entry'
+    pattern_type: str  # 'bullish', 'bearish'
+    entry_price: Optional[float]
+    target_price: Optional[float]
+    stop_loss: Optional[float]
+    confidence: float
+    signal_strength: str  # 'strong', 'moderate'
+    pattern_strength: Optional[str] = None  # Complete patterns only
+    completion_ratio: Optional[float] = None  # Potential patterns only
+
+@dataclass(slots=True)
+class ExitSignal:
+    """Exit signal from a complete ABCD pattern"""
+    type: str  # 'take_profit', 'stop_loss'
+    reason: str  # 'target_reached', 'stop_hit'
+    exit_price: Optional[float]
+    pattern_type: str  # 'bullish', 'bearish'
+    signal_strength: str
+
 @dataclass
 class ABCDAnalysis:
     """Complete ABCD analysis result"""
     patterns_found: List[ABCDPattern]
     active_pattern: Optional[ABCDPattern]
     potential_patterns: List[ABCDPattern]  # Incomplete patterns
-    entry_signals: List[Dict[str, Any]]
-    exit_signals: List[Dict[str, Any]]
+    entry_signals: List[EntrySignal]
+    exit_signals: List[ExitSignal]
     pattern_summary: Dict[str, int]
 
+@dataclass
+class SwingArray:
+    """Swing highs/lows stored column-wise, sorted by bar index"""
+    idx: np.ndarray  # bar index of each swing point
+    price: np.ndarray  # high for peaks, low for troughs
+    is_peak: np.ndarray  # True for swing highs, False for swing lows
+    timestamps: pd.Index
+    
+    def __len__(self) -> int:
+        return len(self.idx)
+    
+    def point(self, n: int) -> ABCDPoint:
+        """Materialize swing point ``n`` as an ABCDPoint"""
+        return ABCDPoint(
+            index=int(self.idx[n]),
+            price=float(self.price[n]),
+            timestamp=self.timestamps[n],
+            point_type='peak' if self.is_peak[n] else 'trough'
+        )
+    
+    @classmethod
+    def empty(cls) -> 'SwingArray':
+        return cls(idx=np.empty(0, dtype=np.int64), price=np.empty(0),
+                   is_peak=np.empty(0, dtype=bool), timestamps=pd.Index([]))
+
+def _local_maxima(x: np.ndarray) -> np.ndarray:
+    """Indices of local maxima; flat tops resolve to their middle sample"""
+    # Collapse runs of equal values so plateaus compare as a single sample
+    starts = np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+    ends = np.r_[starts[1:] - 1, len(x) - 1]
+    values = x[starts]
+    
+    runs = np.flatnonzero((values[1:-1] > values[:-2]) & (values[1:-1] > values[2:])) + 1
+    return (starts[runs] + ends[runs]) // 2
+
+@njit(cache=True)
+def _distance_keep_mask(peaks: np.ndarray, order: np.ndarray, distance: int) -> np.ndarray:
+    """Greedy distance selection: peaks in ``order`` (ascending priority) claim their neighbourhood"""
+    keep = np.ones(len(peaks), dtype=np.bool_)
+    
+    for n in order[::-1]:
+        if not keep[n]:
+            continue
+        k = n - 1
+        while k >= 0 and peaks[n] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = n + 1
+        while k < len(peaks) and peaks[k] - peaks[n] < distance:
+            keep[k] = False
+            k += 1
+    
+    return keep
+
+def _select_by_distance(x: np.ndarray, peaks: np.ndarray, distance: int) -> np.ndarray:
+    """Drop peaks closer than ``distance`` to a higher peak"""
+    if len(peaks) < 2:
+        return peaks
+    
+    # Nothing to resolve unless some neighbouring peaks are closer than ``distance``
+    if np.diff(peaks).min() >= distance:
+        return peaks
+    
+    # Highest peaks claim their neighbourhood first
+    return peaks[_distance_keep_mask(peaks, np.argsort(x[peaks]), distance)]
+
+def _sparse_table(x: np.ndarray, op) -> List[np.ndarray]:
+    """Range-reduction table: level k holds op over windows of 2**k samples"""
+    table = [x]
+    width = 1
+    while 2 * width <= len(x):
+        prev = table[-1]
+        table.append(op(prev[:-width], prev[width:]))
+        width *= 2
+    return table
+
+def _peak_prominences(x: np.ndarray, peaks: np.ndarray) -> np.ndarray:
+    """Topographic prominence of each peak (same definition as scipy.signal)"""
+    n = len(x)
+    heights = x[peaks]
+    max_table = _sparse_table(x, np.maximum)
+    min_table = _sparse_table(x, np.minimum)
+    
+    # Extend each peak's horizontal line outwards until it meets higher ground,
+    # lifting over power-of-two windows for all peaks at once
+    left = peaks.copy()
+    right = peaks + 1
+    for k in range(len(max_table) - 1, -1, -1):
+        width = 1 << k
+        level = max_table[k]
+        
+        start = left - width
+        can_extend = start >= 0
+        can_extend[can_extend] = level[start[can_extend]] <= heights[can_extend]
+        left[can_extend] -= width
+        
+        can_extend = right + width <= n
+        can_extend[can_extend] = level[right[can_extend]] <= heights[can_extend]
+        right[can_extend] += width
+    
+    def range_min(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        # Minimum over the inclusive ranges [lo, hi]
+        level = np.floor(np.log2(hi - lo + 1)).astype(np.int64)
+        out = np.empty(len(lo))
+        for k in np.unique(level):
+            sel = level == k
+            table = min_table[k]
+            out[sel] = np.minimum(table[lo[sel]], table[hi[sel] - (1 << k) + 1])
+        return out
+    
+    left_base = range_min(left, peaks)
+    right_base = range_min(peaks, right - 1)
+    return heights - np.maximum(left_base, right_base)
+
+def _find_swing_extrema(high_prices: np.ndarray, low_prices: np.ndarray,
+                        distance: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find swing highs and lows in one scan
+    
+    Equivalent to ``scipy.signal.find_peaks(x, distance=distance, prominence=0.5 * std(x))``
+    run on the highs and on the negated lows.
+    
+    Returns:
+        (peak_indices, trough_indices)
+    """
+    n_bars = len(high_prices)
+    high_std, low_std = np.std(np.stack([high_prices, low_prices]), axis=1)
+    
+    # Scan highs and negated lows as one series. The NaN gap acts as the array
+    # edge for both halves: NaN is never a peak and never counts as lower ground.
+    series = np.concatenate([high_prices, np.full(distance, np.nan, dtype=high_prices.dtype), -low_prices])
+    offset = n_bars + distance
+    
+    peaks = _local_maxima(series)
+    split = np.searchsorted(peaks, n_bars)
+    peaks = np.concatenate([_select_by_distance(series, peaks[:split], distance),
+                            _select_by_distance(series, peaks[split:], distance)])
+    
+    # Prominence threshold is half the standard deviation of each side
+    threshold = np.where(peaks < n_bars, high_std * 0.5, low_std * 0.5)
+    peaks = peaks[_peak_prominences(series, peaks) >= threshold]
+    
+    split = np.searchsorted(peaks, n_bars)
+    return peaks[:split], peaks[split:] - offset
+
+@njit(cache=True)
+def _abcd_enumerate(idx: np.ndarray, dist: np.ndarray, is_peak: np.ndarray, max_len: int,
+                    hits: np.ndarray, legs: np.ndarray, start: int, write: bool) -> int:
+    """
+    Enumerate swing quadruples that alternate peak/trough within the pattern window
+    
+    ``dist[i, o]`` holds the price distance between swing ``i`` and swing ``i + o``
+    (see ``_swing_distances``). When ``write`` is set, candidate swing positions
+    and AB/BC/CD leg lengths are stored in ``hits``/``legs`` from row ``start``.
+    
+    Returns:
+        Number of candidates found
+    """
+    n = len(idx)
+    count = 0
+    
+    # Only strict peak/trough alternations can form a pattern, so B..D are
+    # drawn from the position list of the required swing type
+    peak_pos = np.flatnonzero(is_peak)
+    trough_pos = np.flatnonzero(~is_peak)
+    
+    for i in range(n - 3):
+        bd_pos = trough_pos if is_peak[i] else peak_pos
+        c_pos = peak_pos if is_peak[i] else trough_pos
+        
+        for jj in range(np.searchsorted(bd_pos, i, side='right'), len(bd_pos)):
+            j = bd_pos[jj]
+            if j >= min(i + SWING_SEARCH_SPAN, n - 2) or idx[j] - idx[i] > max_len:  # Limit search range
+                break
+            ab_distance = dist[i, j - i]
+            for kk in range(np.searchsorted(c_pos, j, side='right'), len(c_pos)):
+                k = c_pos[kk]
+                if k >= min(j + SWING_SEARCH_SPAN, n - 1) or idx[k] - idx[i] > max_len:
+                    break
+                bc_distance = dist[j, k - j]
+                for ll in range(np.searchsorted(bd_pos, k, side='right'), len(bd_pos)):
+                    l = bd_pos[ll]
+                    if l >= min(k + SWING_SEARCH_SPAN, n):
+                        break
+                    
+                    # Swings are sorted by bar index, so once a point falls outside the
+                    # pattern window every later point does too
+                    if idx[l] - idx[i] > max_len:
+                        break
+                    
+                    if write:
+                        row = start + count
+                        hits[row, 0] = i
+                        hits[row, 1] = j
+                        hits[row, 2] = k
+                        hits[row, 3] = l
+                        legs[row, 0] = ab_distance
+                        legs[row, 1] = bc_distance
+                        legs[row, 2] = dist[k, l - k]
+                    count += 1
+    
+    return count
+
+@njit(cache=True)
+def _abcd_search_numba(idx: np.ndarray, dist: np.ndarray, is_peak: np.ndarray, max_len: int):
+    """
+    Find ABCD candidates for one symbol
+    
+    Returns:
+        (hits, legs) where ``hits`` is an (N, 4) array of swing positions for
+        points A, B, C and D and ``legs`` an (N, 3) array of AB/BC/CD lengths
+    """
+    hits = np.empty((0, 4), dtype=np.int32)
+    legs = np.empty((0, 3), dtype=dist.dtype)
+    count = _abcd_enumerate(idx, dist, is_peak, max_len, hits, legs, 0, False)
+    
+    hits = np.empty((count, 4), dtype=np.int32)
+    legs = np.empty((count, 3), dtype=dist.dtype)
+    _abcd_enumerate(idx, dist, is_peak, max_len, hits, legs, 0, True)
+    return hits, legs
+
+@njit(cache=True, parallel=True)
+def _abcd_search_batch_numba(offsets: np.ndarray, idx: np.ndarray, dist: np.ndarray,
+                             is_peak: np.ndarray, max_len: int):
+    """
+    Find ABCD candidates for many symbols in parallel
+    
+    Swing arrays of all symbols are concatenated; symbol ``s`` owns rows
+    ``offsets[s]:offsets[s + 1]``.
+    
+    Returns:
+        (hit_offsets, hits, legs) where symbol ``s`` owns candidate rows
+        ``hit_offsets[s]:hit_offsets[s + 1]``; swing positions in ``hits`` are
+        relative to that symbol's own swing arrays
+    """
+    n_symbols = len(offsets) - 1
+    empty_hits = np.empty((0, 4), dtype=np.int32)
+    empty_legs = np.empty((0, 3), dtype=dist.dtype)
+    
+    counts = np.zeros(n_symbols, dtype=np.int64)
+    for s in prange(n_symbols):
+        lo, hi = offsets[s], offsets[s + 1]
+        counts[s] = _abcd_enumerate(idx[lo:hi], dist[lo:hi], is_peak[lo:hi], max_len,
+                                    empty_hits, empty_legs, 0, False)
+    
+    hit_offsets = np.zeros(n_symbols + 1, dtype=np.int64)
+    hit_offsets[1:] = np.cumsum(counts)
+    hits = np.empty((hit_offsets[-1], 4), dtype=np.int32)
+    legs = np.empty((hit_offsets[-1], 3), dtype=dist.dtype)
+    
+    for s in prange(n_symbols):
+        lo, hi = offsets[s], offsets[s + 1]
+        _abcd_enumerate(idx[lo:hi], dist[lo:hi], is_peak[lo:hi], max_len,
+                        hits, legs, hit_offsets[s], True)
+    
+    return hit_offsets, hits, legs
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise numerator / denominator, 0 where the denominator is not positive"""
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+def _pattern_values(patterns: List[ABCDPattern], getter, dtype=np.float64) -> np.ndarray:
+    """Gather one scalar per pattern into an array"""
+    return np.fromiter((getter(p) for p in patterns), dtype=dtype, count=len(patterns))
+
+@functools.lru_cache(maxsize=4096)
+def _abc_geometry(price_a: float, price_b: float, price_c: float, bullish: bool,
+                  min_retracement: float, max_retracement: float,
+                  ideal_ab_cd_ratio: float) -> Optional[Tuple[float, float, float]]:
+    """
+    ABC leg distances and projected D price (see ABCDPatternDetector._project_abc)
+    
+    Cached on the swing prices rather than swing positions, so entries stay valid
+    when the same swings are re-analyzed bar after bar with a longer history.
+    """
+    fabs = math.fabs
+    
+    # Calculate AB and BC distances
+    ab_distance = fabs(price_b - price_a)
+    bc_distance = fabs(price_c - price_b)
+    
+    # Calculate retracement
+    bc_retracement = bc_distance / ab_distance if ab_distance > 0 else 0
+    
+    # Check if retracement is within valid range
+    if not min_retracement <= bc_retracement <= max_retracement:
+        return None
+    
+    # Project D point based on ideal ratios
+    projected_cd_distance = ab_distance * ideal_ab_cd_ratio
+    
+    if bullish:
+        projected_d_price = price_c + projected_cd_distance
+    else:
+        projected_d_price = price_c - projected_cd_distance
+    
+    return ab_distance, bc_distance, projected_d_price
+
+def _swing_distances(price: np.ndarray, span: int) -> np.ndarray:
+    """Pairwise |price[i + o] - price[i]| for offsets o < span, as an (n, span) band"""
+    dist = np.zeros((len(price), span), dtype=price.dtype)
+    for offset in range(1, min(span, len(price))):
+        dist[:-offset, offset] = np.abs(price[offset:] - price[:-offset])
+    return dist
+
+def _welford_update(count: int, mean: float, m2: float, value: float) -> Tuple[float, float]:
+    """One step of Welford's online mean/variance; returns the new (mean, m2)"""
+    delta = value - mean
+    mean += delta / count
+    return mean, m2 + delta * (value - mean)
+
+def _confirm_stream_extrema(values: deque, timestamps: deque, pending: List[list], n_bars: int,
+                            distance: int, threshold: float, max_age: int) -> List[Tuple[int, float, Any]]:
+    """
+    Advance online peak detection by one bar
+    
+    ``values`` holds the most recent bars (negate lows to find troughs). The bar
+    ``distance - 1`` places from the end becomes a candidate when it tops its
+    neighbours; candidates wait in ``pending`` as ``[bar, value, timestamp,
+    left_base, right_base]`` until their prominence within the window reaches
+    ``threshold``, a higher bar rules them out, or they age past ``max_age``.
+    
+    Returns:
+        Newly confirmed (bar, value, timestamp) extrema
+    """
+    latest = values[-1]
+    confirmed = []
+    waiting = []
+    
+    for candidate in pending:
+        # A higher bar fixes the right base before the prominence was reached
+        if latest > candidate[1]:
+            continue
+        candidate[4] = min(candidate[4], latest)
+        if candidate[1] - max(candidate[3], candidate[4]) >= threshold:
+            confirmed.append((candidate[0], candidate[1], candidate[2]))
+        elif n_bars - candidate[0] <= max_age:
+            waiting.append(candidate)
+    pending[:] = waiting
+    
+    if len(values) < 2 * distance - 1:
+        return confirmed
+    
+    position = len(values) - distance
+    value = values[position]
+    left = [values[k] for k in range(position - distance + 1, position)]
+    right = [values[k] for k in range(position + 1, len(values))]
+    
+    if value > max(left) and value >= max(right):
+        # Left base: lowest value back to the first higher bar or the window start
+        left_base = value
+        k = position - 1
+        while k >= 0 and values[k] <= value:
+            left_base = min(left_base, values[k])
+            k -= 1
+        right_base = min(right)
+        
+        bar = n_bars - distance
+        if value - max(left_base, right_base) >= threshold:
+            confirmed.append((bar, value, timestamps[position]))
+        else:
+            pending.append([bar, value, timestamps[position], left_base, right_base])
+    
+    return confirmed
+
 class ABCDPatternDetector:
     """Detects ABCD patterns in price data using Ross Cameron's methodology"""
     
@@ -65,6 +459,7 @@ class ABCDPatternDetector:
         # Ideal Fibonacci ratios for ABCD patterns
         self.ideal_ab_cd_ratio = 1.0  # AB = CD (1:1 ratio)
         self.ideal_bc_cd_ratio = 0.618  # BC = 61.8% of CD
+        self.ideal_ab_cd_ratios = np.array([1.0, 0.618, 1.618])  # Accepted AB:CD ratios
         
         logger.info("ABCD Pattern Detector initialized")
     
@@ -79,135 +474,205 @@ class ABCDPatternDetector:
             ABCDAnalysis with all detected patterns
         """
         try:
-            if len(price_data) < self.min_pattern_length:
-                logger.warning("Insufficient data for ABCD pattern analysis")
+            inputs = self._prepare_swings(price_data)
+            if inputs is None:
                 return self._create_empty_analysis()
             
-            # Find swing points (peaks and troughs)
-            swing_points = self._find_swing_points(price_data)
-            
-            if len(swing_points) < 3:
-                logger.info("Not enough swing points for ABCD patterns")
-                return self._create_empty_analysis()
+            swing_points, current_price, n_bars = inputs
             
             # Detect complete patterns
-            complete_patterns = self._detect_complete_patterns(swing_points, price_data)
-            
-            # Detect potential/incomplete patterns
-            potential_patterns = self._detect_potential_patterns(swing_points, price_data)
-            
-            # Find active pattern (most recent and relevant)
-            active_pattern = self._find_active_pattern(complete_patterns, potential_patterns)
-            
-            # Generate entry/exit signals
-            entry_signals = self._generate_entry_signals(complete_patterns, potential_patterns, price_data)
-            exit_signals = self._generate_exit_signals(complete_patterns, price_data)
+            complete_patterns = self._detect_complete_patterns(swing_points)
             
-            # Create pattern summary
-            pattern_summary = self._create_pattern_summary(complete_patterns, potential_patterns)
-            
-            return ABCDAnalysis(
-                patterns_found=complete_patterns,
-                active_pattern=active_pattern,
-                potential_patterns=potential_patterns,
-                entry_signals=entry_signals,
-                exit_signals=exit_signals,
-                pattern_summary=pattern_summary
-            )
+            return self._assemble_analysis(swing_points, complete_patterns, current_price, n_bars)
             
         except Exception as e:
             logger.error(f"Error analyzing ABCD patterns: {e}")
             return self._create_empty_analysis()
     
-    def _find_swing_points(self, price_data: pd.DataFrame) -> List[ABCDPoint]:
+    def analyze_abcd_patterns_batch(self, price_data: Dict[str, pd.DataFrame]) -> Dict[str, ABCDAnalysis]:
+        """
+        Analyze many symbols for ABCD patterns, running the pattern search for
+        all of them in parallel
+        
+        Args:
+            price_data: Mapping of symbol to DataFrame with OHLCV data
+            
+        Returns:
+            Mapping of symbol to ABCDAnalysis, in the order given
+        """
+        results = {}
+        prepared = {}
+        
+        for symbol, frame in price_data.items():
+            try:
+                inputs = self._prepare_swings(frame)
+            except Exception as e:
+                logger.error(f"Error analyzing ABCD patterns for {symbol}: {e}")
+                inputs = None
+            
+            if inputs is None:
+                results[symbol] = self._create_empty_analysis()
+            else:
+                prepared[symbol] = inputs
+        
+        if prepared:
+            swings = [inputs[0] for inputs in prepared.values()]
+            offsets = np.zeros(len(swings) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(swing_points) for swing_points in swings])
+            
+            hit_offsets, hits, legs = _abcd_search_batch_numba(
+                offsets,
+                np.concatenate([swing_points.idx for swing_points in swings]),
+                np.concatenate([_swing_distances(swing_points.price, SWING_SEARCH_SPAN) for swing_points in swings]),
+                np.concatenate([swing_points.is_peak for swing_points in swings]),
+                self.max_pattern_length
+            )
+            
+            for n, (symbol, (swing_points, current_price, n_bars)) in enumerate(prepared.items()):
+                try:
+                    lo, hi = hit_offsets[n], hit_offsets[n + 1]
+                    complete_patterns = self._score_complete_patterns(swing_points, hits[lo:hi], legs[lo:hi])
+                    results[symbol] = self._assemble_analysis(swing_points, complete_patterns, current_price, n_bars)
+                except Exception as e:
+                    logger.error(f"Error analyzing ABCD patterns for {symbol}: {e}")
+                    results[symbol] = self._create_empty_analysis()
+        
+        return {symbol: results[symbol] for symbol in price_data}
+    
+    def _prepare_swings(self, price_data: pd.DataFrame) -> Optional[Tuple[SwingArray, float, int]]:
+        """
+        Extract swing points from price data
+        
+        Returns:
+            (swing_points, current_price, n_bars), or None if there is not enough
+            data for pattern analysis
+        """
+        n_bars = len(price_data)
+        if n_bars < self.min_pattern_length:
+            logger.warning("Insufficient data for ABCD pattern analysis")
+            return None
+        
+        # Pull the columns out of the DataFrame once for all helpers
+        high_prices = price_data['high'].to_numpy(dtype=np.float64)
+        low_prices = price_data['low'].to_numpy(dtype=np.float64)
+        current_price = float(price_data['close'].iat[-1])
+        
+        # Find swing points (peaks and troughs)
+        swing_points = self._find_swing_points(high_prices, low_prices, price_data.index)
+        
+        if len(swing_points) < 3:
+            logger.info("Not enough swing points for ABCD patterns")
+            return None
+        
+        return swing_points, current_price, n_bars
+    
+    def _assemble_analysis(self, swing_points: SwingArray, complete_patterns: List[ABCDPattern],
+                           current_price: float, n_bars: int) -> ABCDAnalysis:
+        """Derive potential patterns, signals and summary around the complete patterns"""
+        # Detect potential/incomplete patterns
+        potential_patterns = self._detect_potential_patterns(swing_points, current_price, n_bars)
+        
+        # Find active pattern (most recent and relevant)
+        active_pattern = self._find_active_pattern(complete_patterns, potential_patterns)
+        
+        # Generate entry/exit signals
+        entry_signals = self._generate_entry_signals(complete_patterns, potential_patterns, current_price)
+        exit_signals = self._generate_exit_signals(complete_patterns, current_price)
+        
+        # Create pattern summary
+        pattern_summary = self._create_pattern_summary(complete_patterns, potential_patterns)
+        
+        return ABCDAnalysis(
+            patterns_found=complete_patterns,
+            active_pattern=active_pattern,
+            potential_patterns=potential_patterns,
+            entry_signals=entry_signals,
+            exit_signals=exit_signals,
+            pattern_summary=pattern_summary
+        )
+    
+    def _find_swing_points(self, high_prices: np.ndarray, low_prices: np.ndarray,
+                           timestamps: pd.Index) -> SwingArray:
         """Find significant swing highs and lows"""
         try:
-            high_prices = price_data['high'].values
-            low_prices = price_data['low'].values
-            timestamps = price_data.index
-            
-            # Find peaks (swing highs)
-            peak_indices = signal.find_peaks(high_prices, 
-                                           distance=3,  # Minimum distance between peaks
-                                           prominence=np.std(high_prices) * 0.5)[0]
-            
-            # Find troughs (swing lows)
-            trough_indices = signal.find_peaks(-low_prices,
-                                             distance=3,  # Minimum distance between troughs
-                                             prominence=np.std(low_prices) * 0.5)[0]
-            
-            # Combine and sort swing points
-            swing_points = []
-            
-            # Add peaks
-            for idx in peak_indices:
-                swing_points.append(ABCDPoint(
-                    index=idx,
-                    price=high_prices[idx],
-                    timestamp=timestamps[idx],
-                    point_type='peak'
-                ))
-            
-            # Add troughs
-            for idx in trough_indices:
-                swing_points.append(ABCDPoint(
-                    index=idx,
-                    price=low_prices[idx],
-                    timestamp=timestamps[idx],
-                    point_type='trough'
-                ))
-            
-            # Sort by index
-            swing_points.sort(key=lambda x: x.index)
+            # Find peaks (swing highs) and troughs (swing lows)
+            peak_indices, trough_indices = _find_swing_extrema(
+                high_prices, low_prices,
+                distance=3  # Minimum distance between swings
+            )
+            
+            # Merge peaks and troughs in bar order
+            idx = np.concatenate([peak_indices, trough_indices])
+            price = np.concatenate([high_prices[peak_indices], low_prices[trough_indices]])
+            is_peak = np.concatenate([np.ones(len(peak_indices), dtype=bool),
+                                      np.zeros(len(trough_indices), dtype=bool)])
+            order = np.argsort(idx, kind='stable')
+            
+            swing_points = SwingArray(
+                idx=idx[order],
+                price=price[order],
+                is_peak=is_peak[order],
+                timestamps=timestamps[idx[order]]
+            )
             
             logger.debug(f"Found {len(swing_points)} swing points")
             return swing_points
             
         except Exception as e:
             logger.warning(f"Error finding swing points: {e}")
-            return []
+            return SwingArray.empty()
     
-    def _detect_complete_patterns(self, swing_points: List[ABCDPoint], price_data: pd.DataFrame) -> List[ABCDPattern]:
+    def _detect_complete_patterns(self, swing_points: SwingArray) -> List[ABCDPattern]:
         """Detect complete ABCD patterns"""
-        patterns = []
-        
         try:
             # Need at least 4 swing points for a complete pattern
             if len(swing_points) < 4:
-                return patterns
+                return []
+            
+            # Search all swing quadruples in compiled code
+            # Only the SWING_SEARCH_SPAN band of the pairwise distance matrix is ever read
+            dist = _swing_distances(swing_points.price, SWING_SEARCH_SPAN)
+            hits, legs = _abcd_search_numba(swing_points.idx, dist, swing_points.is_peak, self.max_pattern_length)
             
-            # Look for ABCD patterns in recent swing points
-            for i in range(len(swing_points) - 3):
-                for j in range(i + 1, min(i + 8, len(swing_points) - 2)):  # Limit search range
-                    for k in range(j + 1, min(j + 8, len(swing_points) - 1)):
-                        for l in range(k + 1, min(k + 8, len(swing_points))):
-                            
-                            # Check if indices are within reasonable range
-                            if swing_points[l].index - swing_points[i].index > self.max_pattern_length:
-                                continue
-                            
-                            pattern = self._validate_abcd_pattern(
-                                swing_points[i], swing_points[j], 
-                                swing_points[k], swing_points[l]
-                            )
-                            
-                            if pattern and pattern.is_valid:
-                                patterns.append(pattern)
-            
-            # Sort by confidence and recency
-            patterns.sort(key=lambda x: (x.confidence, x.point_d.index if x.point_d else 0), reverse=True)
-            
-            # Remove overlapping patterns (keep best ones)
-            filtered_patterns = self._filter_overlapping_patterns(patterns)
-            
-            logger.info(f"Detected {len(filtered_patterns)} complete ABCD patterns")
-            return filtered_patterns
+            return self._score_complete_patterns(swing_points, hits, legs)
             
         except Exception as e:
             logger.warning(f"Error detecting complete patterns: {e}")
             return []
     
-    def _detect_potential_patterns(self, swing_points: List[ABCDPoint], price_data: pd.DataFrame) -> List[ABCDPattern]:
+    def _score_complete_patterns(self, swing_points: SwingArray, hits: np.ndarray,
+                                 legs: np.ndarray) -> List[ABCDPattern]:
+        """Score search candidates and keep the best non-overlapping patterns"""
+        patterns = []
+        ab_distance, bc_distance, cd_distance = legs[:, 0], legs[:, 1], legs[:, 2]
+        
+        # Score every candidate at once
+        ab_cd = _safe_ratio(cd_distance, ab_distance)
+        bc_cd = _safe_ratio(bc_distance, cd_distance)
+        bc_retracement = _safe_ratio(bc_distance, ab_distance)
+        
+        valid = self._is_valid_abcd_ratios(ab_cd, bc_cd, bc_retracement)
+        hits, ab_cd, bc_cd, bc_retracement = hits[valid], ab_cd[valid], bc_cd[valid], bc_retracement[valid]
+        confidence = self._calculate_pattern_confidence(ab_cd, bc_cd, bc_retracement)
+        
+        # Only surviving candidates become ABCDPattern objects
+        for n in range(len(hits)):
+            a, b, c, d = hits[n]
+            patterns.append(self._build_abcd_pattern(
+                swing_points, a, b, c, d, ab_cd[n], bc_cd[n], confidence[n]
+            ))
+        
+        # Sort by confidence and recency
+        patterns.sort(key=lambda x: (x.confidence, x.point_d.index if x.point_d else 0), reverse=True)
+        
+        # Remove overlapping patterns (keep best ones)
+        filtered_patterns = self._filter_overlapping_patterns(patterns)
+        
+        logger.info(f"Detected {len(filtered_patterns)} complete ABCD patterns")
+        return filtered_patterns
+    
+    def _detect_potential_patterns(self, swing_points: SwingArray, current_price: float,
+                                   n_bars: int) -> List[ABCDPattern]:
         """Detect potential/incomplete ABCD patterns (ABC completed, waiting for D)"""
         patterns = []
         
@@ -216,295 +681,259 @@ class ABCDPatternDetector:
             if len(swing_points) < 3:
                 return patterns
             
-            current_price = price_data['close'].iloc[-1]
+            n_swings = len(swing_points)
+            bar_index = swing_points.idx.tolist()
+            price = swing_points.price.tolist()
+            is_peak = swing_points.is_peak.tolist()
+            geometry_params = (self.min_retracement, self.max_retracement, self.ideal_ab_cd_ratio)
+            abc_completion_ratio = self._abc_completion_ratio
+            candidates = []
             
             # Look for ABC patterns that could complete
-            for i in range(len(swing_points) - 2):
-                for j in range(i + 1, min(i + 6, len(swing_points) - 1)):
-                    for k in range(j + 1, min(j + 6, len(swing_points))):
+            for i in range(n_swings - 2):
+                for j in range(i + 1, min(i + 6, n_swings - 1)):
+                    if is_peak[j] == is_peak[i]:
+                        continue
+                    for k in range(j + 1, min(j + 6, n_swings)):
                         
                         # Check if pattern is recent enough
-                        if len(price_data) - swing_points[k].index > 20:  # Not too old
+                        if n_bars - bar_index[k] > 20:  # Not too old
                             continue
                         
                         # Validate ABC portion
-                        abc_pattern = self._validate_abc_pattern(
-                            swing_points[i], swing_points[j], swing_points[k], current_price
-                        )
+                        if is_peak[k] == is_peak[j]:
+                            continue
+                        projection = _abc_geometry(price[i], price[j], price[k], not is_peak[i], *geometry_params)
+                        if projection is None:
+                            continue
+                        
+                        ab_distance, _, projected_d_price = projection
+                        completion_ratio = abc_completion_ratio(ab_distance, projected_d_price, current_price)
                         
-                        if abc_pattern and abc_pattern.completion_ratio >= 0.75:
-                            patterns.append(abc_pattern)
+                        if completion_ratio >= 0.75:
+                            candidates.append((completion_ratio, bar_index[k], i, j, k))
             
             # Sort by completion ratio and recency
-            patterns.sort(key=lambda x: (x.completion_ratio, x.point_c.index), reverse=True)
+            candidates.sort(key=lambda x: (x[0], x[1]), reverse=True)
             
-            logger.info(f"Detected {len(patterns)} potential ABCD patterns")
-            return patterns[:5]  # Keep top 5
+            # Only the kept candidates are materialized as ABCDPattern objects
+            patterns = [self._validate_abc_pattern(swing_points, i, j, k, current_price)
+                        for _, _, i, j, k in candidates[:5]]  # Keep top 5
+            
+            logger.info(f"Detected {len(candidates)} potential ABCD patterns")
+            return patterns
             
         except Exception as e:
             logger.warning(f"Error detecting potential patterns: {e}")
             return []
     
-    def _validate_abcd_pattern(self, point_a: ABCDPoint, point_b: ABCDPoint, 
-                              point_c: ABCDPoint, point_d: ABCDPoint) -> Optional[ABCDPattern]:
-        """Validate if four points form a valid ABCD pattern"""
-        try:
-            # Determine pattern type based on point sequence
-            if ((point_a.point_type == 'trough' and point_b.point_type == 'peak' and 
-                 point_c.point_type == 'trough' and point_d.point_type == 'peak') or
-                (point_a.point_type == 'peak' and point_b.point_type == 'trough' and 
-                 point_c.point_type == 'peak' and point_d.point_type == 'trough')):
-                
-                pattern_type = 'bullish' if point_a.point_type == 'trough' else 'bearish'
-                
-                # Calculate pattern metrics
-                ab_distance = abs(point_b.price - point_a.price)
-                bc_distance = abs(point_c.price - point_b.price)
-                cd_distance = abs(point_d.price - point_c.price)
-                
-                # Calculate Fibonacci ratios
-                ab_cd_ratio = cd_distance / ab_distance if ab_distance > 0 else 0
-                bc_cd_ratio = bc_distance / cd_distance if cd_distance > 0 else 0
-                
-                # Calculate retracement ratios
-                if pattern_type == 'bullish':
-                    bc_retracement = bc_distance / ab_distance if ab_distance > 0 else 0
-                else:
-                    bc_retracement = bc_distance / ab_distance if ab_distance > 0 else 0
-                
-                # Validate pattern criteria
-                is_valid = self._is_valid_abcd_ratios(ab_cd_ratio, bc_cd_ratio, bc_retracement)
+    def _build_abcd_pattern(self, swing_points: SwingArray, a: int, b: int, c: int, d: int,
+                            ab_cd_ratio: float, bc_cd_ratio: float, confidence: float) -> ABCDPattern:
+        """Materialize a validated ABCD quadruple as an ABCDPattern"""
+        point_a, point_b = swing_points.point(a), swing_points.point(b)
+        point_c, point_d = swing_points.point(c), swing_points.point(d)
+        pattern_type = 'bearish' if swing_points.is_peak[a] else 'bullish'
+        ab_cd_ratio = float(ab_cd_ratio)
+        bc_cd_ratio = float(bc_cd_ratio)
+        confidence = float(confidence)
+        
+        return ABCDPattern(
+            point_a=point_a,
+            point_b=point_b,
+            point_c=point_c,
+            point_d=point_d,
+            pattern_type=pattern_type,
+            completion_ratio=1.0,
+            fibonacci_ratio_ab_cd=ab_cd_ratio,
+            fibonacci_ratio_bc_cd=bc_cd_ratio,
+            is_valid=True,
+            confidence=confidence,
+            projected_target=self._calculate_target_price(point_a, point_b, point_c, point_d, pattern_type),
+            stop_loss_level=self._calculate_stop_loss(point_c, point_d, pattern_type),
+            entry_price=point_d.price,
+            pattern_strength=self._determine_pattern_strength(confidence, ab_cd_ratio, bc_cd_ratio)
+        )
+    
+    def _project_abc(self, price_a: float, price_b: float, price_c: float,
+                     bullish: bool) -> Optional[Tuple[float, float, float]]:
+        """
+        Project the D point of an ABC leg
+        
+        Returns:
+            (ab_distance, bc_distance, projected_d_price), or None when the BC
+            retracement is outside the valid range
+        """
+        return _abc_geometry(price_a, price_b, price_c, bullish,
+                             self.min_retracement, self.max_retracement, self.ideal_ab_cd_ratio)
+    
+    def _abc_completion_ratio(self, ab_distance: float, projected_d_price: float, current_price: float) -> float:
+        """How close current price is to the projected D point (0-1)"""
+        price_diff = math.fabs(current_price - projected_d_price)
+        max_diff = ab_distance * 0.2  # 20% tolerance
+        
+        return max(0, 1 - (price_diff / max_diff)) if max_diff > 0 else 0
+    
+    def _validate_abc_pattern(self, swing_points: SwingArray, a: int, b: int,
+                             c: int, current_price: float) -> Optional[ABCDPattern]:
+        """Validate ABC portion and project potential D point"""
+        is_peak = swing_points.is_peak
+        price = swing_points.price
+        
+        # Check if ABC forms valid sequence
+        if is_peak[a] != is_peak[b] and is_peak[b] != is_peak[c]:
+            
+            pattern_type = 'bearish' if is_peak[a] else 'bullish'
+            projection = self._project_abc(price[a], price[b], price[c], pattern_type == 'bullish')
+            
+            if projection is not None:
+                ab_distance, bc_distance, projected_d_price = projection
+                projected_cd_distance = ab_distance * self.ideal_ab_cd_ratio
+                bc_retracement = bc_distance / ab_distance if ab_distance > 0 else 0
+                point_a, point_b, point_c = swing_points.point(a), swing_points.point(b), swing_points.point(c)
                 
-                # Calculate confidence
-                confidence = self._calculate_pattern_confidence(ab_cd_ratio, bc_cd_ratio, bc_retracement)
+                completion_ratio = self._abc_completion_ratio(ab_distance, projected_d_price, current_price)
                 
-                # Calculate targets and stops
-                projected_target = self._calculate_target_price(point_a, point_b, point_c, point_d, pattern_type)
-                stop_loss_level = self._calculate_stop_loss(point_c, point_d, pattern_type)
-                entry_price = point_d.price
+                # Calculate confidence for ABC portion
+                confidence = self._calculate_abc_confidence(bc_retracement, completion_ratio)
                 
-                # Determine pattern strength
-                pattern_strength = self._determine_pattern_strength(confidence, ab_cd_ratio, bc_cd_ratio)
+                # Create projected D point
+                projected_d = ABCDPoint(
+                    index=len(point_c.timestamp) if hasattr(point_c.timestamp, '__len__') else point_c.index + 5,
+                    price=projected_d_price,
+                    timestamp=point_c.timestamp,
+                    point_type='peak' if pattern_type == 'bullish' else 'trough'
+                )
                 
                 return ABCDPattern(
                     point_a=point_a,
                     point_b=point_b,
                     point_c=point_c,
-                    point_d=point_d,
+                    point_d=projected_d,
                     pattern_type=pattern_type,
-                    completion_ratio=1.0,
-                    fibonacci_ratio_ab_cd=ab_cd_ratio,
-                    fibonacci_ratio_bc_cd=bc_cd_ratio,
-                    is_valid=is_valid,
+                    completion_ratio=completion_ratio,
+                    fibonacci_ratio_ab_cd=self.ideal_ab_cd_ratio,
+                    fibonacci_ratio_bc_cd=bc_distance / projected_cd_distance if projected_cd_distance > 0 else 0,
+                    is_valid=completion_ratio >= 0.75,
                     confidence=confidence,
-                    projected_target=projected_target,
-                    stop_loss_level=stop_loss_level,
-                    entry_price=entry_price,
-                    pattern_strength=pattern_strength
+                    projected_target=self._calculate_target_price(point_a, point_b, point_c, projected_d, pattern_type),
+                    stop_loss_level=self._calculate_stop_loss(point_c, projected_d, pattern_type),
+                    entry_price=projected_d_price,
+                    pattern_strength=self._determine_pattern_strength(confidence, self.ideal_ab_cd_ratio, bc_distance / projected_cd_distance if projected_cd_distance > 0 else 0)
                 )
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error validating ABCD pattern: {e}")
-            return None
-    
-    def _validate_abc_pattern(self, point_a: ABCDPoint, point_b: ABCDPoint, 
-                             point_c: ABCDPoint, current_price: float) -> Optional[ABCDPattern]:
-        """Validate ABC portion and project potential D point"""
-        try:
-            # Check if ABC forms valid sequence
-            if ((point_a.point_type == 'trough' and point_b.point_type == 'peak' and point_c.point_type == 'trough') or
-                (point_a.point_type == 'peak' and point_b.point_type == 'trough' and point_c.point_type == 'peak')):
-                
-                pattern_type = 'bullish' if point_a.point_type == 'trough' else 'bearish'
-                
-                # Calculate AB and BC distances
-                ab_distance = abs(point_b.price - point_a.price)
-                bc_distance = abs(point_c.price - point_b.price)
-                
-                # Calculate retracement
-                bc_retracement = bc_distance / ab_distance if ab_distance > 0 else 0
-                
-                # Check if retracement is within valid range
-                if self.min_retracement <= bc_retracement <= self.max_retracement:
-                    
-                    # Project D point based on ideal ratios
-                    projected_cd_distance = ab_distance * self.ideal_ab_cd_ratio
-                    
-                    if pattern_type == 'bullish':
-                        projected_d_price = point_c.price + projected_cd_distance
-                    else:
-                        projected_d_price = point_c.price - projected_cd_distance
-                    
-                    # Calculate how close current price is to projected D
-                    price_diff = abs(current_price - projected_d_price)
-                    max_diff = ab_distance * 0.2  # 20% tolerance
-                    
-                    completion_ratio = max(0, 1 - (price_diff / max_diff)) if max_diff > 0 else 0
-                    
-                    # Calculate confidence for ABC portion
-                    confidence = self._calculate_abc_confidence(bc_retracement, completion_ratio)
-                    
-                    # Create projected D point
-                    projected_d = ABCDPoint(
-                        index=len(point_c.timestamp) if hasattr(point_c.timestamp, '__len__') else point_c.index + 5,
-                        price=projected_d_price,
-                        timestamp=point_c.timestamp,
-                        point_type='peak' if pattern_type == 'bullish' else 'trough'
-                    )
-                    
-                    return ABCDPattern(
-                        point_a=point_a,
-                        point_b=point_b,
-                        point_c=point_c,
-                        point_d=projected_d,
-                        pattern_type=pattern_type,
-                        completion_ratio=completion_ratio,
-                        fibonacci_ratio_ab_cd=self.ideal_ab_cd_ratio,
-                        fibonacci_ratio_bc_cd=bc_distance / projected_cd_distance if projected_cd_distance > 0 else 0,
-                        is_valid=completion_ratio >= 0.75,
-                        confidence=confidence,
-                        projected_target=self._calculate_target_price(point_a, point_b, point_c, projected_d, pattern_type),
-                        stop_loss_level=self._calculate_stop_loss(point_c, projected_d, pattern_type),
-                        entry_price=projected_d_price,
-                        pattern_strength=self._determine_pattern_strength(confidence, self.ideal_ab_cd_ratio, bc_distance / projected_cd_distance if projected_cd_distance > 0 else 0)
-                    )
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error validating ABC pattern: {e}")
-            return None
+        
+        return None
     
-    def _is_valid_abcd_ratios(self, ab_cd_ratio: float, bc_cd_ratio: float, bc_retracement: float) -> bool:
-        """Check if ratios are within valid ABCD pattern ranges"""
-        try:
-            # AB:CD ratio should be close to 1.0 (ideal) or 0.618/1.618 (Fibonacci)
-            ab_cd_valid = (abs(ab_cd_ratio - 1.0) <= self.fibonacci_tolerance or
-                          abs(ab_cd_ratio - 0.618) <= self.fibonacci_tolerance or
-                          abs(ab_cd_ratio - 1.618) <= self.fibonacci_tolerance)
-            
-            # BC retracement should be between 38.2% and 78.6%
-            retracement_valid = self.min_retracement <= bc_retracement <= self.max_retracement
-            
-            return ab_cd_valid and retracement_valid
-            
-        except Exception:
-            return False
+    def _is_valid_abcd_ratios(self, ab_cd_ratio: np.ndarray, bc_cd_ratio: np.ndarray,
+                              bc_retracement: np.ndarray) -> np.ndarray:
+        """Check which candidates have ratios within valid ABCD pattern ranges"""
+        tolerance = self.fibonacci_tolerance
+        
+        # AB:CD ratio should be close to 1.0 (ideal) or 0.618/1.618 (Fibonacci)
+        # One (M, 3) broadcast compare reduced over the ideal ratios
+        ab_cd_valid = (np.abs(ab_cd_ratio[:, None] - self.ideal_ab_cd_ratios) <= tolerance).any(axis=1)
+        
+        # BC retracement should be between 38.2% and 78.6%
+        retracement_valid = (bc_retracement >= self.min_retracement) & (bc_retracement <= self.max_retracement)
+        
+        return ab_cd_valid & retracement_valid
     
-    def _calculate_pattern_confidence(self, ab_cd_ratio: float, bc_cd_ratio: float, bc_retracement: float) -> float:
-        """Calculate confidence score for ABCD pattern"""
-        try:
-            confidence = 0
-            
-            # AB:CD ratio score (40 points max)
-            if abs(ab_cd_ratio - 1.0) <= 0.05:  # Very close to 1:1
-                confidence += 40
-            elif abs(ab_cd_ratio - 1.0) <= self.fibonacci_tolerance:
-                confidence += 30
-            elif abs(ab_cd_ratio - 0.618) <= self.fibonacci_tolerance or abs(ab_cd_ratio - 1.618) <= self.fibonacci_tolerance:
-                confidence += 25
-            
-            # BC retracement score (30 points max)
-            if abs(bc_retracement - 0.618) <= 0.05:  # Close to golden ratio
-                confidence += 30
-            elif abs(bc_retracement - 0.5) <= 0.05:  # Close to 50%
-                confidence += 25
-            elif self.min_retracement <= bc_retracement <= self.max_retracement:
-                confidence += 20
-            
-            # BC:CD ratio score (30 points max)
-            if abs(bc_cd_ratio - 0.618) <= 0.05:
-                confidence += 30
-            elif abs(bc_cd_ratio - 0.5) <= 0.1:
-                confidence += 20
-            elif 0.3 <= bc_cd_ratio <= 0.8:
-                confidence += 15
-            
-            return min(confidence, 100)
-            
-        except Exception:
-            return 0
+    def _calculate_pattern_confidence(self, ab_cd_ratio: np.ndarray, bc_cd_ratio: np.ndarray,
+                                      bc_retracement: np.ndarray) -> np.ndarray:
+        """Calculate confidence scores for ABCD pattern candidates"""
+        tolerance = self.fibonacci_tolerance
+        
+        # AB:CD ratio score (40 points max)
+        ab_cd_score = np.select(
+            [np.abs(ab_cd_ratio - 1.0) <= 0.05,  # Very close to 1:1
+             np.abs(ab_cd_ratio - 1.0) <= tolerance,
+             (np.abs(ab_cd_ratio - 0.618) <= tolerance) | (np.abs(ab_cd_ratio - 1.618) <= tolerance)],
+            [40.0, 30.0, 25.0], default=0.0
+        )
+        
+        # BC retracement score (30 points max)
+        retracement_score = np.select(
+            [np.abs(bc_retracement - 0.618) <= 0.05,  # Close to golden ratio
+             np.abs(bc_retracement - 0.5) <= 0.05,  # Close to 50%
+             (bc_retracement >= self.min_retracement) & (bc_retracement <= self.max_retracement)],
+            [30.0, 25.0, 20.0], default=0.0
+        )
+        
+        # BC:CD ratio score (30 points max)
+        bc_cd_score = np.select(
+            [np.abs(bc_cd_ratio - 0.618) <= 0.05,
+             np.abs(bc_cd_ratio - 0.5) <= 0.1,
+             (bc_cd_ratio >= 0.3) & (bc_cd_ratio <= 0.8)],
+            [30.0, 20.0, 15.0], default=0.0
+        )
+        
+        return np.minimum(ab_cd_score + retracement_score + bc_cd_score, 100.0)
     
     def _calculate_abc_confidence(self, bc_retracement: float, completion_ratio: float) -> float:
         """Calculate confidence for ABC portion of pattern"""
-        try:
-            confidence = 0
-            
-            # Retracement quality (50 points max)
-            if abs(bc_retracement - 0.618) <= 0.05:
-                confidence += 50
-            elif abs(bc_retracement - 0.5) <= 0.05:
-                confidence += 40
-            elif self.min_retracement <= bc_retracement <= self.max_retracement:
-                confidence += 30
-            
-            # Completion ratio (50 points max)
-            confidence += completion_ratio * 50
-            
-            return min(confidence, 100)
-            
-        except Exception:
-            return 0
+        fabs = math.fabs
+        confidence = 0
+        
+        # Retracement quality (50 points max)
+        if fabs(bc_retracement - 0.618) <= 0.05:
+            confidence += 50
+        elif fabs(bc_retracement - 0.5) <= 0.05:
+            confidence += 40
+        elif self.min_retracement <= bc_retracement <= self.max_retracement:
+            confidence += 30
+        
+        # Completion ratio (50 points max)
+        confidence += completion_ratio * 50
+        
+        return min(confidence, 100)
     
     def _calculate_target_price(self, point_a: ABCDPoint, point_b: ABCDPoint, 
                                point_c: ABCDPoint, point_d: ABCDPoint, pattern_type: str) -> float:
         """Calculate price target based on ABCD pattern"""
-        try:
-            cd_distance = abs(point_d.price - point_c.price)
-            
-            if pattern_type == 'bullish':
-                # Target is D + extension
-                target = point_d.price + (cd_distance * 0.618)  # 61.8% extension
-            else:
-                # Target is D - extension
-                target = point_d.price - (cd_distance * 0.618)  # 61.8% extension
-            
-            return target
-            
-        except Exception:
-            return point_d.price
+        cd_distance = abs(point_d.price - point_c.price)
+        
+        if pattern_type == 'bullish':
+            # Target is D + extension
+            target = point_d.price + (cd_distance * 0.618)  # 61.8% extension
+        else:
+            # Target is D - extension
+            target = point_d.price - (cd_distance * 0.618)  # 61.8% extension
+        
+        return target
     
     def _calculate_stop_loss(self, point_c: ABCDPoint, point_d: ABCDPoint, pattern_type: str) -> float:
         """Calculate stop loss level"""
-        try:
-            if pattern_type == 'bullish':
-                # Stop below C point
-                return point_c.price * 0.98  # 2% below C
-            else:
-                # Stop above C point
-                return point_c.price * 1.02  # 2% above C
-                
-        except Exception:
-            return point_d.price
+        if pattern_type == 'bullish':
+            # Stop below C point
+            return point_c.price * 0.98  # 2% below C
+        else:
+            # Stop above C point
+            return point_c.price * 1.02  # 2% above C
     
     def _determine_pattern_strength(self, confidence: float, ab_cd_ratio: float, bc_cd_ratio: float) -> str:
         """Determine pattern strength based on various factors"""
-        try:
-            if confidence >= 80 and abs(ab_cd_ratio - 1.0) <= 0.1:
-                return 'strong'
-            elif confidence >= 60:
-                return 'moderate'
-            else:
-                return 'weak'
-                
-        except Exception:
+        if confidence >= 80 and math.fabs(ab_cd_ratio - 1.0) <= 0.1:
+            return 'strong'
+        elif confidence >= 60:
+            return 'moderate'
+        else:
             return 'weak'
     
     def _find_active_pattern(self, complete_patterns: List[ABCDPattern], 
                            potential_patterns: List[ABCDPattern]) -> Optional[ABCDPattern]:
         """Find the most relevant active pattern"""
         try:
-            # Prefer complete patterns with high confidence
-            for pattern in complete_patterns:
-                if pattern.confidence >= 70 and pattern.pattern_strength in ['strong', 'moderate']:
-                    return pattern
-            
-            # Fall back to potential patterns
-            for pattern in potential_patterns:
-                if pattern.completion_ratio >= 0.8 and pattern.confidence >= 60:
-                    return pattern
+            # Prefer complete patterns with high confidence. They are sorted by
+            # confidence (descending), so the scan stops at the first one below 70.
+            pattern = next((p for p in takewhile(lambda p: p.confidence >= 70, complete_patterns)
+                            if p.pattern_strength != 'weak'), None)
+            if pattern is not None:
+                return pattern
+            
+            # Fall back to potential patterns, sorted by completion ratio (descending)
+            pattern = next((p for p in takewhile(lambda p: p.completion_ratio >= 0.8, potential_patterns)
+                            if p.confidence >= 60), None)
+            if pattern is not None:
+                return pattern
             
             # Return best available pattern
             if complete_patterns:
@@ -519,45 +948,49 @@ class ABCDPatternDetector:
     
     def _generate_entry_signals(self, complete_patterns: List[ABCDPattern], 
                                potential_patterns: List[ABCDPattern], 
-                               price_data: pd.DataFrame) -> List[Dict[str, Any]]:
+                               current_price: float) -> List[EntrySignal]:
         """Generate entry signals based on ABCD patterns"""
         signals = []
         
         try:
-            current_price = price_data['close'].iloc[-1]
-            
             # Check complete patterns for entry opportunities
-            for pattern in complete_patterns:
-                if pattern.confidence >= 60:
-                    # Entry signal if price is near D point
-                    price_diff = abs(current_price - pattern.point_d.price)
-                    entry_tolerance = abs(pattern.point_d.price - pattern.point_c.price) * 0.1
-                    
-                    if price_diff <= entry_tolerance:
-                        signals.append({
-                            'type': 'entry',
-                            'pattern_type': pattern.pattern_type,
-                            'entry_price': pattern.entry_price,
-                            'target_price': pattern.projected_target,
-                            'stop_loss': pattern.stop_loss_level,
-                            'confidence': pattern.confidence,
-                            'pattern_strength': pattern.pattern_strength,
-                            'signal_strength': 'strong' if pattern.confidence >= 80 else 'moderate'
-                        })
+            if complete_patterns:
+                confidence = _pattern_values(complete_patterns, lambda p: p.confidence)
+                d_price = _pattern_values(complete_patterns, lambda p: p.point_d.price)
+                c_price = _pattern_values(complete_patterns, lambda p: p.point_c.price)
+                
+                # Entry signal if price is near D point
+                entry_mask = (confidence >= 60) & (np.abs(current_price - d_price) <= np.abs(d_price - c_price) * 0.1)
+                
+                for n in np.flatnonzero(entry_mask):
+                    pattern = complete_patterns[n]
+                    signals.append(EntrySignal(
+                        type='entry',
+                        pattern_type=pattern.pattern_type,
+                        entry_price=pattern.entry_price,
+                        target_price=pattern.projected_target,
+                        stop_loss=pattern.stop_loss_level,
+                        confidence=pattern.confidence,
+                        pattern_strength=pattern.pattern_strength,
+                        signal_strength='strong' if pattern.confidence >= 80 else 'moderate'
+                    ))
             
             # Check potential patterns for anticipated entries
-            for pattern in potential_patterns:
-                if pattern.completion_ratio >= 0.8:
-                    signals.append({
-                        'type': 'anticipated_entry',
-                        'pattern_type': pattern.pattern_type,
-                        'entry_price': pattern.entry_price,
-                        'target_price': pattern.projected_target,
-                        'stop_loss': pattern.stop_loss_level,
-                        'confidence': pattern.confidence,
-                        'completion_ratio': pattern.completion_ratio,
-                        'signal_strength': 'moderate'
-                    })
+            if potential_patterns:
+                completion = _pattern_values(potential_patterns, lambda p: p.completion_ratio)
+                
+                for n in np.flatnonzero(completion >= 0.8):
+                    pattern = potential_patterns[n]
+                    signals.append(EntrySignal(
+                        type='anticipated_entry',
+                        pattern_type=pattern.pattern_type,
+                        entry_price=pattern.entry_price,
+                        target_price=pattern.projected_target,
+                        stop_loss=pattern.stop_loss_level,
+                        confidence=pattern.confidence,
+                        completion_ratio=pattern.completion_ratio,
+                        signal_strength='moderate'
+                    ))
             
             return signals
             
@@ -566,51 +999,44 @@ class ABCDPatternDetector:
             return []
     
     def _generate_exit_signals(self, complete_patterns: List[ABCDPattern], 
-                              price_data: pd.DataFrame) -> List[Dict[str, Any]]:
+                              current_price: float) -> List[ExitSignal]:
         """Generate exit signals based on ABCD patterns"""
         signals = []
         
         try:
-            current_price = price_data['close'].iloc[-1]
+            if not complete_patterns:
+                return signals
             
-            for pattern in complete_patterns:
-                if pattern.projected_target and pattern.stop_loss_level:
-                    
-                    # Check if target is reached
-                    if pattern.pattern_type == 'bullish' and current_price >= pattern.projected_target:
-                        signals.append({
-                            'type': 'take_profit',
-                            'reason': 'target_reached',
-                            'exit_price': pattern.projected_target,
-                            'pattern_type': pattern.pattern_type,
-                            'signal_strength': 'strong'
-                        })
-                    elif pattern.pattern_type == 'bearish' and current_price <= pattern.projected_target:
-                        signals.append({
-                            'type': 'take_profit',
-                            'reason': 'target_reached',
-                            'exit_price': pattern.projected_target,
-                            'pattern_type': pattern.pattern_type,
-                            'signal_strength': 'strong'
-                        })
-                    
-                    # Check if stop loss is hit
-                    if pattern.pattern_type == 'bullish' and current_price <= pattern.stop_loss_level:
-                        signals.append({
-                            'type': 'stop_loss',
-                            'reason': 'stop_hit',
-                            'exit_price': pattern.stop_loss_level,
-                            'pattern_type': pattern.pattern_type,
-                            'signal_strength': 'strong'
-                        })
-                    elif pattern.pattern_type == 'bearish' and current_price >= pattern.stop_loss_level:
-                        signals.append({
-                            'type': 'stop_loss',
-                            'reason': 'stop_hit',
-                            'exit_price': pattern.stop_loss_level,
-                            'pattern_type': pattern.pattern_type,
-                            'signal_strength': 'strong'
-                        })
+            has_levels = _pattern_values(complete_patterns, lambda p: bool(p.projected_target and p.stop_loss_level), dtype=bool)
+            target = _pattern_values(complete_patterns, lambda p: p.projected_target or np.nan)
+            stop = _pattern_values(complete_patterns, lambda p: p.stop_loss_level or np.nan)
+            bullish = _pattern_values(complete_patterns, lambda p: p.pattern_type == 'bullish', dtype=bool)
+            bearish = _pattern_values(complete_patterns, lambda p: p.pattern_type == 'bearish', dtype=bool)
+            
+            # Check if target is reached / stop loss is hit
+            take_profit = has_levels & ((bullish & (current_price >= target)) | (bearish & (current_price <= target)))
+            stop_hit = has_levels & ((bullish & (current_price <= stop)) | (bearish & (current_price >= stop)))
+            
+            for n in np.flatnonzero(take_profit | stop_hit):
+                pattern = complete_patterns[n]
+                
+                if take_profit[n]:
+                    signals.append(ExitSignal(
+                        type='take_profit',
+                        reason='target_reached',
+                        exit_price=pattern.projected_target,
+                        pattern_type=pattern.pattern_type,
+                        signal_strength='strong'
+                    ))
+                
+                if stop_hit[n]:
+                    signals.append(ExitSignal(
+                        type='stop_loss',
+                        reason='stop_hit',
+                        exit_price=pattern.stop_loss_level,
+                        pattern_type=pattern.pattern_type,
+                        signal_strength='strong'
+                    ))
             
             return signals
             
@@ -644,20 +1070,16 @@ class ABCDPatternDetector:
             if not patterns:
                 return []
             
+            # Bars already claimed by accepted (higher-ranked) patterns
+            occupied = np.zeros(max(p.point_d.index for p in patterns) + 1, dtype=bool)
             filtered = []
             
             for pattern in patterns:
-                # Check if this pattern overlaps with any already filtered pattern
-                overlaps = False
-                
-                for existing in filtered:
-                    # Check if patterns overlap in time
-                    if (pattern.point_a.index <= existing.point_d.index and 
-                        pattern.point_d.index >= existing.point_a.index):
-                        overlaps = True
-                        break
+                start, end = pattern.point_a.index, pattern.point_d.index + 1
                 
-                if not overlaps:
+                # Patterns overlap in time if any bar in A..D is already claimed
+                if not occupied[start:end].any():
+                    occupied[start:end] = True
                     filtered.append(pattern)
             
             return filtered
@@ -676,3 +1098,108 @@ class ABCDPatternDetector:
             pattern_summary={}
         )
 
+@dataclass
+class ABCDStreamState:
+    """
+    Incremental ABCD analysis for a live bar feed
+    
+    Swing points are confirmed online against running (Welford) high/low
+    statistics and a window of the last ``max_pattern_length`` bars, and the
+    pattern search only sees swings near the tail, so each new bar costs
+    O(max_pattern_length) rather than a rescan of the full history. Results
+    approximate ``analyze_abcd_patterns``: prominence is measured within the
+    window and against the volatility seen so far.
+    """
+    detector: ABCDPatternDetector
+    distance: int = 3  # Minimum distance between swings
+    n: int = 0
+    mean_h: float = 0.0
+    m2_h: float = 0.0
+    mean_l: float = 0.0
+    m2_l: float = 0.0
+    highs: deque = field(init=False)
+    neg_lows: deque = field(init=False)
+    timestamps: deque = field(init=False)
+    pending_peaks: List[list] = field(default_factory=list)
+    pending_troughs: List[list] = field(default_factory=list)
+    swing_idx: List[int] = field(default_factory=list)
+    swing_price: List[float] = field(default_factory=list)
+    swing_is_peak: List[bool] = field(default_factory=list)
+    swing_timestamps: List[Any] = field(default_factory=list)
+    
+    def __post_init__(self):
+        window = self.detector.max_pattern_length
+        self.highs = deque(maxlen=window)
+        self.neg_lows = deque(maxlen=window)
+        self.timestamps = deque(maxlen=window)
+    
+    def update(self, bar_high: float, bar_low: float, bar_close: float, bar_ts: Any) -> ABCDAnalysis:
+        """
+        Add one bar and return the ABCD analysis as of that bar
+        
+        Args:
+            bar_high: High of the new bar
+            bar_low: Low of the new bar
+            bar_close: Close of the new bar, used as the current price
+            bar_ts: Timestamp of the new bar
+            
+        Returns:
+            ABCDAnalysis over the recent swing points
+        """
+        detector = self.detector
+        
+        try:
+            self.n += 1
+            self.mean_h, self.m2_h = _welford_update(self.n, self.mean_h, self.m2_h, bar_high)
+            self.mean_l, self.m2_l = _welford_update(self.n, self.mean_l, self.m2_l, bar_low)
+            
+            self.highs.append(bar_high)
+            self.neg_lows.append(-bar_low)
+            self.timestamps.append(bar_ts)
+            
+            # Prominence threshold is half the standard deviation of each side
+            high_threshold = 0.5 * math.sqrt(self.m2_h / self.n)
+            low_threshold = 0.5 * math.sqrt(self.m2_l / self.n)
+            max_age = detector.max_pattern_length
+            
+            for bar, price, ts in _confirm_stream_extrema(self.highs, self.timestamps, self.pending_peaks,
+                                                          self.n, self.distance, high_threshold, max_age):
+                self._add_swing(bar, price, True, ts)
+            for bar, price, ts in _confirm_stream_extrema(self.neg_lows, self.timestamps, self.pending_troughs,
+                                                          self.n, self.distance, low_threshold, max_age):
+                self._add_swing(bar, -price, False, ts)
+            
+            # Swings older than two pattern lengths can no longer start a pattern
+            stale = bisect.bisect_left(self.swing_idx, self.n - 2 * max_age)
+            if stale:
+                del self.swing_idx[:stale], self.swing_price[:stale]
+                del self.swing_is_peak[:stale], self.swing_timestamps[:stale]
+            
+            if self.n < detector.min_pattern_length or len(self.swing_idx) < 3:
+                return detector._create_empty_analysis()
+            
+            swing_points = self.swing_points()
+            complete_patterns = detector._detect_complete_patterns(swing_points)
+            return detector._assemble_analysis(swing_points, complete_patterns, float(bar_close), self.n)
+            
+        except Exception as e:
+            logger.error(f"Error updating ABCD stream: {e}")
+            return detector._create_empty_analysis()
+    
+    def swing_points(self) -> SwingArray:
+        """Current swing points as a SwingArray"""
+        return SwingArray(
+            idx=np.array(self.swing_idx, dtype=np.int64),
+            price=np.array(self.swing_price, dtype=np.float64),
+            is_peak=np.array(self.swing_is_peak, dtype=bool),
+            timestamps=pd.Index(self.swing_timestamps)
+        )
+    
+    def _add_swing(self, bar: int, price: float, is_peak: bool, ts: Any):
+        """Insert a confirmed swing, keeping swings in bar order"""
+        # Confirmation can lag by different amounts for peaks and troughs
+        n = bisect.bisect(self.swing_idx, bar)
+        self.swing_idx.insert(n, bar)
+        self.swing_price.insert(n, price)
+        self.swing_is_peak.insert(n, is_peak)
+        self.swing_timestamps.insert(n, ts)
@@ -4,90 +4,246 @@ Activate Real Data Screening - Live Ross Cameron Analysis
 """
 import sys
 import os
-import json
+import asyncio
+import time
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from yahoo_data import last_complete_bars, yahoo_session
+
 # Add the project root to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-def test_real_data_sources():
+# Yahoo requests are I/O bound, so symbols are fetched on a thread pool
+MAX_WORKERS = 8
+
+# Seconds a fetched price history is reused for reruns
+HISTORY_TTL = 60
+HISTORY_CACHE_SIZE = 256  # Histories kept, least recently used evicted first
+_history_cache = OrderedDict()
+_history_lock = threading.Lock()  # Histories are fetched from the thread pool
+
+@functools.lru_cache(maxsize=256)
+def _cached_info(symbol):
+    """Company info for a symbol, fetched once per session"""
+    import yfinance as yf
+    
+    return yf.Ticker(symbol, session=yahoo_session()).get_info()
+
+def _cached_history(symbol, period):
+    """Price history for a symbol, reused for HISTORY_TTL seconds"""
+    import yfinance as yf
+    
+    key = (symbol, period)
+    with _history_lock:
+        cached = _history_cache.get(key)
+        if cached is not None and time.time() - cached[0] < HISTORY_TTL:
+            _history_cache.move_to_end(key)
+            return cached[1]
+    
+    hist = yf.Ticker(symbol, session=yahoo_session()).history(period=period)
+    with _history_lock:
+        _history_cache[key] = (time.time(), hist)
+        _history_cache.move_to_end(key)
+        while len(_history_cache) > HISTORY_CACHE_SIZE:
+            _history_cache.popitem(last=False)
+    return hist
+
+def fetch_symbol_snapshot(symbol):
+    """Fetch latest price and volume stats for one symbol (None if no data)"""
+    _cached_info(symbol)  # Also warms the info cache for run_real_screening
+    hist = _cached_history(symbol, '5d')
+    
+    if len(hist) == 0:
+        return None
+    
+    current_price = hist['Close'].iloc[-1]
+    volume = hist['Volume'].iloc[-1]
+    avg_volume = hist['Volume'].mean()
+    relative_volume = volume / avg_volume if avg_volume > 0 else 0
+    
+    return {
+        'price': current_price,
+        'volume': volume,
+        'relative_volume': relative_volume
+    }
+
+# Finviz screener used to check that scraping works
+FINVIZ_SCREENER_URL = "https://finviz.com/screener.ashx?v=111&f=sh_price_u20,ta_change_u5,ta_relvol_o2"
+FINVIZ_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+def fetch_yahoo_snapshots(symbols):
+    """Fetch snapshots for all symbols on the thread pool, as (symbol, future) pairs"""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch_symbol_snapshot, symbol) for symbol in symbols]
+    
+    return list(zip(symbols, futures))
+
+async def fetch_finviz_page():
+    """Fetch the Finviz screener page, returning (status, content)"""
+    import aiohttp
+    
+    async with aiohttp.ClientSession() as session:
+        async with session.get(FINVIZ_SCREENER_URL, headers=FINVIZ_HEADERS,
+                               timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return response.status, await response.read()
+
+async def test_real_data_sources():
     """Test all real data sources"""
     print("🚀 ACTIVATING REAL DATA SCREENING")
     print("="*60)
     
+    # Test with some popular momentum stocks
+    test_symbols = ['GITS', 'NVAX', 'TSLA', 'AAPL']
+    
+    # Yahoo and Finviz are independent, so both are fetched at once
+    yahoo_result, finviz_result = await asyncio.gather(
+        asyncio.to_thread(fetch_yahoo_snapshots, test_symbols),
+        fetch_finviz_page(),
+        return_exceptions=True
+    )
+    
     # Test Yahoo Finance with real stocks
     print("\n📊 Testing Yahoo Finance with real stocks...")
-    try:
-        import yfinance as yf
-        
-        # Test with some popular momentum stocks
-        test_symbols = ['GITS', 'NVAX', 'TSLA', 'AAPL']
-        
-        for symbol in test_symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period='5d')
-                
-                if len(hist) > 0:
-                    current_price = hist['Close'].iloc[-1]
-                    volume = hist['Volume'].iloc[-1]
-                    avg_volume = hist['Volume'].mean()
-                    relative_volume = volume / avg_volume if avg_volume > 0 else 0
-                    
-                    print(f"✅ {symbol}: ${current_price:.2f}, Vol: {volume:,.0f} ({relative_volume:.1f}x avg)")
-                else:
-                    print(f"❌ {symbol}: No data available")
-                    
-            except Exception as e:
-                print(f"❌ {symbol}: Error - {str(e)[:50]}...")
-                
-    except Exception as e:
-        print(f"❌ Yahoo Finance setup failed: {e}")
+    if isinstance(yahoo_result, Exception):
+        print(f"❌ Yahoo Finance setup failed: {yahoo_result}")
         return False
     
+    # Report in symbol order once all fetches are done
+    for symbol, future in yahoo_result:
+        try:
+            snapshot = future.result()
+            
+            if snapshot:
+                print(f"✅ {symbol}: ${snapshot['price']:.2f}, Vol: {snapshot['volume']:,.0f} ({snapshot['relative_volume']:.1f}x avg)")
+            else:
+                print(f"❌ {symbol}: No data available")
+                
+        except Exception as e:
+            print(f"❌ {symbol}: Error - {str(e)[:50]}...")
+    
     print("\n🔍 Testing Finviz scraping...")
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        from lxml import html as lxml_html
         
-        # Test Finviz screener access
-        url = "https://finviz.com/screener.ashx?v=111&f=sh_price_u20,ta_change_u5,ta_relvol_o2"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        if isinstance(finviz_result, Exception):
+            raise finviz_result
         
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        status, content = finviz_result
+        if status == 200:
+            tree = lxml_html.fromstring(content)
             # Look for stock table
-            table = soup.find('table', {'class': 'screener_table'})
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header
+            tables = tree.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' screener_table ')]")
+            if tables:
+                rows = tables[0].xpath('.//tr')[1:]  # Skip header
                 print(f"✅ Found {len(rows)} stocks in Finviz screener")
                 
                 # Show first few stocks
                 for i, row in enumerate(rows[:3]):
-                    cells = row.find_all('td')
+                    cells = row.xpath('./td')
                     if len(cells) > 1:
-                        symbol = cells[1].text.strip()
+                        symbol = cells[1].text_content().strip()
                         print(f"   📈 {symbol}")
             else:
                 print("✅ Finviz accessible but no stock table found")
         else:
-            print(f"❌ Finviz returned status {response.status_code}")
+            print(f"❌ Finviz returned status {status}")
             
     except Exception as e:
         print(f"❌ Finviz test failed: {e}")
     
     return True
 
+def fetch_symbol_info(symbol):
+    """Fetch company info (float, sector, ...) for one symbol"""
+    return _cached_info(symbol)
+
+def score_candidates(hist_all, infos, criteria):
+    """Score all symbols against the Ross Cameron criteria in one vectorized pass"""
+    import numpy as np
+    import pandas as pd
+    
+    symbols = list(infos)
+    close = hist_all.xs('Close', level=1, axis=1)[symbols]
+    volume = hist_all.xs('Volume', level=1, axis=1)[symbols]
+    
+    # Each symbol only uses its own complete bars, so one missing from the
+    # latest download date is scored on its last two bars rather than dropped
+    complete = ~hist_all.isna().T.groupby(level=0).any().T[symbols].to_numpy()
+    n_bars = complete.sum(axis=0)
+    cols = np.arange(len(symbols))
+    last, prev, prior = last_complete_bars(complete)
+    
+    # Get current data; reductions run on the raw arrays rather than through pandas
+    c = close.to_numpy(dtype=np.float64)
+    v = volume.to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_volume = np.where(prior, v, 0.0).sum(axis=0) / prior.sum(axis=0)
+    
+    current_price = pd.Series(c[last, cols], index=symbols)
+    prev_close = pd.Series(c[prev, cols], index=symbols)
+    current_volume = v[last, cols]
+    
+    # Calculate metrics
+    gap_percent = ((current_price - prev_close) / prev_close) * 100
+    relative_volume = pd.Series(np.nan_to_num(np.divide(current_volume, avg_volume, out=np.zeros_like(avg_volume),
+                                                        where=avg_volume > 0)), index=symbols)
+    
+    # Get float (if available)
+    float_shares = pd.Series({symbol: info.get('floatShares', info.get('sharesOutstanding', 0))
+                              for symbol, info in infos.items()}, dtype=float).fillna(0).astype(np.int64)
+    sector = pd.Series({symbol: info.get('sector', 'Unknown') for symbol, info in infos.items()})
+    
+    # Ross Cameron scoring
+    price_ok = current_price.between(criteria['min_price'], criteria['max_price'])
+    volume_ok = relative_volume >= criteria['min_relative_volume']
+    float_ok = (float_shares > 0) & (float_shares <= criteria['max_float'])
+    float_unknown = float_shares == 0
+    gap_ok = gap_percent.abs() >= criteria['min_gap_percent']
+    sector_ok = sector.isin(['Healthcare', 'Technology', 'Communication Services'])
+    
+    score = (20 * price_ok.astype(int) + 20 * volume_ok.astype(int) + 20 * float_ok.astype(int)
+             + 10 * float_unknown.astype(int)  # Partial credit if unknown
+             + 20 * gap_ok.astype(int) + 10 * sector_ok.astype(int))
+    
+    df = pd.DataFrame({
+        'symbol': symbols,
+        'price': current_price,
+        'gap_percent': gap_percent,
+        'relative_volume': relative_volume,
+        'float_shares': float_shares,
+        'sector': sector,
+        'ross_score': score
+    }, index=symbols)
+    
+    # Need at least two bars of history
+    df = df[n_bars >= 2]
+    
+    df['reasons'] = [
+        [f"✅ Price ${row.price:.2f} in range" if price_ok[row.symbol] else f"❌ Price ${row.price:.2f} out of range",
+         f"✅ Volume {row.relative_volume:.1f}x average" if volume_ok[row.symbol] else f"❌ Volume {row.relative_volume:.1f}x below 2x",
+         f"✅ Float {row.float_shares:,} shares" if float_ok[row.symbol]
+         else f"⚠️ Float unknown" if float_unknown[row.symbol] else f"❌ Float {row.float_shares:,} too high",
+         f"✅ Gap {row.gap_percent:+.1f}%" if gap_ok[row.symbol] else f"❌ Gap {row.gap_percent:+.1f}% too small"]
+        + ([f"✅ Preferred sector: {row.sector}"] if sector_ok[row.symbol] else [])
+        for row in df.itertuples()
+    ]
+    df['timestamp'] = datetime.now().isoformat()
+    
+    return df
+
 def run_real_screening():
     """Run actual screening with real data"""
     print("\n🎯 RUNNING REAL ROSS CAMERON SCREENING")
     print("="*60)
     
     try:
+        import orjson
         import yfinance as yf
         from datetime import datetime, timedelta
         
@@ -112,129 +268,64 @@ def run_real_screening():
             'SPRT', 'BBIG', 'PROG', 'ATER', 'RDBX'
         ]
         
-        candidates = []
-        
         print(f"\n🔍 Analyzing {len(test_symbols)} stocks...")
         
-        for symbol in test_symbols:
+        # One batched request for all price history; info still needs a call per symbol
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(fetch_symbol_info, symbol) for symbol in test_symbols]
+            hist_all = yf.download(" ".join(test_symbols), period='10d', group_by='ticker',
+                                   threads=True, progress=False, session=yahoo_session())
+        
+        infos = {}
+        for symbol, future in zip(test_symbols, futures):
             try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period='10d')
-                
-                if len(hist) < 2:
-                    continue
-                
-                # Get current data
-                current_price = hist['Close'].iloc[-1]
-                prev_close = hist['Close'].iloc[-2]
-                current_volume = hist['Volume'].iloc[-1]
-                avg_volume = hist['Volume'][:-1].mean()  # Exclude today
-                
-                # Calculate metrics
-                gap_percent = ((current_price - prev_close) / prev_close) * 100
-                relative_volume = current_volume / avg_volume if avg_volume > 0 else 0
-                
-                # Get float (if available)
-                float_shares = info.get('floatShares', info.get('sharesOutstanding', 0))
-                market_cap = info.get('marketCap', 0)
-                sector = info.get('sector', 'Unknown')
-                
-                # Ross Cameron scoring
-                score = 0
-                reasons = []
-                
-                # Price range check
-                if criteria['min_price'] <= current_price <= criteria['max_price']:
-                    score += 20
-                    reasons.append(f"✅ Price ${current_price:.2f} in range")
-                else:
-                    reasons.append(f"❌ Price ${current_price:.2f} out of range")
-                
-                # Volume check
-                if relative_volume >= criteria['min_relative_volume']:
-                    score += 20
-                    reasons.append(f"✅ Volume {relative_volume:.1f}x average")
-                else:
-                    reasons.append(f"❌ Volume {relative_volume:.1f}x below 2x")
-                
-                # Float check
-                if float_shares > 0 and float_shares <= criteria['max_float']:
-                    score += 20
-                    reasons.append(f"✅ Float {float_shares:,} shares")
-                elif float_shares == 0:
-                    score += 10  # Partial credit if unknown
-                    reasons.append(f"⚠️ Float unknown")
-                else:
-                    reasons.append(f"❌ Float {float_shares:,} too high")
-                
-                # Gap check
-                if abs(gap_percent) >= criteria['min_gap_percent']:
-                    score += 20
-                    reasons.append(f"✅ Gap {gap_percent:+.1f}%")
-                else:
-                    reasons.append(f"❌ Gap {gap_percent:+.1f}% too small")
-                
-                # Sector bonus (biotech, tech, etc.)
-                if sector in ['Healthcare', 'Technology', 'Communication Services']:
-                    score += 10
-                    reasons.append(f"✅ Preferred sector: {sector}")
-                
-                # Store candidate
-                candidate = {
-                    'symbol': symbol,
-                    'price': current_price,
-                    'gap_percent': gap_percent,
-                    'relative_volume': relative_volume,
-                    'float_shares': float_shares,
-                    'sector': sector,
-                    'ross_score': score,
-                    'reasons': reasons,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                candidates.append(candidate)
-                
-                # Print summary
-                grade = 'A+' if score >= 90 else 'A' if score >= 80 else 'B' if score >= 70 else 'C' if score >= 60 else 'D' if score >= 50 else 'F'
-                print(f"   📊 {symbol}: {score}/100 ({grade}) - ${current_price:.2f} ({gap_percent:+.1f}%) {relative_volume:.1f}x vol")
-                
+                infos[symbol] = future.result()
             except Exception as e:
                 print(f"   ❌ {symbol}: Error - {str(e)[:50]}...")
         
+        scored = score_candidates(hist_all, infos, criteria)
+        
+        for row in scored.itertuples():
+            # Print summary
+            score = row.ross_score
+            grade = 'A+' if score >= 90 else 'A' if score >= 80 else 'B' if score >= 70 else 'C' if score >= 60 else 'D' if score >= 50 else 'F'
+            print(f"   📊 {row.symbol}: {score}/100 ({grade}) - ${row.price:.2f} ({row.gap_percent:+.1f}%) {row.relative_volume:.1f}x vol")
+        
         # Sort by Ross Cameron score
-        candidates.sort(key=lambda x: x['ross_score'], reverse=True)
+        ranked = scored.sort_values('ross_score', ascending=False, kind='stable', ignore_index=True)
         
         print(f"\n🏆 TOP ROSS CAMERON CANDIDATES")
         print("="*60)
         
-        for i, candidate in enumerate(candidates[:5], 1):
-            score = candidate['ross_score']
+        for i, candidate in enumerate(ranked.head(5).itertuples(), 1):
+            score = candidate.ross_score
             grade = 'A+' if score >= 90 else 'A' if score >= 80 else 'B' if score >= 70 else 'C' if score >= 60 else 'D' if score >= 50 else 'F'
             
-            print(f"{i}. {candidate['symbol']} - {score}/100 ({grade})")
-            print(f"   💰 Price: ${candidate['price']:.2f} ({candidate['gap_percent']:+.1f}%)")
-            print(f"   📊 Volume: {candidate['relative_volume']:.1f}x average")
-            print(f"   🏢 Float: {candidate['float_shares']:,} shares")
-            print(f"   🏭 Sector: {candidate['sector']}")
+            print(f"{i}. {candidate.symbol} - {score}/100 ({grade})")
+            print(f"   💰 Price: ${candidate.price:.2f} ({candidate.gap_percent:+.1f}%)")
+            print(f"   📊 Volume: {candidate.relative_volume:.1f}x average")
+            print(f"   🏢 Float: {candidate.float_shares:,} shares")
+            print(f"   🏭 Sector: {candidate.sector}")
             
             # Show top reasons
-            for reason in candidate['reasons'][:3]:
+            for reason in candidate.reasons[:3]:
                 print(f"   {reason}")
             print()
         
+        candidates = ranked.to_dict('records')
+        
         # Save results
         results_file = '/home/ubuntu/momentum_trader/live_screening_results.json'
-        with open(results_file, 'w') as f:
-            json.dump({
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps({
                 'timestamp': datetime.now().isoformat(),
                 'criteria': criteria,
                 'total_analyzed': len(test_symbols),
                 'candidates': candidates
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
         print(f"💾 Results saved to: {results_file}")
-        print(f"🎯 Found {len([c for c in candidates if c['ross_score'] >= 70])} strong candidates (B+ or better)")
+        print(f"🎯 Found {(ranked['ross_score'] >= 70).sum()} strong candidates (B+ or better)")
         
         return candidates
         
@@ -248,7 +339,7 @@ if __name__ == "__main__":
     print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Test data sources
-    if test_real_data_sources():
+    if asyncio.run(test_real_data_sources()):
         print("\n✅ All data sources working!")
         
         # Run real screening
@@ -2,14 +2,26 @@
 Alpha Vantage data client for additional market data
 Free tier: 500 requests per day, 5 requests per minute
 """
-import requests
-import pandas as pd
+from __future__ import annotations
+
+import asyncio
+import diskcache
 import json
+import orjson
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, date, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import os
 
+# pandas/numpy and httpx are imported where they are used, so importing the
+# client (e.g. for overview or search only) doesn't pay their startup cost
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+
 from ..core.logger import get_logger
 from ..core.exceptions import DataFetchError, APIError
 
@@ -18,49 +30,225 @@ logger = get_logger(__name__)
 class AlphaVantageClient:
     """Client for fetching data from Alpha Vantage API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # OVERVIEW response keys coerced to float, mapped to our field names
+    _NUMERIC_FIELDS = {
+        'MarketCapitalization': 'market_cap',
+        'SharesOutstanding': 'shares_outstanding',
+        'PERatio': 'pe_ratio',
+        'PEGRatio': 'peg_ratio',
+        'BookValue': 'book_value',
+        'DividendPerShare': 'dividend_per_share',
+        'DividendYield': 'dividend_yield',
+        'EPS': 'eps',
+        'RevenuePerShareTTM': 'revenue_per_share',
+        'ProfitMargin': 'profit_margin',
+        'OperatingMarginTTM': 'operating_margin',
+        'ReturnOnAssetsTTM': 'return_on_assets',
+        'ReturnOnEquityTTM': 'return_on_equity',
+        'RevenueTTM': 'revenue_ttm',
+        'GrossProfitTTM': 'gross_profit_ttm',
+        'EBITDA': 'ebitda',
+        'Beta': 'beta',
+        '52WeekHigh': '52_week_high',
+        '52WeekLow': '52_week_low',
+        '50DayMovingAverage': '50_day_ma',
+        '200DayMovingAverage': '200_day_ma',
+        'AnalystTargetPrice': 'analyst_target_price'
+    }
+    
+    # Compressed responses shrink the 100-500KB time series payloads on the wire
+    _HTTP_HEADERS = {'User-Agent': 'momentum-trader-api', 'Accept-Encoding': 'gzip, deflate, br'}
+    
+    # Responses retried with backoff before giving up
+    _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    _MAX_RETRIES = 3
+    
+    # Record layout for parsed time series bars
+    _OHLCV_DTYPE = [('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('volume', 'i8')]
+    
+    # Seconds a cached response stays fresh, per API function (uncached if missing)
+    _CACHE_TTL = {
+        'TIME_SERIES_INTRADAY': 60,
+        'TIME_SERIES_DAILY': 3600,
+        'OVERVIEW': 3600,
+        'TOP_GAINERS_LOSERS': 3600
+    }
+    
+    # Responses kept in memory in front of the disk cache, least recently used evicted first
+    _MEMORY_CACHE_SIZE = 256
+    
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None,
+                 rate_limit: int = 5, rate_window: float = 60):
         self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
         self.base_url = "https://www.alphavantage.co/query"
-        self.last_request_time = 0
-        self.min_request_interval = 12  # 5 requests per minute = 12 seconds between requests
+        
+        # Sliding-window rate limit: at most rate_limit requests per rate_window seconds
+        # (free tier: 5 per minute). Premium keys can raise the limit. Sync and
+        # async requests share the window, so mixing them stays within the quota.
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self._request_times = deque(maxlen=rate_limit)
+        self._rate_lock = threading.Lock()
+        
+        # Persistent HTTP/2 client, created on first request, so repeated calls
+        # share one pooled connection
+        self._client: Optional[httpx.Client] = None
+        
+        # Async client is created lazily inside the running event loop; requests
+        # within the rate limit run concurrently
+        self._aclient: Optional[httpx.AsyncClient] = None
+        
+        # Responses are cached in memory and on disk so repeated calls don't burn quota
+        self._memory_cache: OrderedDict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._disk_cache = diskcache.Cache(cache_dir or os.getenv('ALPHA_VANTAGE_CACHE_DIR', '/tmp/av_cache'))
         
         if not self.api_key:
             logger.warning("Alpha Vantage API key not provided. Some features will be limited.")
         else:
             logger.info("Alpha Vantage client initialized")
     
-    def _make_request(self, params: Dict[str, str]) -> Dict[str, Any]:
+    def _make_request(self, params: Dict[str, str], use_cache: bool = True) -> Dict[str, Any]:
         """
         Make a rate-limited request to Alpha Vantage API
         
         Args:
             params: Request parameters
+            use_cache: Serve and store the response through the response cache
             
         Returns:
             JSON response data
         """
+        import httpx
+        
         if not self.api_key:
             raise APIError("Alpha Vantage API key not configured")
         
-        # Rate limiting
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        cache_key = self._cache_key(params)
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if self._client is None:
+            self._client = httpx.Client(timeout=30, headers=self._HTTP_HEADERS,
+                                        transport=httpx.HTTPTransport(http2=True, retries=self._MAX_RETRIES))
+        
+        # Add API key to parameters
+        params['apikey'] = self.api_key
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
+        try:
+            # Every attempt, retries included, counts against the rate limit
+            for attempt in range(self._MAX_RETRIES + 1):
+                self._wait_for_rate_limit()
+                response = self._client.get(self.base_url, params=params)
+                if response.status_code not in self._RETRY_STATUSES or attempt == self._MAX_RETRIES:
+                    break
+                time.sleep(self._retry_delay(response, attempt))
+            response.raise_for_status()
+            
+            logger.debug(f"{params.get('function')}: {response.num_bytes_downloaded} bytes over {response.http_version}")
+            
+            data = orjson.loads(response.content)
+            
+            # Check for API errors
+            if 'Error Message' in data:
+                raise APIError(f"Alpha Vantage API error: {data['Error Message']}")
+            
+            if 'Note' in data:
+                raise APIError(f"Alpha Vantage rate limit: {data['Note']}")
+            
+            if use_cache:
+                self._cache_set(cache_key, data)
+            
+            return data
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Request error: {e}")
+            raise APIError(f"Failed to fetch data from Alpha Vantage: {e}")
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
+            logger.error(f"JSON decode error: {e}")
+            raise APIError(f"Invalid response from Alpha Vantage: {e}")
+    
+    def _reserve_request(self) -> float:
+        """
+        Claim a slot in the sliding rate-limit window for a request sent now
+        
+        Returns:
+            0 if the slot was claimed, else seconds until the oldest request in
+            the full window ages out
+        """
+        with self._rate_lock:
+            now = time.time()
+            if len(self._request_times) == self.rate_limit:
+                wait = self.rate_window - (now - self._request_times[0])
+                if wait > 0:
+                    return wait
+            self._request_times.append(now)
+            return 0.0
+    
+    def _wait_for_rate_limit(self):
+        """Sleep until another request fits in the sliding rate-limit window, and claim it"""
+        sleep_time = self._reserve_request()
+        while sleep_time > 0:
             logger.info(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
             time.sleep(sleep_time)
+            sleep_time = self._reserve_request()
+    
+    async def _wait_for_rate_limit_async(self):
+        """_wait_for_rate_limit without blocking the event loop"""
+        sleep_time = self._reserve_request()
+        while sleep_time > 0:
+            logger.info(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
+            await asyncio.sleep(sleep_time)
+            sleep_time = self._reserve_request()
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: the server's Retry-After if given, else exponential backoff"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+        return 0.3 * 2 ** attempt
+    
+    async def _make_request_async(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Make a rate-limited request to Alpha Vantage API without blocking the event loop
+        
+        Args:
+            params: Request parameters
+            
+        Returns:
+            JSON response data
+        """
+        import httpx
+        
+        if not self.api_key:
+            raise APIError("Alpha Vantage API key not configured")
+        
+        cache_key = self._cache_key(params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(timeout=30, http2=True, headers=self._HTTP_HEADERS)
         
         # Add API key to parameters
         params['apikey'] = self.api_key
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            await self._wait_for_rate_limit_async()
+            response = await self._aclient.get(self.base_url, params=params)
             response.raise_for_status()
             
-            self.last_request_time = time.time()
-            
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Check for API errors
             if 'Error Message' in data:
@@ -69,15 +257,109 @@ class AlphaVantageClient:
             if 'Note' in data:
                 raise APIError(f"Alpha Vantage rate limit: {data['Note']}")
             
+            self._cache_set(cache_key, data)
+            
             return data
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error: {e}")
             raise APIError(f"Failed to fetch data from Alpha Vantage: {e}")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
             logger.error(f"JSON decode error: {e}")
             raise APIError(f"Invalid response from Alpha Vantage: {e}")
     
+    def _cache_key(self, params: Dict[str, str]) -> Tuple[str, ...]:
+        """Cache key for a request: (function, symbol, interval, outputsize, date)"""
+        return (
+            params.get('function', ''),
+            params.get('symbol', '').upper(),
+            params.get('interval', ''),
+            params.get('outputsize', ''),
+            date.today().isoformat()
+        )
+    
+    def _cache_get(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Look up a fresh cached response, memory first, then disk"""
+        if key[0] not in self._CACHE_TTL:
+            return None
+        
+        entry = self._memory_cache.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.time():
+                self._memory_cache.move_to_end(key)
+                return data
+            del self._memory_cache[key]
+        
+        try:
+            entry = self._disk_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Error reading Alpha Vantage cache: {e}")
+            return None
+        
+        if entry is None:
+            return None
+        
+        # Promote disk hits to memory for the rest of their lifetime
+        self._memory_cache_put(key, entry)
+        logger.debug(f"Cache hit for {key[0]} {key[1]}")
+        return entry[1]
+    
+    def _cache_set(self, key: Tuple[str, ...], data: Dict[str, Any]):
+        """Store a response in both cache levels"""
+        ttl = self._CACHE_TTL.get(key[0])
+        if ttl is None:
+            return
+        
+        entry = (time.time() + ttl, data)
+        self._memory_cache_put(key, entry)
+        
+        try:
+            self._disk_cache.set(key, entry, expire=ttl)
+        except Exception as e:
+            logger.warning(f"Error writing Alpha Vantage cache: {e}")
+    
+    def _memory_cache_put(self, key: Tuple[str, ...], entry: Tuple[float, Dict[str, Any]]):
+        """Store an entry in the memory cache, evicting the least recently used past its size"""
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self._MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def bust_cache(self, symbol: Optional[str] = None):
+        """
+        Drop cached responses
+        
+        Args:
+            symbol: Only drop responses for this symbol (all responses if None)
+        """
+        symbol = symbol.upper() if symbol else None
+        
+        for key in list(self._memory_cache):
+            if symbol is None or key[1] == symbol:
+                del self._memory_cache[key]
+        
+        if symbol is None:
+            self._disk_cache.clear()
+        else:
+            for key in list(self._disk_cache.iterkeys()):
+                if key[1] == symbol:
+                    self._disk_cache.delete(key)
+        
+        logger.info(f"Cleared Alpha Vantage cache for {symbol or 'all symbols'}")
+    
+    def close(self):
+        """Close the HTTP client"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+    
     def get_intraday_data(self, symbol: str, interval: str = "5min") -> pd.DataFrame:
         """
         Get intraday stock data
@@ -107,21 +389,7 @@ class AlphaVantageClient:
             time_series = data[time_series_key]
             
             # Convert to DataFrame
-            df_data = []
-            for timestamp, values in time_series.items():
-                row = {
-                    'datetime': pd.to_datetime(timestamp),
-                    'open': float(values['1. open']),
-                    'high': float(values['2. high']),
-                    'low': float(values['3. low']),
-                    'close': float(values['4. close']),
-                    'volume': int(values['5. volume']),
-                    'symbol': symbol.upper()
-                }
-                df_data.append(row)
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('datetime').reset_index(drop=True)
+            df = self._time_series_frame(symbol, time_series, 'datetime')
             
             logger.info(f"Retrieved {len(df)} intraday records for {symbol}")
             return df
@@ -149,29 +417,35 @@ class AlphaVantageClient:
             }
             
             data = self._make_request(params)
+            df = self._parse_daily_data(symbol, data)
             
-            # Extract time series data
-            if 'Time Series (Daily)' not in data:
-                raise DataFetchError(f"No daily data found for {symbol}")
+            logger.info(f"Retrieved {len(df)} daily records for {symbol}")
+            return df
             
-            time_series = data['Time Series (Daily)']
+        except Exception as e:
+            logger.error(f"Error fetching daily data for {symbol}: {e}")
+            raise DataFetchError(f"Failed to fetch daily data for {symbol}: {e}")
+    
+    async def get_daily_data_async(self, symbol: str, outputsize: str = "compact") -> pd.DataFrame:
+        """
+        Get daily stock data without blocking the event loop
+        
+        Args:
+            symbol: Stock ticker symbol
+            outputsize: 'compact' (last 100 days) or 'full' (20+ years)
             
-            # Convert to DataFrame
-            df_data = []
-            for date, values in time_series.items():
-                row = {
-                    'date': pd.to_datetime(date),
-                    'open': float(values['1. open']),
-                    'high': float(values['2. high']),
-                    'low': float(values['3. low']),
-                    'close': float(values['4. close']),
-                    'volume': int(values['5. volume']),
-                    'symbol': symbol.upper()
-                }
-                df_data.append(row)
+        Returns:
+            DataFrame with daily OHLCV data
+        """
+        try:
+            params = {
+                'function': 'TIME_SERIES_DAILY',
+                'symbol': symbol.upper(),
+                'outputsize': outputsize
+            }
             
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('date').reset_index(drop=True)
+            data = await self._make_request_async(params)
+            df = self._parse_daily_data(symbol, data)
             
             logger.info(f"Retrieved {len(df)} daily records for {symbol}")
             return df
@@ -180,6 +454,69 @@ class AlphaVantageClient:
             logger.error(f"Error fetching daily data for {symbol}: {e}")
             raise DataFetchError(f"Failed to fetch daily data for {symbol}: {e}")
     
+    async def get_daily_data_batch(self, symbols: List[str], outputsize: str = "compact") -> Dict[str, pd.DataFrame]:
+        """
+        Get daily stock data for several symbols concurrently
+        
+        Args:
+            symbols: Stock ticker symbols
+            outputsize: 'compact' (last 100 days) or 'full' (20+ years)
+            
+        Returns:
+            Dictionary of symbol to daily OHLCV DataFrame; failed symbols are omitted
+        """
+        results = await asyncio.gather(
+            *[self.get_daily_data_async(symbol, outputsize) for symbol in symbols],
+            return_exceptions=True
+        )
+        
+        return {symbol: df for symbol, df in zip(symbols, results) if not isinstance(df, Exception)}
+    
+    def get_daily_data_many(self, symbols: List[str], outputsize: str = "compact") -> Dict[str, pd.DataFrame]:
+        """Synchronous wrapper around get_daily_data_batch"""
+        async def run():
+            try:
+                return await self.get_daily_data_batch(symbols, outputsize)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    def _parse_daily_data(self, symbol: str, data: Dict[str, Any]) -> pd.DataFrame:
+        """Convert a TIME_SERIES_DAILY response to a DataFrame"""
+        # Extract time series data
+        if 'Time Series (Daily)' not in data:
+            raise DataFetchError(f"No daily data found for {symbol}")
+        
+        time_series = data['Time Series (Daily)']
+        
+        # Convert to DataFrame
+        return self._time_series_frame(symbol, time_series, 'date')
+    
+    def _time_series_frame(self, symbol: str, time_series: Dict[str, Dict[str, str]],
+                           time_column: str) -> pd.DataFrame:
+        """Build an OHLCV DataFrame from an Alpha Vantage time series, one column at a time"""
+        import numpy as np
+        import pandas as pd
+        
+        # NumPy casts the numeric strings in C while filling the structured array
+        rows = np.array(
+            [(v['1. open'], v['2. high'], v['3. low'], v['4. close'], v['5. volume']) for v in time_series.values()],
+            dtype=self._OHLCV_DTYPE
+        )
+        
+        df = pd.DataFrame({
+            time_column: pd.to_datetime(list(time_series.keys())),
+            'open': rows['open'],
+            'high': rows['high'],
+            'low': rows['low'],
+            'close': rows['close'],
+            'volume': rows['volume'],
+            'symbol': symbol.upper()
+        })
+        
+        return df.sort_values(time_column, kind='mergesort', ignore_index=True)
+    
     def get_company_overview(self, symbol: str) -> Dict[str, Any]:
         """
         Get company overview and fundamental data
@@ -201,6 +538,14 @@ class AlphaVantageClient:
             if not data or 'Symbol' not in data:
                 raise DataFetchError(f"No overview data found for {symbol}")
             
+            import pandas as pd
+            
+            # Coerce all numeric fields in one pass; missing or invalid values become 0
+            numeric_values = pd.to_numeric(
+                pd.Series([data.get(key, 0) for key in self._NUMERIC_FIELDS], dtype=object),
+                errors='coerce'
+            ).fillna(0.0).astype(float).tolist()
+            
             # Extract relevant information for our strategy
             overview = {
                 'symbol': data.get('Symbol', ''),
@@ -211,28 +556,7 @@ class AlphaVantageClient:
                 'country': data.get('Country', ''),
                 'sector': data.get('Sector', ''),
                 'industry': data.get('Industry', ''),
-                'market_cap': self._safe_float(data.get('MarketCapitalization', 0)),
-                'shares_outstanding': self._safe_float(data.get('SharesOutstanding', 0)),
-                'pe_ratio': self._safe_float(data.get('PERatio', 0)),
-                'peg_ratio': self._safe_float(data.get('PEGRatio', 0)),
-                'book_value': self._safe_float(data.get('BookValue', 0)),
-                'dividend_per_share': self._safe_float(data.get('DividendPerShare', 0)),
-                'dividend_yield': self._safe_float(data.get('DividendYield', 0)),
-                'eps': self._safe_float(data.get('EPS', 0)),
-                'revenue_per_share': self._safe_float(data.get('RevenuePerShareTTM', 0)),
-                'profit_margin': self._safe_float(data.get('ProfitMargin', 0)),
-                'operating_margin': self._safe_float(data.get('OperatingMarginTTM', 0)),
-                'return_on_assets': self._safe_float(data.get('ReturnOnAssetsTTM', 0)),
-                'return_on_equity': self._safe_float(data.get('ReturnOnEquityTTM', 0)),
-                'revenue_ttm': self._safe_float(data.get('RevenueTTM', 0)),
-                'gross_profit_ttm': self._safe_float(data.get('GrossProfitTTM', 0)),
-                'ebitda': self._safe_float(data.get('EBITDA', 0)),
-                'beta': self._safe_float(data.get('Beta', 0)),
-                '52_week_high': self._safe_float(data.get('52WeekHigh', 0)),
-                '52_week_low': self._safe_float(data.get('52WeekLow', 0)),
-                '50_day_ma': self._safe_float(data.get('50DayMovingAverage', 0)),
-                '200_day_ma': self._safe_float(data.get('200DayMovingAverage', 0)),
-                'analyst_target_price': self._safe_float(data.get('AnalystTargetPrice', 0)),
+                **dict(zip(self._NUMERIC_FIELDS.values(), numeric_values)),
                 'timestamp': datetime.now()
             }
             
@@ -363,7 +687,8 @@ class AlphaVantageClient:
                 'outputsize': 'compact'
             }
             
-            data = self._make_request(params)
+            # Bypass the cache so the status reflects a live call
+            data = self._make_request(params, use_cache=False)
             
             if 'Error Message' in data:
                 return {'status': 'error', 'message': data['Error Message']}
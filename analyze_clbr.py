@@ -4,380 +4,617 @@ Analyze CLBR using Ross Cameron methodology
 """
 import sys
 import os
+import asyncio
 import json
+import time
+import bisect
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-def analyze_clbr():
-    """Analyze CLBR using Ross Cameron criteria"""
-    symbol = "CLBR"
-    print(f"🔍 ANALYZING {symbol} - ROSS CAMERON METHODOLOGY")
-    print("="*60)
+import numpy as np
+from numba import njit
+
+from yahoo_data import last_complete_bars, yahoo_session
+
+MAX_WORKERS = 16  # Analyses are I/O-bound on Yahoo, so threads scale well
+
+# Every analysis is appended here as one JSON line; load the log with
+# pd.read_json(RESULTS_FILE, lines=True)
+RESULTS_FILE = '/home/ubuntu/momentum_trader/ross_cameron_analysis.jsonl'
+_results_lock = threading.Lock()
+
+# Local cache for Yahoo responses, so repeated analyses skip the network
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+INFO_TTL = 24 * 60 * 60  # Company info barely changes within a day
+HISTORY_REFRESH = 60  # Seconds before cached history is topped up again
+RESULT_TTL = 60  # Seconds an analysis is reused before it is recomputed
+
+# Company info read by the analysis as (key, fallback key, default), in the
+# order analyze() unpacks them. Only these fields are kept from Yahoo's 100+
+# field quote summary.
+INFO_KEYS = (
+    ('longName', 'shortName', 'Unknown'),
+    ('floatShares', 'sharesOutstanding', 0),
+    ('marketCap', None, 0),
+    ('enterpriseValue', None, 0),
+    ('sector', None, 'Unknown'),
+    ('industry', None, 'Unknown'),
+    ('exchange', None, 'Unknown'),
+)
+INFO_FIELDS = tuple(field for key, fallback, _ in INFO_KEYS for field in (key, fallback) if field)
+
+# Yahoo JSON endpoints used by prefetch()
+YAHOO_CHART_URL = 'https://query2.finance.yahoo.com/v8/finance/chart/{symbol}'
+YAHOO_QUOTE_SUMMARY_URL = 'https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}'
+YAHOO_COOKIE_URL = 'https://fc.yahoo.com'
+YAHOO_CRUMB_URL = 'https://query2.finance.yahoo.com/v1/test/getcrumb'
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+QUOTE_SUMMARY_MODULES = 'price,defaultKeyStatistics,assetProfile'
+
+# Pillar scoring tables: _score_pillars bisects each value into *_THRESH and
+# the tier it lands in indexes the parallel tuples. Volume and gap tiers start
+# at the threshold (>=).
+VOL_THRESH = np.array([1.5, 2.0, 3.0, 5.0, 10.0])
+VOL_SCORE = (0, 10, 14, 16, 18, 20)
+VOL_GRADE = ("F", "C", "B", "B+", "A", "A+")
+VOL_COMMENT = ("Poor volume", "Below average volume", "Adequate volume",
+               "Good volume increase", "Strong volume breakout", "EXCEPTIONAL volume breakout!")
+
+GAP_THRESH = np.array([2.0, 4.0, 10.0, 20.0, 30.0])
+GAP_SCORE = (0, 10, 14, 16, 18, 20)
+GAP_GRADE = ("F", "C", "B", "B+", "A", "A+")
+GAP_COMMENT = ("Minimal price movement", "Small price movement", "Adequate price movement",
+               "Good price movement", "Strong price movement", "MASSIVE price movement!")
+
+# Float tiers end at the threshold (<=), so these are bisected from the left
+FLOAT_THRESH = np.array([5e6, 10e6, 20e6, 50e6, 100e6])
+FLOAT_SCORE = (20, 18, 16, 14, 10, 0)
+FLOAT_GRADE = ("A+", "A", "B+", "B", "C", "F")
+FLOAT_STATUS = ("✅", "✅", "✅", "✅", "❌", "❌")
+FLOAT_COMMENT = ("PERFECT small float!", "Excellent small float", "Good float size",
+                 "Acceptable float", "High float - harder to move", "Massive float - avoid")
+
+# Price bands are nested around $2-$20 and include both ends; upper edges are
+# nudged up one ulp so a right-side search keeps them inclusive
+PRICE_THRESH = np.array([0.5, 1.0, 2.0, *np.nextafter([20.0, 30.0, 50.0, 100.0], np.inf)])
+PRICE_SCORE = (8, 12, 16, 20, 16, 12, 8, 0)
+PRICE_GRADE = ("C", "B", "B+", "A+", "B+", "B", "C", "F")
+PRICE_STATUS = ("❌", "✅", "✅", "✅", "✅", "✅", "❌", "❌")
+PRICE_COMMENT = ("High price - limited retail appeal", "Acceptable price range", "Good price range",
+                 "PERFECT Ross Cameron price range!", "Good price range", "Acceptable price range",
+                 "High price - limited retail appeal", "Too expensive for momentum trading")
+
+# Overall grade from the total score, same layout as the pillar tables
+OVERALL_THRESH = (50, 60, 70, 80, 90)
+OVERALL_GRADE = ("F", "D", "C", "B", "A", "A+")
+OVERALL_RECOMMENDATION = ("SELL", "AVOID", "HOLD", "BUY", "BUY", "STRONG BUY")
+OVERALL_COLOR = ("🔴", "🔴", "🟡", "🟡", "🟢", "🟢")
+OVERALL_COMMENT = ("Terrible setup - stay away", "Poor setup - avoid", "Mixed signals - proceed with caution",
+                   "Good momentum candidate", "Strong Ross Cameron candidate", "EXCEPTIONAL Ross Cameron setup!")
+
+# Trading setup, only suggested from TRADE_SETUP_MIN_SCORE up
+TRADE_SETUP_MIN_SCORE = 70
+ACCOUNT_VALUE = 100000  # $100K demo account
+ACCOUNT_RISK = 0.02  # Risk 2% of the account per trade
+TIME_HORIZON_THRESH = (75, 85)
+TIME_HORIZONS = ("Position Trade (1-2 weeks)", "Swing Trade (1-5 days)", "Day Trade (30min - 4hrs)")
+
+# Risk assessment flags, one bit per finding. Bits are numbered in report
+# order and *_MESSAGES holds the text for each bit.
+RISK_LOW_VOLUME = 1 << 0
+RISK_SMALL_GAP = 1 << 1
+RISK_HIGH_FLOAT = 1 << 2
+RISK_HIGH_PRICE = 1 << 3
+RISK_NEAR_HIGHS = 1 << 4
+RISK_NEAR_LOWS = 1 << 5
+RISK_HIGH_VOLATILITY = 1 << 6
+RISK_LOW_VOLATILITY = 1 << 7
+RISK_MESSAGES = (
+    "🔴 Low volume - may lack momentum",
+    "🔴 Small gap - limited catalyst",
+    "🔴 High float - harder to move",
+    "🔴 High price - limited retail interest",
+    "🔴 Near highs - potential resistance",
+    "🔴 Near lows - potential support test",
+    "🔴 High volatility - increased risk",
+    "🔴 Low volatility - may lack momentum",
+)
+
+STRENGTH_VOLUME = 1 << 0
+STRENGTH_GAP = 1 << 1
+STRENGTH_SMALL_FLOAT = 1 << 2
+STRENGTH_PRICE_RANGE = 1 << 3
+STRENGTH_RANGE_POSITION = 1 << 4
+STRENGTH_VOLATILITY = 1 << 5
+STRENGTH_MESSAGES = (
+    "🟢 Strong volume confirms move",
+    "🟢 Significant gap shows catalyst",
+    "🟢 Small float - easier to move",
+    "🟢 Perfect price range for retail",
+    "🟢 Good position in trading range",
+    "🟢 Healthy volatility level",
+)
+
+# Pillar order in the per-symbol score arrays
+PILLARS = ('volume', 'gap', 'float', 'price', 'sector')
+VOLUME, GAP, FLOAT, PRICE, SECTOR = range(len(PILLARS))
+
+# Sector/industry tiers for pillar 5
+PREFERRED_SECTORS = frozenset({'Healthcare', 'Technology', 'Communication Services', 'Biotechnology'})
+PREFERRED_INDUSTRIES = frozenset({'Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information',
+                                  'Medical Devices', 'Pharmaceuticals'})
+GOOD_SECTORS = frozenset({'Consumer Discretionary', 'Industrials'})
+NEUTRAL_SECTORS = frozenset({'Consumer Staples', 'Utilities'})
+WEAK_SECTORS = frozenset({'Financial Services', 'Energy'})
+
+# Compiled eagerly for the one layout analyze() passes (contiguous float64
+# columns), so the first analysis doesn't pay for type inference
+@njit("(f8[::1], f8[::1], f8[::1], f8[::1], f8)", cache=True)
+def _score_pillars(close, volume, high, low, float_shares):
+    """
+    Price/volume metrics and pillar tiers for one symbol's daily bars
     
-    try:
+    Returns (current_price, prev_close, avg_volume, gap_percent,
+    relative_volume, week_high, week_low, price_range_position, volatility,
+    volume_tier, gap_tier, float_tier, price_tier). float_tier is -1 when the
+    float is unknown (0); a NaN volume or gap gets tier 0.
+    """
+    current_price = close[-1]
+    prev_close = close[-2]
+    avg_volume = np.nanmean(volume[:-1])  # Exclude today
+    
+    gap_percent = ((current_price - prev_close) / prev_close) * 100
+    relative_volume = volume[-1] / avg_volume if avg_volume > 0 else 0.0
+    
+    week_high = np.nanmax(high)
+    week_low = np.nanmin(low)
+    if week_high != week_low:
+        price_range_position = ((current_price - week_low) / (week_high - week_low)) * 100
+    else:
+        price_range_position = 50.0
+    
+    # Sample std (ddof=1) of the daily returns, as pandas computes it; gaps in
+    # the closes are rare, so the returns are only filtered when there are any
+    returns = np.diff(close) / close[:-1]
+    finite = np.isfinite(returns)
+    if not finite.all():
+        returns = returns[finite]
+    n = len(returns)
+    volatility = returns.std() * np.sqrt(n / (n - 1)) * 100 if n > 1 else np.nan
+    
+    # NaN sorts past every threshold, so a missing volume or close is rated F
+    # explicitly, as the comparisons in the old ladders were
+    volume_tier = 0 if np.isnan(relative_volume) else np.searchsorted(VOL_THRESH, relative_volume, side='right')
+    gap_tier = 0 if np.isnan(gap_percent) else np.searchsorted(GAP_THRESH, abs(gap_percent), side='right')
+    float_tier = np.searchsorted(FLOAT_THRESH, float_shares, side='left') if float_shares != 0 else -1
+    price_tier = np.searchsorted(PRICE_THRESH, current_price, side='right')
+    
+    return (current_price, prev_close, avg_volume, gap_percent, relative_volume,
+            week_high, week_low, price_range_position, volatility,
+            volume_tier, gap_tier, float_tier, price_tier)
+
+def _score_sector(sector, industry):
+    """(score, grade, status, comment) for the sector pillar"""
+    if sector in PREFERRED_SECTORS or industry in PREFERRED_INDUSTRIES:
+        return 20, "A+", "✅", "PREFERRED sector for momentum!"
+    if sector in GOOD_SECTORS:
+        return 16, "B+", "✅", "Good sector for momentum"
+    if sector in NEUTRAL_SECTORS:
+        return 12, "B", "✅", "Neutral sector"
+    if sector in WEAK_SECTORS:
+        return 8, "C", "❌", "Less preferred sector"
+    return 5, "D", "❌", "Avoid this sector"
+
+def _risk_flags(relative_volume, abs_gap, float_shares, current_price, price_range_position, volatility):
+    """(risk_flags, strength_flags) bitmasks for the risk assessment"""
+    risk_flags = 0
+    strength_flags = 0
+    
+    if relative_volume < 2.0:
+        risk_flags |= RISK_LOW_VOLUME
+    else:
+        strength_flags |= STRENGTH_VOLUME
+    
+    if abs_gap < 4.0:
+        risk_flags |= RISK_SMALL_GAP
+    else:
+        strength_flags |= STRENGTH_GAP
+    
+    if float_shares > 50_000_000:
+        risk_flags |= RISK_HIGH_FLOAT
+    elif 0 < float_shares <= 20_000_000:
+        strength_flags |= STRENGTH_SMALL_FLOAT
+    
+    if current_price > 50.0:
+        risk_flags |= RISK_HIGH_PRICE
+    elif 2.0 <= current_price <= 20.0:
+        strength_flags |= STRENGTH_PRICE_RANGE
+    
+    if price_range_position > 95:
+        risk_flags |= RISK_NEAR_HIGHS
+    elif price_range_position < 5:
+        risk_flags |= RISK_NEAR_LOWS
+    else:
+        strength_flags |= STRENGTH_RANGE_POSITION
+    
+    if volatility > 15:
+        risk_flags |= RISK_HIGH_VOLATILITY
+    elif volatility < 3:
+        risk_flags |= RISK_LOW_VOLATILITY
+    else:
+        strength_flags |= STRENGTH_VOLATILITY
+    
+    return risk_flags, strength_flags
+
+def _flag_messages(flags, messages):
+    """Messages for the bits set in flags, in bit order"""
+    return [message for bit, message in enumerate(messages) if flags >> bit & 1]
+
+class FileCache:
+    """JSON file cache under CACHE_DIR/<symbol>/, one entry per (symbol, key)"""
+    
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+    
+    def _path(self, symbol, key):
+        digest = hashlib.md5(f"{symbol}:{key}".encode()).hexdigest()
+        return os.path.join(self.root, symbol, f"{digest}.json")
+    
+    def get(self, symbol, key, ttl):
+        """Cached payload, or None if missing or older than ttl seconds"""
+        try:
+            with open(self._path(symbol, key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry['ts'] >= ttl:
+            return None
+        return entry['payload']
+    
+    def set(self, symbol, key, payload):
+        path = self._path(symbol, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'ts': time.time(), 'payload': payload}, f, default=str)
+
+_cache = FileCache()
+
+def get_info(symbol):
+    """Company info fields used by the analysis, served from the cache when fresh"""
+    info = _cache.get(symbol, 'info', INFO_TTL)
+    if info is None:
         import yfinance as yf
         
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period='20d')  # Get more data for better analysis
+        full_info = yf.Ticker(symbol, session=yahoo_session()).get_info()
+        info = {key: full_info[key] for key in INFO_FIELDS if key in full_info}
+        _cache.set(symbol, 'info', info)
+    return info
+
+def get_history(symbol, period):
+    """
+    Daily price history for a symbol over ``period`` (e.g. '20d')
+    
+    Bars are kept in .cache/<symbol>/hist.parquet; later calls only download
+    the bars since the last cached one. Like Yahoo's range, '20d' means the
+    last 20 trading bars rather than 20 calendar days.
+    """
+    import pandas as pd
+    
+    path = _history_path(symbol)
+    n_bars = int(period.rstrip('d'))
+    
+    hist = pd.read_parquet(path) if os.path.exists(path) else None
+    if hist is not None and len(hist) and _history_fresh(path):
+        return hist.tail(n_bars)
+    
+    import yfinance as yf
+    
+    ticker = yf.Ticker(symbol, session=yahoo_session())
+    if hist is None or hist.empty:
+        hist = ticker.history(period=period)
+    else:
+        # Start from the last cached day rather than the day after: its bar may
+        # still have been forming when it was cached
+        new_bars = ticker.history(start=hist.index[-1].date())
+        if len(new_bars):
+            hist = pd.concat([hist[hist.index < new_bars.index[0]], new_bars])
+    
+    return _save_history(path, hist, n_bars)
+
+def _history_path(symbol):
+    return os.path.join(CACHE_DIR, symbol, 'hist.parquet')
+
+def _history_fresh(path):
+    """Whether cached history at path was written within HISTORY_REFRESH seconds"""
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < HISTORY_REFRESH
+
+def _save_history(path, hist, n_bars):
+    """Trim history to its last n_bars bars, write it to path and return it"""
+    if len(hist):
+        hist = hist.tail(n_bars)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        hist.to_parquet(path)
+    return hist
+
+async def _fetch_json(session, url, **params):
+    import orjson
+    
+    async with session.get(url, params=params) as response:
+        response.raise_for_status()
+        return orjson.loads(await response.read())
+
+async def _yahoo_crumb(session):
+    """Crumb required by quoteSummary; the first request only sets the session cookie"""
+    async with session.get(YAHOO_COOKIE_URL):
+        pass
+    async with session.get(YAHOO_CRUMB_URL) as response:
+        response.raise_for_status()
+        return await response.text()
+
+def _parse_chart(payload):
+    """Daily bars from a v8 chart response, shaped like Ticker.history()"""
+    import pandas as pd
+    
+    result = payload['chart']['result'][0]
+    quote = result['indicators']['quote'][0]
+    index = pd.to_datetime(result['timestamp'], unit='s', utc=True)
+    index = index.tz_convert(result['meta']['exchangeTimezoneName']).normalize().rename('Date')
+    return pd.DataFrame({
+        'Open': quote['open'],
+        'High': quote['high'],
+        'Low': quote['low'],
+        'Close': quote['close'],
+        'Volume': quote['volume'],
+    }, index=index, dtype='float64')
+
+def _parse_quote_summary(payload):
+    """INFO_FIELDS from a v10 quoteSummary response, with numbers unwrapped from {raw, fmt}"""
+    info = {}
+    for module in payload['quoteSummary']['result'][0].values():
+        for key, value in module.items():
+            if key in INFO_FIELDS:
+                value = value.get('raw') if isinstance(value, dict) else value
+                if value is not None:
+                    info[key] = value
+    return info
+
+async def prefetch(symbols, period='20d'):
+    """
+    Warm the info and history caches for many symbols over one aiohttp session
+    
+    Requests go straight to Yahoo's JSON endpoints and run concurrently on the
+    event loop. Symbols with fresh cache entries are skipped, and anything that
+    fails here is fetched again through yfinance by analyze().
+    """
+    import aiohttp
+    
+    need_info = [symbol for symbol in symbols if _cache.get(symbol, 'info', INFO_TTL) is None]
+    need_history = [symbol for symbol in symbols if not _history_fresh(_history_path(symbol))]
+    if not need_info and not need_history:
+        return
+    
+    connector = aiohttp.TCPConnector(limit=MAX_WORKERS)
+    async with aiohttp.ClientSession(headers=YAHOO_HEADERS, connector=connector,
+                                     timeout=aiohttp.ClientTimeout(total=10)) as session:
+        try:
+            crumb = await _yahoo_crumb(session) if need_info else None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            need_info = []
+        
+        info_results, chart_results = await asyncio.gather(
+            asyncio.gather(*(
+                _fetch_json(session, YAHOO_QUOTE_SUMMARY_URL.format(symbol=symbol),
+                            modules=QUOTE_SUMMARY_MODULES, crumb=crumb)
+                for symbol in need_info
+            ), return_exceptions=True),
+            asyncio.gather(*(
+                _fetch_json(session, YAHOO_CHART_URL.format(symbol=symbol), range=period, interval='1d')
+                for symbol in need_history
+            ), return_exceptions=True),
+        )
+    
+    n_bars = int(period.rstrip('d'))
+    for symbol, payload in zip(need_info, info_results):
+        try:
+            _cache.set(symbol, 'info', _parse_quote_summary(payload))
+        except Exception:
+            continue
+    for symbol, payload in zip(need_history, chart_results):
+        try:
+            _save_history(_history_path(symbol), _parse_chart(payload), n_bars)
+        except Exception:
+            continue
+
+def ttl_cache(seconds):
+    """Memoize a function on its positional args for ``seconds``; None results aren't cached"""
+    def decorator(func):
+        cache = {}
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.time()
+            hit = cache.get(args)
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+            
+            result = func(*args)
+            if result is not None:
+                cache[args] = (now, result)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@ttl_cache(RESULT_TTL)
+def analyze(symbol):
+    """
+    Analyze a symbol using Ross Cameron criteria
+    
+    Results are reused for RESULT_TTL seconds; the report is only printed
+    when the analysis actually runs.
+    """
+    # The report is collected here and written out in one go at the end, which
+    # also keeps concurrent analyses from interleaving their output
+    report = [f"🔍 ANALYZING {symbol} - ROSS CAMERON METHODOLOGY", "="*60]
+    
+    try:
+        info = get_info(symbol)
+        hist = get_history(symbol, '20d')  # Get more data for better analysis
         
         if len(hist) < 2:
-            print(f"❌ {symbol}: Insufficient data")
+            report.append(f"❌ {symbol}: Insufficient data")
             return None
         
-        # Get current data
-        current_price = hist['Close'].iloc[-1]
-        prev_close = hist['Close'].iloc[-2]
-        current_volume = hist['Volume'].iloc[-1]
-        avg_volume = hist['Volume'][:-1].mean()  # Exclude today
-        
-        # Calculate metrics
-        gap_percent = ((current_price - prev_close) / prev_close) * 100
-        relative_volume = current_volume / avg_volume if avg_volume > 0 else 0
-        
         # Get company info
-        company_name = info.get('longName', info.get('shortName', 'Unknown'))
-        float_shares = info.get('floatShares', info.get('sharesOutstanding', 0))
-        market_cap = info.get('marketCap', 0)
-        sector = info.get('sector', 'Unknown')
-        industry = info.get('industry', 'Unknown')
-        
-        # Calculate additional metrics
-        week_high = hist['High'].max()
-        week_low = hist['Low'].min()
-        price_range_position = ((current_price - week_low) / (week_high - week_low)) * 100 if week_high != week_low else 50
-        
-        # Calculate volatility
-        returns = hist['Close'].pct_change().dropna()
-        volatility = returns.std() * 100
-        
-        print(f"📊 COMPANY OVERVIEW:")
-        print(f"   Company: {company_name}")
-        print(f"   Sector: {sector}")
-        print(f"   Industry: {industry}")
-        print(f"   Exchange: {info.get('exchange', 'Unknown')}")
-        
-        print(f"\n💰 PRICE ACTION:")
-        print(f"   Current Price: ${current_price:.2f}")
-        print(f"   Previous Close: ${prev_close:.2f}")
-        print(f"   Gap: {gap_percent:+.2f}%")
-        print(f"   20-Day Range: ${week_low:.2f} - ${week_high:.2f}")
-        print(f"   Position in Range: {price_range_position:.1f}%")
-        print(f"   Daily Volatility: {volatility:.1f}%")
-        
-        print(f"\n📊 VOLUME ANALYSIS:")
-        print(f"   Current Volume: {current_volume:,}")
-        print(f"   Average Volume: {avg_volume:,.0f}")
-        print(f"   Relative Volume: {relative_volume:.1f}x")
-        
-        print(f"\n🏢 FUNDAMENTALS:")
-        print(f"   Float: {float_shares:,} shares")
-        print(f"   Market Cap: ${market_cap:,}")
-        print(f"   Enterprise Value: ${info.get('enterpriseValue', 0):,}")
+        company_name, float_shares, market_cap, enterprise_value, sector, industry, exchange = (
+            info.get(key, info.get(fallback, default)) for key, fallback, default in INFO_KEYS
+        )
+        
+        # Price/volume metrics and pillar tiers in one compiled pass over the
+        # raw bars; one frame-to-array copy instead of a Series per metric, laid
+        # out so each column is contiguous
+        bars = hist[['Close', 'Volume', 'High', 'Low']].to_numpy(dtype=np.float64)
+        close, volume, high, low = np.ascontiguousarray(bars.T)
+        current_volume = volume[-1]
+        (current_price, prev_close, avg_volume, gap_percent, relative_volume,
+         week_high, week_low, price_range_position, volatility,
+         volume_tier, gap_tier, float_tier, price_tier) = _score_pillars(
+            close, volume, high, low, float(float_shares)
+        )
+        
+        report.append(f"📊 COMPANY OVERVIEW:")
+        report.append(f"   Company: {company_name}")
+        report.append(f"   Sector: {sector}")
+        report.append(f"   Industry: {industry}")
+        report.append(f"   Exchange: {exchange}")
+        
+        report.append(f"\n💰 PRICE ACTION:")
+        report.append(f"   Current Price: ${current_price:.2f}")
+        report.append(f"   Previous Close: ${prev_close:.2f}")
+        report.append(f"   Gap: {gap_percent:+.2f}%")
+        report.append(f"   20-Day Range: ${week_low:.2f} - ${week_high:.2f}")
+        report.append(f"   Position in Range: {price_range_position:.1f}%")
+        report.append(f"   Daily Volatility: {volatility:.1f}%")
+        
+        report.append(f"\n📊 VOLUME ANALYSIS:")
+        report.append(f"   Current Volume: {current_volume:,.0f}")
+        report.append(f"   Average Volume: {avg_volume:,.0f}")
+        report.append(f"   Relative Volume: {relative_volume:.1f}x")
+        
+        report.append(f"\n🏢 FUNDAMENTALS:")
+        report.append(f"   Float: {float_shares:,} shares")
+        report.append(f"   Market Cap: ${market_cap:,}")
+        report.append(f"   Enterprise Value: ${enterprise_value:,}")
         
         # Ross Cameron 5 Pillars Analysis
-        print(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
-        print("="*50)
+        report.append(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
+        report.append("="*50)
         
-        pillars = {}
-        total_score = 0
+        # Pillar results as parallel arrays indexed by PILLARS; the per-pillar
+        # dicts are only assembled for the saved payload
+        scores = np.zeros(len(PILLARS), dtype=np.int8)
+        grades, values, statuses, comments = ([None] * len(PILLARS) for _ in range(4))
         
         # Pillar 1: High Relative Volume (20 points)
-        if relative_volume >= 10.0:
-            volume_score = 20
-            volume_grade = "A+"
-            volume_comment = "EXCEPTIONAL volume breakout!"
-        elif relative_volume >= 5.0:
-            volume_score = 18
-            volume_grade = "A"
-            volume_comment = "Strong volume breakout"
-        elif relative_volume >= 3.0:
-            volume_score = 16
-            volume_grade = "B+"
-            volume_comment = "Good volume increase"
-        elif relative_volume >= 2.0:
-            volume_score = 14
-            volume_grade = "B"
-            volume_comment = "Adequate volume"
-        elif relative_volume >= 1.5:
-            volume_score = 10
-            volume_grade = "C"
-            volume_comment = "Below average volume"
-        else:
-            volume_score = 0
-            volume_grade = "F"
-            volume_comment = "Poor volume"
-        
-        pillars['volume'] = {
-            'score': volume_score,
-            'grade': volume_grade,
-            'value': relative_volume,
-            'status': '✅' if volume_score >= 14 else '❌',
-            'comment': volume_comment
-        }
-        total_score += volume_score
-        print(f"   1. 📊 VOLUME: {pillars['volume']['status']} {relative_volume:.1f}x ({volume_grade}) - {volume_score}/20")
-        print(f"      {volume_comment}")
+        i = volume_tier
+        volume_score, volume_grade, volume_comment = VOL_SCORE[i], VOL_GRADE[i], VOL_COMMENT[i]
+        volume_status = '✅' if volume_score >= 14 else '❌'
+        
+        scores[VOLUME], grades[VOLUME], values[VOLUME] = volume_score, volume_grade, relative_volume
+        statuses[VOLUME], comments[VOLUME] = volume_status, volume_comment
+        report.append(f"   1. 📊 VOLUME: {volume_status} {relative_volume:.1f}x ({volume_grade}) - {volume_score}/20")
+        report.append(f"      {volume_comment}")
         
         # Pillar 2: Significant Price Change (20 points)
         abs_gap = abs(gap_percent)
-        if abs_gap >= 30.0:
-            gap_score = 20
-            gap_grade = "A+"
-            gap_comment = "MASSIVE price movement!"
-        elif abs_gap >= 20.0:
-            gap_score = 18
-            gap_grade = "A"
-            gap_comment = "Strong price movement"
-        elif abs_gap >= 10.0:
-            gap_score = 16
-            gap_grade = "B+"
-            gap_comment = "Good price movement"
-        elif abs_gap >= 4.0:
-            gap_score = 14
-            gap_grade = "B"
-            gap_comment = "Adequate price movement"
-        elif abs_gap >= 2.0:
-            gap_score = 10
-            gap_grade = "C"
-            gap_comment = "Small price movement"
-        else:
-            gap_score = 0
-            gap_grade = "F"
-            gap_comment = "Minimal price movement"
-        
-        pillars['gap'] = {
-            'score': gap_score,
-            'grade': gap_grade,
-            'value': gap_percent,
-            'status': '✅' if gap_score >= 14 else '❌',
-            'comment': gap_comment
-        }
-        total_score += gap_score
-        print(f"   2. 📈 GAP: {pillars['gap']['status']} {gap_percent:+.1f}% ({gap_grade}) - {gap_score}/20")
-        print(f"      {gap_comment}")
+        i = gap_tier
+        gap_score, gap_grade, gap_comment = GAP_SCORE[i], GAP_GRADE[i], GAP_COMMENT[i]
+        gap_status = '✅' if gap_score >= 14 else '❌'
+        
+        scores[GAP], grades[GAP], values[GAP] = gap_score, gap_grade, gap_percent
+        statuses[GAP], comments[GAP] = gap_status, gap_comment
+        report.append(f"   2. 📈 GAP: {gap_status} {gap_percent:+.1f}% ({gap_grade}) - {gap_score}/20")
+        report.append(f"      {gap_comment}")
         
         # Pillar 3: Low Float (20 points)
-        if float_shares == 0:
+        if float_tier < 0:
             float_score = 10  # Unknown float gets partial credit
             float_grade = "?"
             float_status = "⚠️"
             float_comment = "Float unknown - needs verification"
-        elif float_shares <= 5_000_000:  # 5M
-            float_score = 20
-            float_grade = "A+"
-            float_status = "✅"
-            float_comment = "PERFECT small float!"
-        elif float_shares <= 10_000_000:  # 10M
-            float_score = 18
-            float_grade = "A"
-            float_status = "✅"
-            float_comment = "Excellent small float"
-        elif float_shares <= 20_000_000:  # 20M
-            float_score = 16
-            float_grade = "B+"
-            float_status = "✅"
-            float_comment = "Good float size"
-        elif float_shares <= 50_000_000:  # 50M
-            float_score = 14
-            float_grade = "B"
-            float_status = "✅"
-            float_comment = "Acceptable float"
-        elif float_shares <= 100_000_000:  # 100M
-            float_score = 10
-            float_grade = "C"
-            float_status = "❌"
-            float_comment = "High float - harder to move"
         else:
-            float_score = 0
-            float_grade = "F"
-            float_status = "❌"
-            float_comment = "Massive float - avoid"
-        
-        pillars['float'] = {
-            'score': float_score,
-            'grade': float_grade,
-            'value': float_shares,
-            'status': float_status,
-            'comment': float_comment
-        }
-        total_score += float_score
-        print(f"   3. 🏢 FLOAT: {pillars['float']['status']} {float_shares:,} shares ({float_grade}) - {float_score}/20")
-        print(f"      {float_comment}")
+            i = float_tier
+            float_score, float_grade = FLOAT_SCORE[i], FLOAT_GRADE[i]
+            float_status, float_comment = FLOAT_STATUS[i], FLOAT_COMMENT[i]
+        
+        scores[FLOAT], grades[FLOAT], values[FLOAT] = float_score, float_grade, float_shares
+        statuses[FLOAT], comments[FLOAT] = float_status, float_comment
+        report.append(f"   3. 🏢 FLOAT: {float_status} {float_shares:,} shares ({float_grade}) - {float_score}/20")
+        report.append(f"      {float_comment}")
         
         # Pillar 4: Price Range (20 points)
-        if 2.0 <= current_price <= 20.0:
-            price_score = 20
-            price_grade = "A+"
-            price_status = "✅"
-            price_comment = "PERFECT Ross Cameron price range!"
-        elif 1.0 <= current_price <= 30.0:
-            price_score = 16
-            price_grade = "B+"
-            price_status = "✅"
-            price_comment = "Good price range"
-        elif 0.5 <= current_price <= 50.0:
-            price_score = 12
-            price_grade = "B"
-            price_status = "✅"
-            price_comment = "Acceptable price range"
-        elif current_price <= 100.0:
-            price_score = 8
-            price_grade = "C"
-            price_status = "❌"
-            price_comment = "High price - limited retail appeal"
-        else:
-            price_score = 0
-            price_grade = "F"
-            price_status = "❌"
-            price_comment = "Too expensive for momentum trading"
-        
-        pillars['price'] = {
-            'score': price_score,
-            'grade': price_grade,
-            'value': current_price,
-            'status': price_status,
-            'comment': price_comment
-        }
-        total_score += price_score
-        print(f"   4. 💰 PRICE: {pillars['price']['status']} ${current_price:.2f} ({price_grade}) - {price_score}/20")
-        print(f"      {price_comment}")
+        i = price_tier
+        price_score, price_grade = PRICE_SCORE[i], PRICE_GRADE[i]
+        price_status, price_comment = PRICE_STATUS[i], PRICE_COMMENT[i]
+        
+        scores[PRICE], grades[PRICE], values[PRICE] = price_score, price_grade, current_price
+        statuses[PRICE], comments[PRICE] = price_status, price_comment
+        report.append(f"   4. 💰 PRICE: {price_status} ${current_price:.2f} ({price_grade}) - {price_score}/20")
+        report.append(f"      {price_comment}")
         
         # Pillar 5: Sector Preference (20 points)
-        preferred_sectors = ['Healthcare', 'Technology', 'Communication Services', 'Biotechnology']
-        preferred_industries = ['Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information', 'Medical Devices', 'Pharmaceuticals']
-        
-        if sector in preferred_sectors or industry in preferred_industries:
-            sector_score = 20
-            sector_grade = "A+"
-            sector_status = "✅"
-            sector_comment = "PREFERRED sector for momentum!"
-        elif sector in ['Consumer Discretionary', 'Industrials']:
-            sector_score = 16
-            sector_grade = "B+"
-            sector_status = "✅"
-            sector_comment = "Good sector for momentum"
-        elif sector in ['Consumer Staples', 'Utilities']:
-            sector_score = 12
-            sector_grade = "B"
-            sector_status = "✅"
-            sector_comment = "Neutral sector"
-        elif sector in ['Financial Services', 'Energy']:
-            sector_score = 8
-            sector_grade = "C"
-            sector_status = "❌"
-            sector_comment = "Less preferred sector"
-        else:
-            sector_score = 5
-            sector_grade = "D"
-            sector_status = "❌"
-            sector_comment = "Avoid this sector"
-        
-        pillars['sector'] = {
-            'score': sector_score,
-            'grade': sector_grade,
-            'value': f"{sector} / {industry}",
-            'status': sector_status,
-            'comment': sector_comment
-        }
-        total_score += sector_score
-        print(f"   5. 🏭 SECTOR: {pillars['sector']['status']} {sector} ({sector_grade}) - {sector_score}/20")
-        print(f"      {sector_comment}")
+        sector_score, sector_grade, sector_status, sector_comment = _score_sector(sector, industry)
         
-        # Overall Ross Cameron Grade
-        print(f"\n🏆 ROSS CAMERON FINAL SCORE")
-        print("="*50)
-        
-        if total_score >= 90:
-            overall_grade = "A+"
-            recommendation = "STRONG BUY"
-            rec_color = "🟢"
-            rec_comment = "EXCEPTIONAL Ross Cameron setup!"
-        elif total_score >= 80:
-            overall_grade = "A"
-            recommendation = "BUY"
-            rec_color = "🟢"
-            rec_comment = "Strong Ross Cameron candidate"
-        elif total_score >= 70:
-            overall_grade = "B"
-            recommendation = "BUY"
-            rec_color = "🟡"
-            rec_comment = "Good momentum candidate"
-        elif total_score >= 60:
-            overall_grade = "C"
-            recommendation = "HOLD"
-            rec_color = "🟡"
-            rec_comment = "Mixed signals - proceed with caution"
-        elif total_score >= 50:
-            overall_grade = "D"
-            recommendation = "AVOID"
-            rec_color = "🔴"
-            rec_comment = "Poor setup - avoid"
-        else:
-            overall_grade = "F"
-            recommendation = "SELL"
-            rec_color = "🔴"
-            rec_comment = "Terrible setup - stay away"
+        scores[SECTOR], grades[SECTOR], values[SECTOR] = sector_score, sector_grade, f"{sector} / {industry}"
+        statuses[SECTOR], comments[SECTOR] = sector_status, sector_comment
+        report.append(f"   5. 🏭 SECTOR: {sector_status} {sector} ({sector_grade}) - {sector_score}/20")
+        report.append(f"      {sector_comment}")
         
-        print(f"   TOTAL SCORE: {total_score}/100")
-        print(f"   GRADE: {overall_grade}")
-        print(f"   RECOMMENDATION: {rec_color} {recommendation}")
-        print(f"   COMMENT: {rec_comment}")
+        total_score = int(scores.sum())
         
-        # Risk Assessment
-        print(f"\n⚠️ RISK ASSESSMENT:")
-        print("="*30)
-        risks = []
-        strengths = []
+        # Overall Ross Cameron Grade
+        report.append(f"\n🏆 ROSS CAMERON FINAL SCORE")
+        report.append("="*50)
         
-        if relative_volume < 2.0:
-            risks.append("🔴 Low volume - may lack momentum")
-        else:
-            strengths.append("🟢 Strong volume confirms move")
-            
-        if abs_gap < 4.0:
-            risks.append("🔴 Small gap - limited catalyst")
-        else:
-            strengths.append("🟢 Significant gap shows catalyst")
-            
-        if float_shares > 50_000_000:
-            risks.append("🔴 High float - harder to move")
-        elif float_shares > 0 and float_shares <= 20_000_000:
-            strengths.append("🟢 Small float - easier to move")
-            
-        if current_price > 50.0:
-            risks.append("🔴 High price - limited retail interest")
-        elif 2.0 <= current_price <= 20.0:
-            strengths.append("🟢 Perfect price range for retail")
-            
-        if price_range_position > 95:
-            risks.append("🔴 Near highs - potential resistance")
-        elif price_range_position < 5:
-            risks.append("🔴 Near lows - potential support test")
-        else:
-            strengths.append("🟢 Good position in trading range")
-            
-        if volatility > 15:
-            risks.append("🔴 High volatility - increased risk")
-        elif volatility < 3:
-            risks.append("🔴 Low volatility - may lack momentum")
-        else:
-            strengths.append("🟢 Healthy volatility level")
+        i = bisect.bisect_right(OVERALL_THRESH, total_score)
+        overall_grade, recommendation = OVERALL_GRADE[i], OVERALL_RECOMMENDATION[i]
+        rec_color, rec_comment = OVERALL_COLOR[i], OVERALL_COMMENT[i]
         
-        print("   STRENGTHS:")
+        report.append(f"   TOTAL SCORE: {total_score}/100")
+        report.append(f"   GRADE: {overall_grade}")
+        report.append(f"   RECOMMENDATION: {rec_color} {recommendation}")
+        report.append(f"   COMMENT: {rec_comment}")
+        
+        # Risk Assessment
+        report.append(f"\n⚠️ RISK ASSESSMENT:")
+        report.append("="*30)
+        risk_flags, strength_flags = _risk_flags(relative_volume, abs_gap, float_shares, current_price,
+                                                 price_range_position, volatility)
+        risks = _flag_messages(risk_flags, RISK_MESSAGES)
+        strengths = _flag_messages(strength_flags, STRENGTH_MESSAGES)
+        
+        report.append("   STRENGTHS:")
         for strength in strengths:
-            print(f"     • {strength}")
+            report.append(f"     • {strength}")
         
-        print("   RISKS:")
+        report.append("   RISKS:")
         for risk in risks:
-            print(f"     • {risk}")
+            report.append(f"     • {risk}")
         
         if not risks:
-            print("     • 🟢 Low risk setup - excellent candidate")
+            report.append("     • 🟢 Low risk setup - excellent candidate")
         
         # Trading Setup
-        if total_score >= 70:
-            print(f"\n💰 TRADING SETUP RECOMMENDATION:")
-            print("="*40)
+        if total_score >= TRADE_SETUP_MIN_SCORE:
+            report.append(f"\n💰 TRADING SETUP RECOMMENDATION:")
+            report.append("="*40)
             
             # Entry price (current or slight pullback)
             if gap_percent > 0:  # Long setup
@@ -396,29 +633,23 @@ def analyze_clbr():
             risk_reward = reward_per_share / risk_per_share if risk_per_share > 0 else 0
             
             # Position sizing (2% account risk)
-            account_value = 100000  # $100K demo account
-            risk_amount = account_value * 0.02  # 2% risk
+            risk_amount = ACCOUNT_VALUE * ACCOUNT_RISK
             shares = int(risk_amount / risk_per_share) if risk_per_share > 0 else 0
             position_value = shares * entry_price
             
-            print(f"   POSITION TYPE: {position_type}")
-            print(f"   ENTRY PRICE: ${entry_price:.2f}")
-            print(f"   STOP LOSS: ${stop_loss:.2f} ({abs((stop_loss/entry_price-1)*100):.1f}%)")
-            print(f"   TAKE PROFIT: ${take_profit:.2f} ({abs((take_profit/entry_price-1)*100):.1f}%)")
-            print(f"   RISK/REWARD: 1:{risk_reward:.1f}")
-            print(f"   SHARES: {shares:,}")
-            print(f"   POSITION VALUE: ${position_value:,.0f}")
-            print(f"   RISK AMOUNT: ${risk_amount:,.0f}")
+            report.append(f"   POSITION TYPE: {position_type}")
+            report.append(f"   ENTRY PRICE: ${entry_price:.2f}")
+            report.append(f"   STOP LOSS: ${stop_loss:.2f} ({abs((stop_loss/entry_price-1)*100):.1f}%)")
+            report.append(f"   TAKE PROFIT: ${take_profit:.2f} ({abs((take_profit/entry_price-1)*100):.1f}%)")
+            report.append(f"   RISK/REWARD: 1:{risk_reward:.1f}")
+            report.append(f"   SHARES: {shares:,}")
+            report.append(f"   POSITION VALUE: ${position_value:,.0f}")
+            report.append(f"   RISK AMOUNT: ${risk_amount:,.0f}")
             
             # Time horizon
-            if total_score >= 85:
-                time_horizon = "Day Trade (30min - 4hrs)"
-            elif total_score >= 75:
-                time_horizon = "Swing Trade (1-5 days)"
-            else:
-                time_horizon = "Position Trade (1-2 weeks)"
+            time_horizon = TIME_HORIZONS[bisect.bisect_right(TIME_HORIZON_THRESH, total_score)]
             
-            print(f"   TIME HORIZON: {time_horizon}")
+            report.append(f"   TIME HORIZON: {time_horizon}")
         
         # Save analysis
         analysis_data = {
@@ -434,7 +665,16 @@ def analyze_clbr():
             'market_cap': market_cap,
             'volatility': volatility,
             'price_range_position': price_range_position,
-            'pillars': pillars,
+            'pillars': {
+                name: {
+                    'score': int(scores[k]),
+                    'grade': grades[k],
+                    'value': values[k],
+                    'status': statuses[k],
+                    'comment': comments[k]
+                }
+                for k, name in enumerate(PILLARS)
+            },
             'total_score': total_score,
             'overall_grade': overall_grade,
             'recommendation': recommendation,
@@ -442,20 +682,110 @@ def analyze_clbr():
             'risks': risks
         }
         
-        # Save to file
-        results_file = '/home/ubuntu/momentum_trader/clbr_analysis.json'
-        with open(results_file, 'w') as f:
-            json.dump(analysis_data, f, indent=2)
+        # Append to the results log, one JSON object per line
+        import orjson
+        
+        line = orjson.dumps(analysis_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+        with _results_lock, open(RESULTS_FILE, 'ab') as f:
+            f.write(line)
         
-        print(f"\n💾 Analysis saved to: {results_file}")
-        print(f"🎯 CLBR analysis complete!")
+        report.append(f"\n💾 Analysis saved to: {RESULTS_FILE}")
+        report.append(f"🎯 {symbol} analysis complete!")
         
         return analysis_data
         
     except Exception as e:
-        print(f"❌ Error analyzing CLBR: {e}")
+        report.append(f"❌ Error analyzing {symbol}: {e}")
         return None
+    finally:
+        sys.stdout.write("\n".join(report) + "\n")
+
+def analyze_clbr():
+    """Analyze CLBR using Ross Cameron criteria"""
+    return analyze("CLBR")
+
+def analyze_many(symbols, max_workers=MAX_WORKERS):
+    """Analyze several symbols concurrently; yfinance calls are I/O-bound"""
+    asyncio.run(prefetch(symbols))
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {symbol: executor.submit(analyze, symbol) for symbol in symbols}
+        for symbol, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                print(f"❌ Error analyzing {symbol}: {error}")
+            elif future.result():
+                results[symbol] = future.result()
+    return results
+
+def screen(symbols, period='20d', max_workers=MAX_WORKERS):
+    """
+    Pillar scores for many symbols at once, best total first
+    
+    Bars for every symbol come from a single yf.download call and the volume,
+    gap and price pillars are scored across all symbols with array ops. Only
+    float and sector need per-symbol company info (cached by get_info).
+    Each symbol is scored on its own last two complete bars, so one that
+    skipped the latest date (a halt, another exchange calendar) still counts.
+    Symbols without two complete bars are left out.
+    """
+    import pandas as pd
+    import yfinance as yf
+    
+    symbols = list(symbols)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        infos = executor.map(get_info, symbols)
+        data = yf.download(symbols, period=period, group_by='column', threads=True,
+                           progress=False, session=yahoo_session())
+        infos = list(infos)
+    
+    data = data.dropna(how='all')
+    if len(data) < 2:
+        return pd.DataFrame()
+    close = data['Close'].reindex(columns=symbols).to_numpy(dtype=np.float64)
+    volume = data['Volume'].reindex(columns=symbols).to_numpy(dtype=np.float64)
+    
+    # Bars with every field present, per symbol
+    complete = ~data.isna().T.groupby(level=1).any().T.reindex(columns=symbols, fill_value=True).to_numpy()
+    valid = complete.sum(axis=0) >= 2
+    cols = np.arange(len(symbols))
+    last, prev, prior = last_complete_bars(complete)
+    current_price, prev_close = close[last, cols], close[prev, cols]
+    current_volume = volume[last, cols]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_volume = np.where(prior, volume, 0.0).sum(axis=0) / prior.sum(axis=0)
+        gap_percent = (current_price - prev_close) / prev_close * 100
+        relative_volume = np.where(avg_volume > 0, current_volume / avg_volume, 0.0)
+    
+    company = [
+        tuple(info.get(key, info.get(fallback, default)) for key, fallback, default in INFO_KEYS)
+        for info in infos
+    ]
+    float_shares = np.array([float(c[1] or 0) for c in company])
+    sector_scores = [_score_sector(c[4], c[5])[0] for c in company]
+    
+    scores = np.empty((len(symbols), len(PILLARS)), dtype=np.int8)
+    scores[:, VOLUME] = np.take(VOL_SCORE, np.searchsorted(VOL_THRESH, relative_volume, side='right'))
+    scores[:, GAP] = np.take(GAP_SCORE, np.searchsorted(GAP_THRESH, np.abs(gap_percent), side='right'))
+    scores[:, FLOAT] = np.where(float_shares == 0, 10,
+                                np.take(FLOAT_SCORE, np.searchsorted(FLOAT_THRESH, float_shares, side='left')))
+    scores[:, PRICE] = np.take(PRICE_SCORE, np.searchsorted(PRICE_THRESH, current_price, side='right'))
+    scores[:, SECTOR] = sector_scores
+    
+    result = pd.DataFrame({
+        'company_name': [c[0] for c in company],
+        'sector': [c[4] for c in company],
+        'current_price': current_price,
+        'gap_percent': gap_percent,
+        'relative_volume': relative_volume,
+        'float_shares': float_shares,
+        **{f'{name}_score': scores[:, k] for k, name in enumerate(PILLARS)},
+        'total_score': scores.sum(axis=1),
+    }, index=pd.Index(symbols, name='symbol'))
+    return result[valid].sort_values('total_score', ascending=False, kind='stable')
 
 if __name__ == "__main__":
-    analyze_clbr()
+    analyze_many(sys.argv[1:] or ["CLBR"])
 
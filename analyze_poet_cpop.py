@@ -4,33 +4,130 @@ Analyze POET and CPOP using Ross Cameron methodology
 """
 import sys
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+import numpy as np
+from numba import njit
+
+import yahoo_data
+
 # Add the project root to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-def analyze_stock(symbol):
-    """Analyze a single stock using Ross Cameron criteria"""
-    print(f"\n🔍 ANALYZING {symbol}")
-    print("="*50)
+# Pillar scoring tables: np.searchsorted places a value among the *_BINS edges
+# and the resulting tier indexes the parallel score/grade tuples. Volume and
+# gap tiers start at their edge (>=).
+VOL_BINS = np.array([1.5, 2.0, 3.0, 5.0])
+VOL_SCORES = (0, 10, 15, 18, 20)
+VOL_GRADES = ("F", "C", "B", "A", "A+")
+
+GAP_BINS = np.array([2.0, 4.0, 10.0, 20.0])
+GAP_SCORES = (0, 10, 15, 18, 20)
+GAP_GRADES = ("F", "C", "B", "A", "A+")
+
+# Float tiers end at their edge (<=), so they are searched from the left
+FLOAT_BINS = np.array([10e6, 20e6, 50e6, 100e6])
+FLOAT_SCORES = (20, 18, 15, 10, 0)
+FLOAT_GRADES = ("A+", "A", "B", "C", "F")
+FLOAT_STATUSES = ("✅", "✅", "✅", "❌", "❌")
+
+# Price bands nest around $2-$20 and include both ends, so the upper edges are
+# nudged up one ulp to stay inclusive under a right-side search
+PRICE_BINS = np.array([0.5, 1.0, 2.0, *np.nextafter([20.0, 30.0, 50.0], np.inf)])
+PRICE_SCORES = (0, 10, 15, 20, 15, 10, 0)
+PRICE_GRADES = ("F", "C", "B", "A+", "B", "C", "F")
+PRICE_STATUSES = ("❌", "❌", "✅", "✅", "✅", "❌", "❌")
+
+UNKNOWN_FLOAT_SCORE = 10  # Partial credit when Yahoo has no float
+
+# Pillar order in the per-symbol tier/score arrays
+PILLARS = ('volume', 'gap', 'float', 'price', 'sector')
+N_PILLARS = len(PILLARS)
+VOLUME, GAP, FLOAT, PRICE, SECTOR = range(N_PILLARS)
+
+# Sector tiers, picked in Python by _sector_code before scoring
+SECTOR_SCORES = (20, 15, 10, 5)
+SECTOR_GRADES = ("A+", "B", "C", "D")
+SECTOR_STATUSES = ("✅", "✅", "❌", "❌")
+PREFERRED_SECTORS = frozenset({'Healthcare', 'Technology', 'Communication Services', 'Biotechnology'})
+PREFERRED_INDUSTRIES = frozenset({'Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information'})
+TIER2_SECTORS = frozenset({'Consumer Discretionary', 'Industrials'})
+TIER3_SECTORS = frozenset({'Financial Services', 'Energy'})
+
+def _sector_code(sector, industry):
+    """Sector tier for the sector pillar: 0 is preferred, 3 is everything else"""
+    if sector in PREFERRED_SECTORS or industry in PREFERRED_INDUSTRIES:
+        return 0
+    if sector in TIER2_SECTORS:
+        return 1
+    if sector in TIER3_SECTORS:
+        return 2
+    return 3
+
+@njit(cache=True)
+def _score_symbol(relative_volume, gap_percent, float_shares, current_price, sector_code):
+    """
+    Tiers and scores for the volume, gap, float, price and sector pillars, and
+    their total
+    
+    Tiers index the *_GRADES tables; the float tier is -1 when the float is
+    unknown (0). A NaN volume or gap gets the bottom tier.
+    """
+    tiers = np.empty(N_PILLARS, dtype=np.int64)
+    # NaN sorts past every bin, so it is kept out of the volume and gap lookups
+    tiers[VOLUME] = 0 if np.isnan(relative_volume) else np.searchsorted(VOL_BINS, relative_volume, side='right')
+    tiers[GAP] = 0 if np.isnan(gap_percent) else np.searchsorted(GAP_BINS, abs(gap_percent), side='right')
+    tiers[FLOAT] = np.searchsorted(FLOAT_BINS, float_shares, side='left') if float_shares != 0 else -1
+    tiers[PRICE] = np.searchsorted(PRICE_BINS, current_price, side='right')
+    tiers[SECTOR] = sector_code
+    
+    scores = np.empty(N_PILLARS, dtype=np.int64)
+    scores[VOLUME] = VOL_SCORES[tiers[VOLUME]]
+    scores[GAP] = GAP_SCORES[tiers[GAP]]
+    scores[FLOAT] = FLOAT_SCORES[tiers[FLOAT]] if tiers[FLOAT] >= 0 else UNKNOWN_FLOAT_SCORE
+    scores[PRICE] = PRICE_SCORES[tiers[PRICE]]
+    scores[SECTOR] = SECTOR_SCORES[tiers[SECTOR]]
+    return tiers, scores, scores.sum()
+
+MAX_WORKERS = 16  # Fetches are I/O-bound on Yahoo, so threads scale well
+
+# On-disk cache for Yahoo responses so back-to-back runs skip the network
+CACHE_DIR = os.getenv('POET_CPOP_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'poet_cpop'))
+INFO_TTL = 24 * 60 * 60  # Company info barely changes within a day
+HISTORY_TTL = 5 * 60  # Intraday bars move; refresh history every 5 minutes
+
+# The only company info fields the analysis reads; the rest of Yahoo's 100+
+# field quote summary is dropped before caching
+INFO_FIELDS = ('longName', 'shortName', 'floatShares', 'sharesOutstanding', 'marketCap', 'sector', 'industry')
+
+def fetch_stock_info(symbol):
+    """Fetch the INFO_FIELDS of one symbol's company info from Yahoo Finance, cached for INFO_TTL"""
+    return yahoo_data.fetch_info(symbol, INFO_FIELDS, CACHE_DIR, INFO_TTL)
+
+def fetch_histories(symbols, period='10d'):
+    """Daily history for every symbol, keyed by symbol; cached for HISTORY_TTL"""
+    return yahoo_data.fetch_histories(symbols, period, CACHE_DIR, HISTORY_TTL)
+
+def analyze_stock(symbol, hist, info):
+    """Analyze a single stock using Ross Cameron criteria from pre-fetched history and info"""
+    # Lines are collected and written in one go when the analysis finishes
+    out = [f"\n🔍 ANALYZING {symbol}", "="*50]
     
     try:
-        import yfinance as yf
-        
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period='10d')
-        
         if len(hist) < 2:
-            print(f"❌ {symbol}: Insufficient data")
+            out.append(f"❌ {symbol}: Insufficient data")
             return None
         
+        # Work on raw arrays; the nan-aware reductions match pandas' skipna
+        close = hist['Close'].to_numpy(dtype=np.float64)
+        volume = hist['Volume'].to_numpy(dtype=np.float64)
+        
         # Get current data
-        current_price = hist['Close'].iloc[-1]
-        prev_close = hist['Close'].iloc[-2]
-        current_volume = hist['Volume'].iloc[-1]
-        avg_volume = hist['Volume'][:-1].mean()  # Exclude today
+        current_price = close[-1]
+        prev_close = close[-2]
+        current_volume = volume[-1]
+        avg_volume = np.nanmean(volume[:-1])  # Exclude today
         
         # Calculate metrics
         gap_percent = ((current_price - prev_close) / prev_close) * 100
@@ -44,175 +141,59 @@ def analyze_stock(symbol):
         industry = info.get('industry', 'Unknown')
         
         # Calculate additional metrics
-        week_high = hist['High'].max()
-        week_low = hist['Low'].min()
+        week_high = np.nanmax(hist['High'].to_numpy(dtype=np.float64))
+        week_low = np.nanmin(hist['Low'].to_numpy(dtype=np.float64))
         price_range_position = ((current_price - week_low) / (week_high - week_low)) * 100 if week_high != week_low else 50
         
-        print(f"📊 BASIC INFO:")
-        print(f"   Company: {company_name}")
-        print(f"   Sector: {sector}")
-        print(f"   Industry: {industry}")
-        print(f"   Current Price: ${current_price:.2f}")
-        print(f"   Previous Close: ${prev_close:.2f}")
-        print(f"   Gap: {gap_percent:+.2f}%")
-        print(f"   Volume: {current_volume:,}")
-        print(f"   Avg Volume: {avg_volume:,.0f}")
-        print(f"   Relative Volume: {relative_volume:.1f}x")
-        print(f"   Float: {float_shares:,} shares")
-        print(f"   Market Cap: ${market_cap:,}")
-        print(f"   Week Range: ${week_low:.2f} - ${week_high:.2f}")
-        print(f"   Position in Range: {price_range_position:.1f}%")
+        out.append(f"📊 BASIC INFO:")
+        out.append(f"   Company: {company_name}")
+        out.append(f"   Sector: {sector}")
+        out.append(f"   Industry: {industry}")
+        out.append(f"   Current Price: ${current_price:.2f}")
+        out.append(f"   Previous Close: ${prev_close:.2f}")
+        out.append(f"   Gap: {gap_percent:+.2f}%")
+        out.append(f"   Volume: {current_volume:,.0f}")
+        out.append(f"   Avg Volume: {avg_volume:,.0f}")
+        out.append(f"   Relative Volume: {relative_volume:.1f}x")
+        out.append(f"   Float: {float_shares:,} shares")
+        out.append(f"   Market Cap: ${market_cap:,}")
+        out.append(f"   Week Range: ${week_low:.2f} - ${week_high:.2f}")
+        out.append(f"   Position in Range: {price_range_position:.1f}%")
         
         # Ross Cameron 5 Pillars Analysis
-        print(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
-        
-        pillars = {}
-        total_score = 0
-        
-        # Pillar 1: High Relative Volume (20 points)
-        if relative_volume >= 5.0:
-            volume_score = 20
-            volume_grade = "A+"
-        elif relative_volume >= 3.0:
-            volume_score = 18
-            volume_grade = "A"
-        elif relative_volume >= 2.0:
-            volume_score = 15
-            volume_grade = "B"
-        elif relative_volume >= 1.5:
-            volume_score = 10
-            volume_grade = "C"
-        else:
-            volume_score = 0
-            volume_grade = "F"
-        
-        pillars['volume'] = {
-            'score': volume_score,
-            'grade': volume_grade,
-            'value': relative_volume,
-            'status': '✅' if volume_score >= 15 else '❌'
-        }
-        total_score += volume_score
-        print(f"   1. Volume: {pillars['volume']['status']} {relative_volume:.1f}x ({volume_grade}) - {volume_score}/20")
-        
-        # Pillar 2: Significant Price Change (20 points)
+        out.append(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
+        
+        # Tiers and scores for all five pillars in one compiled call. Results
+        # stay in parallel arrays indexed by PILLARS; the per-pillar dicts are
+        # only assembled for the returned payload.
+        tiers, scores, total_score = _score_symbol(
+            float(relative_volume), float(gap_percent), float(float_shares), float(current_price),
+            _sector_code(sector, industry)
+        )
+        tiers, scores, total_score = tiers.tolist(), scores.astype(np.int8), int(total_score)
+        
+        grades = [
+            VOL_GRADES[tiers[VOLUME]],
+            GAP_GRADES[tiers[GAP]],
+            FLOAT_GRADES[tiers[FLOAT]] if tiers[FLOAT] >= 0 else "?",  # Unknown float, scored UNKNOWN_FLOAT_SCORE
+            PRICE_GRADES[tiers[PRICE]],
+            SECTOR_GRADES[tiers[SECTOR]],
+        ]
+        statuses = [
+            '✅' if scores[VOLUME] >= 15 else '❌',
+            '✅' if scores[GAP] >= 15 else '❌',
+            FLOAT_STATUSES[tiers[FLOAT]] if tiers[FLOAT] >= 0 else "⚠️",
+            PRICE_STATUSES[tiers[PRICE]],
+            SECTOR_STATUSES[tiers[SECTOR]],
+        ]
+        values = [relative_volume, gap_percent, float_shares, current_price, f"{sector} / {industry}"]
         abs_gap = abs(gap_percent)
-        if abs_gap >= 20.0:
-            gap_score = 20
-            gap_grade = "A+"
-        elif abs_gap >= 10.0:
-            gap_score = 18
-            gap_grade = "A"
-        elif abs_gap >= 4.0:
-            gap_score = 15
-            gap_grade = "B"
-        elif abs_gap >= 2.0:
-            gap_score = 10
-            gap_grade = "C"
-        else:
-            gap_score = 0
-            gap_grade = "F"
-        
-        pillars['gap'] = {
-            'score': gap_score,
-            'grade': gap_grade,
-            'value': gap_percent,
-            'status': '✅' if gap_score >= 15 else '❌'
-        }
-        total_score += gap_score
-        print(f"   2. Gap: {pillars['gap']['status']} {gap_percent:+.1f}% ({gap_grade}) - {gap_score}/20")
-        
-        # Pillar 3: Low Float (20 points)
-        if float_shares == 0:
-            float_score = 10  # Unknown float gets partial credit
-            float_grade = "?"
-            float_status = "⚠️"
-        elif float_shares <= 10_000_000:  # 10M
-            float_score = 20
-            float_grade = "A+"
-            float_status = "✅"
-        elif float_shares <= 20_000_000:  # 20M
-            float_score = 18
-            float_grade = "A"
-            float_status = "✅"
-        elif float_shares <= 50_000_000:  # 50M
-            float_score = 15
-            float_grade = "B"
-            float_status = "✅"
-        elif float_shares <= 100_000_000:  # 100M
-            float_score = 10
-            float_grade = "C"
-            float_status = "❌"
-        else:
-            float_score = 0
-            float_grade = "F"
-            float_status = "❌"
-        
-        pillars['float'] = {
-            'score': float_score,
-            'grade': float_grade,
-            'value': float_shares,
-            'status': float_status
-        }
-        total_score += float_score
-        print(f"   3. Float: {pillars['float']['status']} {float_shares:,} shares ({float_grade}) - {float_score}/20")
-        
-        # Pillar 4: Price Range (20 points)
-        if 2.0 <= current_price <= 20.0:
-            price_score = 20
-            price_grade = "A+"
-            price_status = "✅"
-        elif 1.0 <= current_price <= 30.0:
-            price_score = 15
-            price_grade = "B"
-            price_status = "✅"
-        elif 0.5 <= current_price <= 50.0:
-            price_score = 10
-            price_grade = "C"
-            price_status = "❌"
-        else:
-            price_score = 0
-            price_grade = "F"
-            price_status = "❌"
         
-        pillars['price'] = {
-            'score': price_score,
-            'grade': price_grade,
-            'value': current_price,
-            'status': price_status
-        }
-        total_score += price_score
-        print(f"   4. Price Range: {pillars['price']['status']} ${current_price:.2f} ({price_grade}) - {price_score}/20")
-        
-        # Pillar 5: Sector Preference (20 points)
-        preferred_sectors = ['Healthcare', 'Technology', 'Communication Services', 'Biotechnology']
-        preferred_industries = ['Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information']
-        
-        if sector in preferred_sectors or industry in preferred_industries:
-            sector_score = 20
-            sector_grade = "A+"
-            sector_status = "✅"
-        elif sector in ['Consumer Discretionary', 'Industrials']:
-            sector_score = 15
-            sector_grade = "B"
-            sector_status = "✅"
-        elif sector in ['Financial Services', 'Energy']:
-            sector_score = 10
-            sector_grade = "C"
-            sector_status = "❌"
-        else:
-            sector_score = 5
-            sector_grade = "D"
-            sector_status = "❌"
-        
-        pillars['sector'] = {
-            'score': sector_score,
-            'grade': sector_grade,
-            'value': f"{sector} / {industry}",
-            'status': sector_status
-        }
-        total_score += sector_score
-        print(f"   5. Sector: {pillars['sector']['status']} {sector} ({sector_grade}) - {sector_score}/20")
+        out.append(f"   1. Volume: {statuses[VOLUME]} {relative_volume:.1f}x ({grades[VOLUME]}) - {scores[VOLUME]}/20")
+        out.append(f"   2. Gap: {statuses[GAP]} {gap_percent:+.1f}% ({grades[GAP]}) - {scores[GAP]}/20")
+        out.append(f"   3. Float: {statuses[FLOAT]} {float_shares:,} shares ({grades[FLOAT]}) - {scores[FLOAT]}/20")
+        out.append(f"   4. Price Range: {statuses[PRICE]} ${current_price:.2f} ({grades[PRICE]}) - {scores[PRICE]}/20")
+        out.append(f"   5. Sector: {statuses[SECTOR]} {sector} ({grades[SECTOR]}) - {scores[SECTOR]}/20")
         
         # Overall Ross Cameron Grade
         if total_score >= 90:
@@ -240,11 +221,11 @@ def analyze_stock(symbol):
             recommendation = "SELL"
             rec_color = "🔴"
         
-        print(f"\n🏆 ROSS CAMERON SCORE: {total_score}/100 ({overall_grade})")
-        print(f"🎯 RECOMMENDATION: {rec_color} {recommendation}")
+        out.append(f"\n🏆 ROSS CAMERON SCORE: {total_score}/100 ({overall_grade})")
+        out.append(f"🎯 RECOMMENDATION: {rec_color} {recommendation}")
         
         # Risk Assessment
-        print(f"\n⚠️ RISK ASSESSMENT:")
+        out.append(f"\n⚠️ RISK ASSESSMENT:")
         risks = []
         
         if relative_volume < 2.0:
@@ -264,11 +245,11 @@ def analyze_stock(symbol):
             risks.append("Low risk setup - good Ross Cameron candidate")
         
         for risk in risks:
-            print(f"   • {risk}")
+            out.append(f"   • {risk}")
         
         # Trading Setup
         if total_score >= 70:
-            print(f"\n💰 TRADING SETUP:")
+            out.append(f"\n💰 TRADING SETUP:")
             
             # Entry price (current or slight pullback)
             entry_price = current_price * 0.99 if gap_percent > 0 else current_price * 1.01
@@ -292,13 +273,13 @@ def analyze_stock(symbol):
             risk_amount = account_value * 0.02  # 2% risk
             shares = int(risk_amount / risk_per_share) if risk_per_share > 0 else 0
             
-            print(f"   Position: {position_type}")
-            print(f"   Entry: ${entry_price:.2f}")
-            print(f"   Stop Loss: ${stop_loss:.2f}")
-            print(f"   Take Profit: ${take_profit:.2f}")
-            print(f"   Risk/Reward: 1:{risk_reward:.1f}")
-            print(f"   Shares: {shares:,}")
-            print(f"   Risk Amount: ${risk_amount:,.0f}")
+            out.append(f"   Position: {position_type}")
+            out.append(f"   Entry: ${entry_price:.2f}")
+            out.append(f"   Stop Loss: ${stop_loss:.2f}")
+            out.append(f"   Take Profit: ${take_profit:.2f}")
+            out.append(f"   Risk/Reward: 1:{risk_reward:.1f}")
+            out.append(f"   Shares: {shares:,}")
+            out.append(f"   Risk Amount: ${risk_amount:,.0f}")
         
         # Return analysis data
         return {
@@ -311,7 +292,15 @@ def analyze_stock(symbol):
             'relative_volume': relative_volume,
             'float_shares': float_shares,
             'market_cap': market_cap,
-            'pillars': pillars,
+            'pillars': {
+                name: {
+                    'score': int(scores[k]),
+                    'grade': grades[k],
+                    'value': values[k],
+                    'status': statuses[k]
+                }
+                for k, name in enumerate(PILLARS)
+            },
             'total_score': total_score,
             'overall_grade': overall_grade,
             'recommendation': recommendation,
@@ -320,8 +309,10 @@ def analyze_stock(symbol):
         }
         
     except Exception as e:
-        print(f"❌ Error analyzing {symbol}: {e}")
+        out.append(f"❌ Error analyzing {symbol}: {e}")
         return None
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main analysis function"""
@@ -332,8 +323,24 @@ def main():
     symbols = ['POET', 'CPOP']
     results = {}
     
+    # Company info is fetched per symbol on the pool while all the price
+    # history comes down in one batched download; scoring then runs in order
+    # so the per-symbol reports don't interleave
+    infos = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols))) as executor:
+        futures = {executor.submit(fetch_stock_info, symbol): symbol for symbol in symbols}
+        histories = fetch_histories(symbols)
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                infos[symbol] = future.result()
+            except Exception as e:
+                print(f"❌ Error fetching {symbol}: {e}")
+    
     for symbol in symbols:
-        result = analyze_stock(symbol)
+        if symbol not in infos:
+            continue
+        result = analyze_stock(symbol, histories[symbol], infos[symbol])
         if result:
             results[symbol] = result
     
@@ -355,13 +362,15 @@ def main():
         print(f"   Recommendation: {best_data['recommendation']}")
     
     # Save results
+    import orjson
+    
     results_file = '/home/ubuntu/momentum_trader/poet_cpop_analysis.json'
-    with open(results_file, 'w') as f:
-        json.dump({
+    with open(results_file, 'wb') as f:
+        f.write(orjson.dumps({
             'timestamp': datetime.now().isoformat(),
             'symbols_analyzed': list(results.keys()),
             'results': results
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     print(f"\n💾 Analysis saved to: {results_file}")
     print(f"🎯 Analysis complete!")
@@ -4,31 +4,202 @@ Analyze SQFT using Ross Cameron methodology
 """
 import sys
 import os
-import json
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+from numba import njit
+
+from ross_scoring import (
+    PILLARS, VOLUME, GAP, FLOAT, PRICE, SECTOR, UNKNOWN_FLOAT_TIER, PillarTables, score_pillars
+)
+import yahoo_data
+
+@njit(cache=True, nogil=True)
+def _last_sma_and_volatility(close):
+    """
+    5-day SMA at the last close and daily volatility in percent
+    
+    Volatility is the sample std of close-to-close returns, accumulated with
+    Welford's method in a single pass; nan returns are skipped like dropna().
+    The SMA is nan when the series is shorter than 5 days.
+    """
+    n = close.shape[0]
+    sma_5 = np.nan
+    if n >= 5:
+        sma_5 = 0.0
+        for i in range(n - 5, n):
+            sma_5 += close[i]
+        sma_5 /= 5
+    
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1
+        if np.isnan(r):
+            continue
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+    volatility = np.sqrt(m2 / (count - 1)) * 100 if count > 1 else np.nan
+    return sma_5, volatility
+
+# Sector tiers for the sector pillar
+PREFERRED_SECTORS = frozenset({'Healthcare', 'Technology', 'Communication Services', 'Biotechnology'})
+PREFERRED_INDUSTRIES = frozenset({'Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information',
+                                  'Medical Devices', 'Pharmaceuticals', 'Real Estate Services', 'Real Estate Development'})
+GOOD_SECTORS = frozenset({'Consumer Discretionary', 'Industrials', 'Real Estate'})
+NEUTRAL_SECTORS = frozenset({'Consumer Staples', 'Utilities'})
+WEAK_SECTORS = frozenset({'Financial Services', 'Energy'})
+
+def _sector_code(sector, industry):
+    """Sector tier for the sector pillar, 0 (preferred) to 4 (avoid)"""
+    if sector in PREFERRED_SECTORS or industry in PREFERRED_INDUSTRIES:
+        return 0
+    if sector in GOOD_SECTORS:
+        return 1
+    if sector in NEUTRAL_SECTORS:
+        return 2
+    if sector in WEAK_SECTORS:
+        return 3
+    return 4
+
+POINTS_PER_PILLAR = 20  # Pillars are reported out of 20, for a total out of 100
+
+# Pillar scoring tables for score_pillars, and the grade, status and comment of
+# each tier. Price bands are nested around $2-$20 and include both ends.
+PILLAR_TABLES = PillarTables(
+    vol_thresh=np.array([1.5, 2.0, 3.0, 5.0, 10.0, 20.0]),
+    vol_scores=np.array([0, 50, 70, 80, 90, 95, 100]),
+    gap_thresh=np.array([2.0, 4.0, 10.0, 20.0, 30.0, 50.0]),
+    gap_scores=np.array([0, 50, 70, 80, 90, 95, 100]),
+    float_thresh=np.array([2e6, 5e6, 10e6, 20e6, 50e6, 100e6]),
+    float_scores=np.array([100, 95, 90, 80, 70, 50, 0]),
+    unknown_float_score=50,  # Unknown float gets partial credit
+    price_thresh=np.array([0.5, 1.0, 2.0, *np.nextafter([20.0, 30.0, 50.0, 100.0], np.inf)]),
+    price_scores=np.array([40, 60, 80, 100, 80, 60, 40, 0]),
+    sector_scores=np.array([100, 80, 60, 40, 25]),  # Indexed by _sector_code
+)
+
+VOL_GRADES = ("F", "C", "B", "B+", "A", "A+", "A+")
+VOL_COMMENTS = ("❌ Poor volume", "⚠️ Below average volume", "✅ Adequate volume", "👍 Good volume increase",
+                "💪 Strong volume breakout", "🔥 EXCEPTIONAL volume breakout!", "🚀 EXPLOSIVE volume breakout!")
+
+GAP_GRADES = ("F", "C", "B", "B+", "A", "A+", "A+")
+GAP_COMMENTS = ("❌ Minimal price movement", "⚠️ Small price movement", "✅ Adequate price movement",
+                "👍 Good price movement", "💪 Strong price movement", "🔥 MASSIVE price movement!",
+                "🚀 EXPLOSIVE price movement!")
+
+FLOAT_GRADES = ("A+", "A+", "A", "B+", "B", "C", "F")
+FLOAT_STATUSES = ("✅", "✅", "✅", "✅", "✅", "❌", "❌")
+FLOAT_COMMENTS = ("🚀 ULTRA small float - explosive potential!", "🔥 PERFECT small float!", "💪 Excellent small float",
+                  "👍 Good float size", "✅ Acceptable float", "⚠️ High float - harder to move", "❌ Massive float - avoid")
+
+PRICE_GRADES = ("C", "B", "B+", "A+", "B+", "B", "C", "F")
+PRICE_STATUSES = ("❌", "✅", "✅", "✅", "✅", "✅", "❌", "❌")
+PRICE_COMMENTS = ("⚠️ High price - limited retail appeal", "✅ Acceptable price range", "👍 Good price range",
+                  "🎯 PERFECT Ross Cameron price range!", "👍 Good price range", "✅ Acceptable price range",
+                  "⚠️ High price - limited retail appeal", "❌ Too expensive for momentum trading")
+
+SECTOR_GRADES = ("A+", "B+", "B", "C", "D")
+SECTOR_STATUSES = ("✅", "✅", "✅", "❌", "❌")
+SECTOR_COMMENTS = ("🎯 PREFERRED sector for momentum!", "👍 Good sector for momentum", "✅ Neutral sector",
+                   "⚠️ Less preferred sector", "❌ Avoid this sector")
+
+@dataclass(slots=True)
+class RiskMetrics:
+    """Metrics the risk assessment rules are evaluated against"""
+    relative_volume: float
+    abs_gap: float
+    float_shares: float
+    current_price: float
+    price_range_position: float
+    volatility: float
+
+# Risk assessment rules, one group per metric in report order. Within a group
+# the first matching (predicate, kind, message) wins, like an if/elif chain.
+RISK, STRENGTH = 'risk', 'strength'
+ASSESSMENT_RULES = (
+    (
+        (lambda m: m.relative_volume < 2.0, RISK, "🔴 Low volume - may lack momentum"),
+        (lambda m: m.relative_volume >= 5.0, STRENGTH, "🟢 Exceptional volume confirms strong interest"),
+        (lambda m: True, STRENGTH, "🟢 Good volume confirms move"),
+    ),
+    (
+        (lambda m: m.abs_gap < 4.0, RISK, "🔴 Small gap - limited catalyst"),
+        (lambda m: m.abs_gap >= 20.0, STRENGTH, "🟢 Massive gap shows powerful catalyst"),
+        (lambda m: True, STRENGTH, "🟢 Significant gap shows catalyst"),
+    ),
+    (
+        (lambda m: m.float_shares > 50_000_000, RISK, "🔴 High float - harder to move"),
+        (lambda m: 0 < m.float_shares <= 10_000_000, STRENGTH, "🟢 Small float - explosive potential"),
+        (lambda m: 0 < m.float_shares <= 20_000_000, STRENGTH, "🟢 Good float size - easier to move"),
+    ),
+    (
+        (lambda m: m.current_price > 50.0, RISK, "🔴 High price - limited retail interest"),
+        (lambda m: 2.0 <= m.current_price <= 20.0, STRENGTH, "🟢 Perfect price range for retail traders"),
+        (lambda m: m.current_price < 1.0, RISK, "🔴 Very low price - potential delisting risk"),
+    ),
+    (
+        (lambda m: m.price_range_position > 95, RISK, "🔴 Near highs - potential resistance"),
+        (lambda m: m.price_range_position < 5, RISK, "🔴 Near lows - potential support test"),
+        (lambda m: True, STRENGTH, "🟢 Good position in trading range"),
+    ),
+    (
+        (lambda m: m.volatility > 20, RISK, "🔴 Extreme volatility - very high risk"),
+        (lambda m: m.volatility > 10, RISK, "🟡 High volatility - increased risk"),
+        (lambda m: m.volatility < 2, RISK, "🔴 Low volatility - may lack momentum"),
+        (lambda m: True, STRENGTH, "🟢 Healthy volatility level"),
+    ),
+)
+
+def assess_risks(metrics):
+    """Strengths and risks of a setup, as two lists of messages in report order"""
+    findings = {RISK: [], STRENGTH: []}
+    for rules in ASSESSMENT_RULES:
+        for predicate, kind, message in rules:
+            if predicate(metrics):
+                findings[kind].append(message)
+                break
+    return findings[STRENGTH], findings[RISK]
+
+# On-disk cache for Yahoo responses so back-to-back runs skip the network
+CACHE_DIR = os.getenv('SQFT_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'sqft'))
+INFO_TTL = 24 * 60 * 60  # Company info barely changes within a day
+HISTORY_TTL = 5 * 60  # Intraday bars move; refresh history every 5 minutes
+
+# The only company info fields the report reads; the rest of Yahoo's 100+
+# field quote summary is dropped before caching
+INFO_FIELDS = ('longName', 'shortName', 'floatShares', 'sharesOutstanding', 'marketCap', 'enterpriseValue',
+               'bookValue', 'trailingPE', 'sector', 'industry', 'exchange', 'country')
+
 def analyze_sqft():
     """Analyze SQFT using Ross Cameron criteria"""
     symbol = "SQFT"
-    print(f"🔍 ANALYZING {symbol} - ROSS CAMERON METHODOLOGY")
-    print("="*60)
+    # Lines are collected and written in one go when the analysis finishes
+    out = [f"🔍 ANALYZING {symbol} - ROSS CAMERON METHODOLOGY", "="*60]
     
     try:
-        import yfinance as yf
-        
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period='20d')  # Get more data for better analysis
+        info = yahoo_data.fetch_info(symbol, INFO_FIELDS, CACHE_DIR, INFO_TTL)
+        # Get more data for better analysis
+        hist = yahoo_data.fetch_histories([symbol], '20d', CACHE_DIR, HISTORY_TTL)[symbol]
         
         if len(hist) < 2:
-            print(f"❌ {symbol}: Insufficient data")
+            out.append(f"❌ {symbol}: Insufficient data")
             return None
         
+        # Pull the columns out once; every metric below is computed on these
+        # arrays, with nan-aware reductions matching pandas' skipna
+        close = hist['Close'].to_numpy(dtype=np.float64)
+        volume = hist['Volume'].to_numpy()
+        
         # Get current data
-        current_price = hist['Close'].iloc[-1]
-        prev_close = hist['Close'].iloc[-2]
-        current_volume = hist['Volume'].iloc[-1]
-        avg_volume = hist['Volume'][:-1].mean()  # Exclude today
+        current_price = close[-1]
+        prev_close = close[-2]
+        current_volume = volume[-1]
+        avg_volume = np.nanmean(volume[:-1])  # Exclude today
         
         # Calculate metrics
         gap_percent = ((current_price - prev_close) / prev_close) * 100
@@ -42,283 +213,120 @@ def analyze_sqft():
         industry = info.get('industry', 'Unknown')
         
         # Calculate additional metrics
-        week_high = hist['High'].max()
-        week_low = hist['Low'].min()
+        week_high = np.nanmax(hist['High'].to_numpy(dtype=np.float64))
+        week_low = np.nanmin(hist['Low'].to_numpy(dtype=np.float64))
         price_range_position = ((current_price - week_low) / (week_high - week_low)) * 100 if week_high != week_low else 50
         
-        # Calculate volatility
-        returns = hist['Close'].pct_change().dropna()
-        volatility = returns.std() * 100
-        
-        # Calculate momentum indicators
+        # Calculate volatility and momentum indicators
+        sma_5, volatility = _last_sma_and_volatility(close)
         if len(hist) >= 5:
-            sma_5 = hist['Close'].rolling(5).mean().iloc[-1]
             price_vs_sma5 = ((current_price - sma_5) / sma_5) * 100
         else:
             sma_5 = current_price
             price_vs_sma5 = 0
         
-        print(f"📊 COMPANY OVERVIEW:")
-        print(f"   Company: {company_name}")
-        print(f"   Sector: {sector}")
-        print(f"   Industry: {industry}")
-        print(f"   Exchange: {info.get('exchange', 'Unknown')}")
-        print(f"   Country: {info.get('country', 'Unknown')}")
-        
-        print(f"\n💰 PRICE ACTION:")
-        print(f"   Current Price: ${current_price:.2f}")
-        print(f"   Previous Close: ${prev_close:.2f}")
-        print(f"   Gap: {gap_percent:+.2f}%")
-        print(f"   20-Day Range: ${week_low:.2f} - ${week_high:.2f}")
-        print(f"   Position in Range: {price_range_position:.1f}%")
-        print(f"   Daily Volatility: {volatility:.1f}%")
-        print(f"   vs 5-Day SMA: {price_vs_sma5:+.1f}%")
-        
-        print(f"\n📊 VOLUME ANALYSIS:")
-        print(f"   Current Volume: {current_volume:,}")
-        print(f"   Average Volume: {avg_volume:,.0f}")
-        print(f"   Relative Volume: {relative_volume:.1f}x")
+        out.append(f"📊 COMPANY OVERVIEW:")
+        out.append(f"   Company: {company_name}")
+        out.append(f"   Sector: {sector}")
+        out.append(f"   Industry: {industry}")
+        out.append(f"   Exchange: {info.get('exchange', 'Unknown')}")
+        out.append(f"   Country: {info.get('country', 'Unknown')}")
+        
+        out.append(f"\n💰 PRICE ACTION:")
+        out.append(f"   Current Price: ${current_price:.2f}")
+        out.append(f"   Previous Close: ${prev_close:.2f}")
+        out.append(f"   Gap: {gap_percent:+.2f}%")
+        out.append(f"   20-Day Range: ${week_low:.2f} - ${week_high:.2f}")
+        out.append(f"   Position in Range: {price_range_position:.1f}%")
+        out.append(f"   Daily Volatility: {volatility:.1f}%")
+        out.append(f"   vs 5-Day SMA: {price_vs_sma5:+.1f}%")
+        
+        out.append(f"\n📊 VOLUME ANALYSIS:")
+        out.append(f"   Current Volume: {current_volume:,}")
+        out.append(f"   Average Volume: {avg_volume:,.0f}")
+        out.append(f"   Relative Volume: {relative_volume:.1f}x")
         
         # Volume trend analysis
         if len(hist) >= 5:
-            recent_vol = hist['Volume'].iloc[-5:].mean()
-            older_vol = hist['Volume'].iloc[-10:-5].mean() if len(hist) >= 10 else recent_vol
+            recent_vol = np.nanmean(volume[-5:])
+            older_vol = np.nanmean(volume[-10:-5]) if len(hist) >= 10 else recent_vol
             vol_trend = ((recent_vol - older_vol) / older_vol) * 100 if older_vol > 0 else 0
-            print(f"   Volume Trend (5d): {vol_trend:+.1f}%")
+            out.append(f"   Volume Trend (5d): {vol_trend:+.1f}%")
         
-        print(f"\n🏢 FUNDAMENTALS:")
-        print(f"   Float: {float_shares:,} shares")
-        print(f"   Market Cap: ${market_cap:,}")
-        print(f"   Enterprise Value: ${info.get('enterpriseValue', 0):,}")
-        print(f"   Book Value: ${info.get('bookValue', 0):.2f}")
-        print(f"   P/E Ratio: {info.get('trailingPE', 'N/A')}")
+        out.append(f"\n🏢 FUNDAMENTALS:")
+        out.append(f"   Float: {float_shares:,} shares")
+        out.append(f"   Market Cap: ${market_cap:,}")
+        out.append(f"   Enterprise Value: ${info.get('enterpriseValue', 0):,}")
+        out.append(f"   Book Value: ${info.get('bookValue', 0):.2f}")
+        out.append(f"   P/E Ratio: {info.get('trailingPE', 'N/A')}")
         
         # Ross Cameron 5 Pillars Analysis
-        print(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
-        print("="*50)
-        
-        pillars = {}
-        total_score = 0
-        
-        # Pillar 1: High Relative Volume (20 points)
-        if relative_volume >= 20.0:
-            volume_score = 20
-            volume_grade = "A+"
-            volume_comment = "🚀 EXPLOSIVE volume breakout!"
-        elif relative_volume >= 10.0:
-            volume_score = 19
-            volume_grade = "A+"
-            volume_comment = "🔥 EXCEPTIONAL volume breakout!"
-        elif relative_volume >= 5.0:
-            volume_score = 18
-            volume_grade = "A"
-            volume_comment = "💪 Strong volume breakout"
-        elif relative_volume >= 3.0:
-            volume_score = 16
-            volume_grade = "B+"
-            volume_comment = "👍 Good volume increase"
-        elif relative_volume >= 2.0:
-            volume_score = 14
-            volume_grade = "B"
-            volume_comment = "✅ Adequate volume"
-        elif relative_volume >= 1.5:
-            volume_score = 10
-            volume_grade = "C"
-            volume_comment = "⚠️ Below average volume"
-        else:
-            volume_score = 0
-            volume_grade = "F"
-            volume_comment = "❌ Poor volume"
-        
-        pillars['volume'] = {
-            'score': volume_score,
-            'grade': volume_grade,
-            'value': relative_volume,
-            'status': '✅' if volume_score >= 14 else '❌',
-            'comment': volume_comment
-        }
-        total_score += volume_score
-        print(f"   1. 📊 VOLUME: {pillars['volume']['status']} {relative_volume:.1f}x ({volume_grade}) - {volume_score}/20")
-        print(f"      {volume_comment}")
-        
-        # Pillar 2: Significant Price Change (20 points)
+        out.append(f"\n🎯 ROSS CAMERON 5 PILLARS ANALYSIS:")
+        out.append("="*50)
+        
+        # Tiers and 0-100 scores of all five pillars in one compiled call,
+        # reported here as points out of POINTS_PER_PILLAR
+        tiers, scores = score_pillars(
+            np.array([relative_volume], dtype=np.float64),
+            np.array([gap_percent], dtype=np.float64),
+            np.array([float_shares], dtype=np.float64),
+            np.array([current_price], dtype=np.float64),
+            np.array([_sector_code(sector, industry)], dtype=np.int64),
+            PILLAR_TABLES
+        )
+        tiers = tiers[0].tolist()
+        points = (scores[0] * POINTS_PER_PILLAR // 100).tolist()
+        total_score = sum(points)
         abs_gap = abs(gap_percent)
-        if abs_gap >= 50.0:
-            gap_score = 20
-            gap_grade = "A+"
-            gap_comment = "🚀 EXPLOSIVE price movement!"
-        elif abs_gap >= 30.0:
-            gap_score = 19
-            gap_grade = "A+"
-            gap_comment = "🔥 MASSIVE price movement!"
-        elif abs_gap >= 20.0:
-            gap_score = 18
-            gap_grade = "A"
-            gap_comment = "💪 Strong price movement"
-        elif abs_gap >= 10.0:
-            gap_score = 16
-            gap_grade = "B+"
-            gap_comment = "👍 Good price movement"
-        elif abs_gap >= 4.0:
-            gap_score = 14
-            gap_grade = "B"
-            gap_comment = "✅ Adequate price movement"
-        elif abs_gap >= 2.0:
-            gap_score = 10
-            gap_grade = "C"
-            gap_comment = "⚠️ Small price movement"
-        else:
-            gap_score = 0
-            gap_grade = "F"
-            gap_comment = "❌ Minimal price movement"
-        
-        pillars['gap'] = {
-            'score': gap_score,
-            'grade': gap_grade,
-            'value': gap_percent,
-            'status': '✅' if gap_score >= 14 else '❌',
-            'comment': gap_comment
-        }
-        total_score += gap_score
-        print(f"   2. 📈 GAP: {pillars['gap']['status']} {gap_percent:+.1f}% ({gap_grade}) - {gap_score}/20")
-        print(f"      {gap_comment}")
-        
-        # Pillar 3: Low Float (20 points)
-        if float_shares == 0:
-            float_score = 10  # Unknown float gets partial credit
-            float_grade = "?"
-            float_status = "⚠️"
-            float_comment = "❓ Float unknown - needs verification"
-        elif float_shares <= 2_000_000:  # 2M
-            float_score = 20
-            float_grade = "A+"
-            float_status = "✅"
-            float_comment = "🚀 ULTRA small float - explosive potential!"
-        elif float_shares <= 5_000_000:  # 5M
-            float_score = 19
-            float_grade = "A+"
-            float_status = "✅"
-            float_comment = "🔥 PERFECT small float!"
-        elif float_shares <= 10_000_000:  # 10M
-            float_score = 18
-            float_grade = "A"
-            float_status = "✅"
-            float_comment = "💪 Excellent small float"
-        elif float_shares <= 20_000_000:  # 20M
-            float_score = 16
-            float_grade = "B+"
-            float_status = "✅"
-            float_comment = "👍 Good float size"
-        elif float_shares <= 50_000_000:  # 50M
-            float_score = 14
-            float_grade = "B"
-            float_status = "✅"
-            float_comment = "✅ Acceptable float"
-        elif float_shares <= 100_000_000:  # 100M
-            float_score = 10
-            float_grade = "C"
-            float_status = "❌"
-            float_comment = "⚠️ High float - harder to move"
-        else:
-            float_score = 0
-            float_grade = "F"
-            float_status = "❌"
-            float_comment = "❌ Massive float - avoid"
         
-        pillars['float'] = {
-            'score': float_score,
-            'grade': float_grade,
-            'value': float_shares,
-            'status': float_status,
-            'comment': float_comment
+        float_known = tiers[FLOAT] != UNKNOWN_FLOAT_TIER
+        grades = [
+            VOL_GRADES[tiers[VOLUME]],
+            GAP_GRADES[tiers[GAP]],
+            FLOAT_GRADES[tiers[FLOAT]] if float_known else "?",
+            PRICE_GRADES[tiers[PRICE]],
+            SECTOR_GRADES[tiers[SECTOR]],
+        ]
+        statuses = [
+            '✅' if points[VOLUME] >= 14 else '❌',
+            '✅' if points[GAP] >= 14 else '❌',
+            FLOAT_STATUSES[tiers[FLOAT]] if float_known else "⚠️",
+            PRICE_STATUSES[tiers[PRICE]],
+            SECTOR_STATUSES[tiers[SECTOR]],
+        ]
+        comments = [
+            VOL_COMMENTS[tiers[VOLUME]],
+            GAP_COMMENTS[tiers[GAP]],
+            FLOAT_COMMENTS[tiers[FLOAT]] if float_known else "❓ Float unknown - needs verification",
+            PRICE_COMMENTS[tiers[PRICE]],
+            SECTOR_COMMENTS[tiers[SECTOR]],
+        ]
+        values = [relative_volume, gap_percent, float_shares, current_price, f"{sector} / {industry}"]
+        pillars = {
+            name: {
+                'score': points[k],
+                'grade': grades[k],
+                'value': values[k],
+                'status': statuses[k],
+                'comment': comments[k]
+            }
+            for k, name in enumerate(PILLARS)
         }
-        total_score += float_score
-        print(f"   3. 🏢 FLOAT: {pillars['float']['status']} {float_shares:,} shares ({float_grade}) - {float_score}/20")
-        print(f"      {float_comment}")
-        
-        # Pillar 4: Price Range (20 points)
-        if 2.0 <= current_price <= 20.0:
-            price_score = 20
-            price_grade = "A+"
-            price_status = "✅"
-            price_comment = "🎯 PERFECT Ross Cameron price range!"
-        elif 1.0 <= current_price <= 30.0:
-            price_score = 16
-            price_grade = "B+"
-            price_status = "✅"
-            price_comment = "👍 Good price range"
-        elif 0.5 <= current_price <= 50.0:
-            price_score = 12
-            price_grade = "B"
-            price_status = "✅"
-            price_comment = "✅ Acceptable price range"
-        elif current_price <= 100.0:
-            price_score = 8
-            price_grade = "C"
-            price_status = "❌"
-            price_comment = "⚠️ High price - limited retail appeal"
-        else:
-            price_score = 0
-            price_grade = "F"
-            price_status = "❌"
-            price_comment = "❌ Too expensive for momentum trading"
         
-        pillars['price'] = {
-            'score': price_score,
-            'grade': price_grade,
-            'value': current_price,
-            'status': price_status,
-            'comment': price_comment
-        }
-        total_score += price_score
-        print(f"   4. 💰 PRICE: {pillars['price']['status']} ${current_price:.2f} ({price_grade}) - {price_score}/20")
-        print(f"      {price_comment}")
-        
-        # Pillar 5: Sector Preference (20 points)
-        preferred_sectors = ['Healthcare', 'Technology', 'Communication Services', 'Biotechnology']
-        preferred_industries = ['Biotechnology', 'Software', 'Semiconductors', 'Internet Content & Information', 
-                              'Medical Devices', 'Pharmaceuticals', 'Real Estate Services', 'Real Estate Development']
-        
-        if sector in preferred_sectors or industry in preferred_industries:
-            sector_score = 20
-            sector_grade = "A+"
-            sector_status = "✅"
-            sector_comment = "🎯 PREFERRED sector for momentum!"
-        elif sector in ['Consumer Discretionary', 'Industrials', 'Real Estate']:
-            sector_score = 16
-            sector_grade = "B+"
-            sector_status = "✅"
-            sector_comment = "👍 Good sector for momentum"
-        elif sector in ['Consumer Staples', 'Utilities']:
-            sector_score = 12
-            sector_grade = "B"
-            sector_status = "✅"
-            sector_comment = "✅ Neutral sector"
-        elif sector in ['Financial Services', 'Energy']:
-            sector_score = 8
-            sector_grade = "C"
-            sector_status = "❌"
-            sector_comment = "⚠️ Less preferred sector"
-        else:
-            sector_score = 5
-            sector_grade = "D"
-            sector_status = "❌"
-            sector_comment = "❌ Avoid this sector"
-        
-        pillars['sector'] = {
-            'score': sector_score,
-            'grade': sector_grade,
-            'value': f"{sector} / {industry}",
-            'status': sector_status,
-            'comment': sector_comment
-        }
-        total_score += sector_score
-        print(f"   5. 🏭 SECTOR: {pillars['sector']['status']} {sector} ({sector_grade}) - {sector_score}/20")
-        print(f"      {sector_comment}")
+        out.append(f"   1. 📊 VOLUME: {statuses[VOLUME]} {relative_volume:.1f}x ({grades[VOLUME]}) - {points[VOLUME]}/20")
+        out.append(f"      {comments[VOLUME]}")
+        out.append(f"   2. 📈 GAP: {statuses[GAP]} {gap_percent:+.1f}% ({grades[GAP]}) - {points[GAP]}/20")
+        out.append(f"      {comments[GAP]}")
+        out.append(f"   3. 🏢 FLOAT: {statuses[FLOAT]} {float_shares:,} shares ({grades[FLOAT]}) - {points[FLOAT]}/20")
+        out.append(f"      {comments[FLOAT]}")
+        out.append(f"   4. 💰 PRICE: {statuses[PRICE]} ${current_price:.2f} ({grades[PRICE]}) - {points[PRICE]}/20")
+        out.append(f"      {comments[PRICE]}")
+        out.append(f"   5. 🏭 SECTOR: {statuses[SECTOR]} {sector} ({grades[SECTOR]}) - {points[SECTOR]}/20")
+        out.append(f"      {comments[SECTOR]}")
         
         # Overall Ross Cameron Grade
-        print(f"\n🏆 ROSS CAMERON FINAL SCORE")
-        print("="*50)
+        out.append(f"\n🏆 ROSS CAMERON FINAL SCORE")
+        out.append("="*50)
         
         if total_score >= 95:
             overall_grade = "A+"
@@ -356,76 +364,33 @@ def analyze_sqft():
             rec_color = "🔴"
             rec_comment = "🚫 Terrible setup - stay away"
         
-        print(f"   TOTAL SCORE: {total_score}/100")
-        print(f"   GRADE: {overall_grade}")
-        print(f"   RECOMMENDATION: {rec_color} {recommendation}")
-        print(f"   COMMENT: {rec_comment}")
+        out.append(f"   TOTAL SCORE: {total_score}/100")
+        out.append(f"   GRADE: {overall_grade}")
+        out.append(f"   RECOMMENDATION: {rec_color} {recommendation}")
+        out.append(f"   COMMENT: {rec_comment}")
         
         # Risk Assessment
-        print(f"\n⚠️ RISK ASSESSMENT:")
-        print("="*30)
-        risks = []
-        strengths = []
+        out.append(f"\n⚠️ RISK ASSESSMENT:")
+        out.append("="*30)
+        strengths, risks = assess_risks(RiskMetrics(
+            relative_volume, abs_gap, float_shares, current_price, price_range_position, volatility
+        ))
         
-        if relative_volume < 2.0:
-            risks.append("🔴 Low volume - may lack momentum")
-        elif relative_volume >= 5.0:
-            strengths.append("🟢 Exceptional volume confirms strong interest")
-        else:
-            strengths.append("🟢 Good volume confirms move")
-            
-        if abs_gap < 4.0:
-            risks.append("🔴 Small gap - limited catalyst")
-        elif abs_gap >= 20.0:
-            strengths.append("🟢 Massive gap shows powerful catalyst")
-        else:
-            strengths.append("🟢 Significant gap shows catalyst")
-            
-        if float_shares > 50_000_000:
-            risks.append("🔴 High float - harder to move")
-        elif float_shares > 0 and float_shares <= 10_000_000:
-            strengths.append("🟢 Small float - explosive potential")
-        elif float_shares > 0 and float_shares <= 20_000_000:
-            strengths.append("🟢 Good float size - easier to move")
-            
-        if current_price > 50.0:
-            risks.append("🔴 High price - limited retail interest")
-        elif 2.0 <= current_price <= 20.0:
-            strengths.append("🟢 Perfect price range for retail traders")
-        elif current_price < 1.0:
-            risks.append("🔴 Very low price - potential delisting risk")
-            
-        if price_range_position > 95:
-            risks.append("🔴 Near highs - potential resistance")
-        elif price_range_position < 5:
-            risks.append("🔴 Near lows - potential support test")
-        else:
-            strengths.append("🟢 Good position in trading range")
-            
-        if volatility > 20:
-            risks.append("🔴 Extreme volatility - very high risk")
-        elif volatility > 10:
-            risks.append("🟡 High volatility - increased risk")
-        elif volatility < 2:
-            risks.append("🔴 Low volatility - may lack momentum")
-        else:
-            strengths.append("🟢 Healthy volatility level")
-        
-        print("   STRENGTHS:")
+        out.append("   STRENGTHS:")
         for strength in strengths:
-            print(f"     • {strength}")
+            out.append(f"     • {strength}")
         
-        print("   RISKS:")
+        out.append("   RISKS:")
         for risk in risks:
-            print(f"     • {risk}")
+            out.append(f"     • {risk}")
         
         if not risks:
-            print("     • 🟢 Low risk setup - excellent candidate")
+            out.append("     • 🟢 Low risk setup - excellent candidate")
         
         # Trading Setup
         if total_score >= 65:
-            print(f"\n💰 TRADING SETUP RECOMMENDATION:")
-            print("="*40)
+            out.append(f"\n💰 TRADING SETUP RECOMMENDATION:")
+            out.append("="*40)
             
             # Entry price (current or slight pullback)
             if gap_percent > 0:  # Long setup
@@ -449,14 +414,14 @@ def analyze_sqft():
             shares = int(risk_amount / risk_per_share) if risk_per_share > 0 else 0
             position_value = shares * entry_price
             
-            print(f"   POSITION TYPE: {position_type}")
-            print(f"   ENTRY PRICE: ${entry_price:.2f}")
-            print(f"   STOP LOSS: ${stop_loss:.2f} ({abs((stop_loss/entry_price-1)*100):.1f}%)")
-            print(f"   TAKE PROFIT: ${take_profit:.2f} ({abs((take_profit/entry_price-1)*100):.1f}%)")
-            print(f"   RISK/REWARD: 1:{risk_reward:.1f}")
-            print(f"   SHARES: {shares:,}")
-            print(f"   POSITION VALUE: ${position_value:,.0f}")
-            print(f"   RISK AMOUNT: ${risk_amount:,.0f}")
+            out.append(f"   POSITION TYPE: {position_type}")
+            out.append(f"   ENTRY PRICE: ${entry_price:.2f}")
+            out.append(f"   STOP LOSS: ${stop_loss:.2f} ({abs((stop_loss/entry_price-1)*100):.1f}%)")
+            out.append(f"   TAKE PROFIT: ${take_profit:.2f} ({abs((take_profit/entry_price-1)*100):.1f}%)")
+            out.append(f"   RISK/REWARD: 1:{risk_reward:.1f}")
+            out.append(f"   SHARES: {shares:,}")
+            out.append(f"   POSITION VALUE: ${position_value:,.0f}")
+            out.append(f"   RISK AMOUNT: ${risk_amount:,.0f}")
             
             # Time horizon
             if total_score >= 90:
@@ -468,15 +433,15 @@ def analyze_sqft():
             else:
                 time_horizon = "Position Trade (1-2 weeks)"
             
-            print(f"   TIME HORIZON: {time_horizon}")
+            out.append(f"   TIME HORIZON: {time_horizon}")
             
             # Additional notes
             if relative_volume >= 10:
-                print(f"   📝 NOTE: Exceptional volume - watch for continuation")
+                out.append(f"   📝 NOTE: Exceptional volume - watch for continuation")
             if float_shares <= 5_000_000:
-                print(f"   📝 NOTE: Small float - potential for explosive moves")
+                out.append(f"   📝 NOTE: Small float - potential for explosive moves")
             if abs_gap >= 20:
-                print(f"   📝 NOTE: Large gap - watch for follow-through or reversal")
+                out.append(f"   📝 NOTE: Large gap - watch for follow-through or reversal")
         
         # Save analysis
         analysis_data = {
@@ -502,17 +467,21 @@ def analyze_sqft():
         
         # Save to file
         results_file = '/home/ubuntu/momentum_trader/sqft_analysis.json'
-        with open(results_file, 'w') as f:
-            json.dump(analysis_data, f, indent=2)
+        import orjson
+        
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps(analysis_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
-        print(f"\n💾 Analysis saved to: {results_file}")
-        print(f"🎯 SQFT analysis complete!")
+        out.append(f"\n💾 Analysis saved to: {results_file}")
+        out.append(f"🎯 SQFT analysis complete!")
         
         return analysis_data
         
     except Exception as e:
-        print(f"❌ Error analyzing SQFT: {e}")
+        out.append(f"❌ Error analyzing SQFT: {e}")
         return None
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     analyze_sqft()
@@ -5,25 +5,47 @@ Serves live Ross Cameron stock analysis
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+import asyncio
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from datetime import datetime
 import uvicorn
 import os
 
-app = FastAPI(title="Momentum Trader Pro API", version="1.0.0")
+from ross_scoring import PILLARS, VOLUME, GAP, PillarTables, score_pillars
+import yahoo_data
+
+# Responses are serialized with orjson; the analysis endpoints return plain
+# dicts, so nothing is re-validated on the way out
+app = FastAPI(title="Momentum Trader Pro API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# CORS configuration - allow frontend to access API. Origins are listed
+# explicitly (a wildcard can't be combined with credentials); set
+# CORS_ORIGINS to a comma-separated list to override.
+CORS_ORIGINS = os.getenv("CORS_ORIGINS", "https://oxjamdhd.manus.space,http://localhost:5173").split(",")
 
-# CORS configuration - allow frontend to access API
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
+    allow_origins=[origin.strip() for origin in CORS_ORIGINS if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET"],  # The API is read-only
     allow_headers=["*"],
 )
 
+# Stock lists repeat the same keys for every symbol and compress well; tiny
+# responses like /health aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+
 class StockAnalysis(BaseModel):
+    """Shape of one analysis, documented in the OpenAPI schema"""
     symbol: str
     company: str
     price: float
@@ -37,179 +59,252 @@ class StockAnalysis(BaseModel):
     pillars: Dict[str, int]
     hasOptions: bool
 
-def analyze_stock_live(symbol: str) -> Optional[StockAnalysis]:
-    """Analyze a stock using Ross Cameron methodology with live data"""
+PILLAR_WEIGHT = 0.20  # Each pillar's share of the Ross score
+
+# Pillar scoring tables for score_pillars; see PillarTables for how each is
+# searched. Price bands are nested around $2-$20 and include both ends.
+PILLAR_TABLES = PillarTables(
+    vol_thresh=np.array([1.5, 2.0, 3.0, 5.0, 10.0]),
+    vol_scores=np.array([0, 50, 70, 80, 90, 100]),
+    gap_thresh=np.array([2.0, 4.0, 10.0, 20.0, 30.0]),
+    gap_scores=np.array([0, 50, 70, 80, 90, 100]),
+    float_thresh=np.array([5e6, 10e6, 20e6, 50e6, 100e6]),
+    float_scores=np.array([100, 90, 80, 70, 50, 0]),
+    unknown_float_score=50,  # Partial credit when Yahoo has no float
+    price_thresh=np.array([0.5, 1.0, 2.0, *np.nextafter([20.0, 30.0, 50.0, 100.0], np.inf)]),
+    price_scores=np.array([40, 60, 80, 100, 80, 60, 40, 0]),
+    sector_scores=np.array([100, 80, 60, 25]),  # Indexed by the SECTOR_* codes
+)
+
+# Overall grade and recommendation from the Ross score; tiers start at the
+# threshold (>=)
+OVERALL_THRESH = np.array([55, 65, 75, 85, 90])
+OVERALL_GRADES = ("D", "C", "B", "B+", "A", "A+")
+OVERALL_RECOMMENDATIONS = ("AVOID", "HOLD", "BUY", "BUY", "STRONG BUY", "STRONG BUY")
+
+# Sector codes fed to score_pillars, picked in Python by _sector_code
+SECTOR_PREFERRED, SECTOR_GOOD, SECTOR_NEUTRAL, SECTOR_OTHER = range(4)
+
+PREFERRED_SECTORS = frozenset({'Healthcare', 'Technology', 'Communication Services'})
+PREFERRED_INDUSTRIES = frozenset({'Biotechnology', 'Software', 'Semiconductors'})
+GOOD_SECTORS = frozenset({'Consumer Discretionary', 'Industrials', 'Real Estate'})
+NEUTRAL_SECTORS = frozenset({'Consumer Staples', 'Utilities'})
+
+def _sector_code(sector: str, industry: str) -> int:
+    """Sector tier of a symbol, as one of the SECTOR_* codes"""
+    if sector in PREFERRED_SECTORS or industry in PREFERRED_INDUSTRIES:
+        return SECTOR_PREFERRED
+    elif sector in GOOD_SECTORS:
+        return SECTOR_GOOD
+    elif sector in NEUTRAL_SECTORS:
+        return SECTOR_NEUTRAL
+    return SECTOR_OTHER
+
+def score_batch(relative_volume, gap_percent, float_shares, current_price, sector_code):
+    """
+    Ross Cameron 5 pillar scores for a batch of symbols
+    
+    Takes one array per metric, one entry per symbol. Returns the 0-100 pillar
+    scores as an (n, 5) array in PILLARS order and the overall Ross score of
+    each symbol.
+    """
+    _, pillars = score_pillars(relative_volume, gap_percent, float_shares, current_price, sector_code,
+                               PILLAR_TABLES)
+    
+    # Weighted sum of the pillars, truncated to a whole score
+    total_score = pillars[:, VOLUME] * PILLAR_WEIGHT
+    for k in range(GAP, len(PILLARS)):
+        total_score += pillars[:, k] * PILLAR_WEIGHT
+    return pillars, total_score.astype(np.int64)
+
+MAX_WORKERS = 16  # Yahoo calls are I/O-bound, so threads scale well
+
+# Blocking yfinance work runs here so it never stalls the event loop
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# On-disk cache for Yahoo responses, shared by every worker process
+CACHE_DIR = os.getenv('API_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'api'))
+INFO_TTL = 24 * 60 * 60  # Company info barely changes within a day
+HISTORY_TTL = 60  # Price and volume move; refresh history every minute
+
+# The only company info fields the scoring reads; the rest of Yahoo's 100+
+# field quote summary is dropped before caching
+INFO_FIELDS = ('longName', 'shortName', 'floatShares', 'sharesOutstanding', 'sector', 'industry')
+
+# Symbols /stocks analyzes by default. Their info is kept in STATIC_INFO and
+# refreshed in the background, so requests for them only fetch history.
+DEFAULT_SYMBOLS = "GITS,CPOP,CLBR,SQFT"
+STATIC_INFO_REFRESH = 60 * 60  # Seconds between background refreshes
+STATIC_INFO: Dict[str, Tuple[dict, bool]] = {}
+
+def fetch_info(symbol: str) -> Tuple[dict, bool]:
+    """Company info for a symbol and whether it has listed options"""
+    if symbol in STATIC_INFO:
+        return STATIC_INFO[symbol]
+    return _load_info(symbol)
+
+def _load_info(symbol: str) -> Tuple[dict, bool]:
+    """fetch_info from the disk cache, or from Yahoo when older than INFO_TTL"""
+    key = ('info', symbol)
+    cached = yahoo_data.disk_cache(CACHE_DIR).get(key)
+    if cached is not None:
+        return cached
+    
+    ticker = yf.Ticker(symbol, session=yahoo_data.yahoo_session())
+    full_info = ticker.get_info()
+    info = {field: full_info[field] for field in INFO_FIELDS if field in full_info}
+    
+    # Check if stock has options
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period='10d')
-        
-        if len(hist) < 2:
-            return None
+        options_dates = ticker.options
+        has_options = len(options_dates) > 0
+    except:
+        has_options = False
+    
+    yahoo_data.disk_cache(CACHE_DIR).set(key, (info, has_options), expire=INFO_TTL)
+    return info, has_options
+
+def fetch_histories(symbols: List[str], period: str = '10d') -> Dict[str, pd.DataFrame]:
+    """Daily history for every symbol, keyed by symbol; cached for HISTORY_TTL"""
+    return yahoo_data.fetch_histories(symbols, period, CACHE_DIR, HISTORY_TTL, auto_adjust=True)
+
+@dataclass(slots=True)
+class ScanBatch:
+    """
+    Metrics of a batch of scanned symbols, laid out column-wise
+    
+    Entry i of every field belongs to symbols[i].
+    """
+    symbols: List[str]
+    companies: List[str]
+    has_options: List[bool]
+    current_price: np.ndarray
+    gap_percent: np.ndarray
+    current_volume: np.ndarray
+    relative_volume: np.ndarray
+    float_shares: np.ndarray
+    sector_code: np.ndarray
+
+def build_batch(symbols: List[str], histories: Dict[str, pd.DataFrame],
+                infos: Dict[str, Tuple[dict, bool]]) -> ScanBatch:
+    """
+    Gather the scored metrics of every symbol into one ScanBatch
+    
+    Symbols without info, with under two days of history, whose data can't be
+    read, or with a missing latest price, volume or float are left out.
+    """
+    kept, companies, has_options, sector_codes, rows = [], [], [], [], []
+    for symbol in symbols:
+        if symbol not in infos or symbol not in histories or len(histories[symbol]) < 2:
+            continue
+        hist = histories[symbol]
+        info, options = infos[symbol]
         
-        # Check if stock has options
         try:
-            options_dates = ticker.options
-            has_options = len(options_dates) > 0
-        except:
-            has_options = False
-        
-        # Get current data
-        current_price = hist['Close'].iloc[-1]
-        prev_close = hist['Close'].iloc[-2]
-        current_volume = hist['Volume'].iloc[-1]
-        avg_volume = hist['Volume'][:-1].mean()
-        
-        # Calculate metrics
-        gap_percent = ((current_price - prev_close) / prev_close) * 100
-        relative_volume = current_volume / avg_volume if avg_volume > 0 else 0
-        
-        # Get company info
-        company_name = info.get('longName', info.get('shortName', symbol))
-        float_shares = info.get('floatShares', info.get('sharesOutstanding', 0))
-        
-        # Format float for display
-        if float_shares >= 1_000_000:
-            float_display = f"{float_shares / 1_000_000:.2f}M"
-        elif float_shares >= 1_000:
-            float_display = f"{float_shares / 1_000:.0f}K"
-        else:
-            float_display = str(float_shares)
-        
-        # Format volume for display
-        if current_volume >= 1_000_000:
-            volume_display = f"{current_volume / 1_000_000:.1f}M"
-        elif current_volume >= 1_000:
-            volume_display = f"{current_volume / 1_000:.0f}K"
-        else:
-            volume_display = str(int(current_volume))
-        
-        # Ross Cameron 5 Pillars Scoring
-        pillars = {}
-        total_score = 0
-        
-        # Pillar 1: Volume (20 points max)
-        if relative_volume >= 10.0:
-            volume_score = 100
-        elif relative_volume >= 5.0:
-            volume_score = 90
-        elif relative_volume >= 3.0:
-            volume_score = 80
-        elif relative_volume >= 2.0:
-            volume_score = 70
-        elif relative_volume >= 1.5:
-            volume_score = 50
-        else:
-            volume_score = 0
-        pillars['volume'] = volume_score
-        total_score += volume_score * 0.20
-        
-        # Pillar 2: Gap (20 points max)
-        abs_gap = abs(gap_percent)
-        if abs_gap >= 30.0:
-            gap_score = 100
-        elif abs_gap >= 20.0:
-            gap_score = 90
-        elif abs_gap >= 10.0:
-            gap_score = 80
-        elif abs_gap >= 4.0:
-            gap_score = 70
-        elif abs_gap >= 2.0:
-            gap_score = 50
-        else:
-            gap_score = 0
-        pillars['gap'] = gap_score
-        total_score += gap_score * 0.20
-        
-        # Pillar 3: Float (20 points max)
-        if float_shares == 0:
-            float_score = 50
-        elif float_shares <= 5_000_000:
-            float_score = 100
-        elif float_shares <= 10_000_000:
-            float_score = 90
-        elif float_shares <= 20_000_000:
-            float_score = 80
-        elif float_shares <= 50_000_000:
-            float_score = 70
-        elif float_shares <= 100_000_000:
-            float_score = 50
-        else:
-            float_score = 0
-        pillars['float'] = float_score
-        total_score += float_score * 0.20
+            close = hist['Close'].to_numpy(dtype=np.float64)
+            volume = hist['Volume'].to_numpy(dtype=np.float64)
+            float_shares = float(info.get('floatShares', info.get('sharesOutstanding', 0)))
+        except Exception as e:
+            print(f"Error analyzing {symbol}: {e}")
+            continue
         
-        # Pillar 4: Price Range (20 points max)
-        if 2.0 <= current_price <= 20.0:
-            price_score = 100
-        elif 1.0 <= current_price <= 30.0:
-            price_score = 80
-        elif 0.5 <= current_price <= 50.0:
-            price_score = 60
-        elif current_price <= 100.0:
-            price_score = 40
-        else:
-            price_score = 0
-        pillars['price'] = price_score
-        total_score += price_score * 0.20
-        
-        # Pillar 5: Sector (20 points max)
-        sector = info.get('sector', 'Unknown')
-        industry = info.get('industry', 'Unknown')
-        preferred_sectors = ['Healthcare', 'Technology', 'Communication Services']
-        preferred_industries = ['Biotechnology', 'Software', 'Semiconductors']
-        
-        if sector in preferred_sectors or industry in preferred_industries:
-            sector_score = 100
-        elif sector in ['Consumer Discretionary', 'Industrials', 'Real Estate']:
-            sector_score = 80
-        elif sector in ['Consumer Staples', 'Utilities']:
-            sector_score = 60
-        else:
-            sector_score = 25
-        pillars['sector'] = sector_score
-        total_score += sector_score * 0.20
-        
-        # Overall grade and recommendation
-        ross_score = int(total_score)
-        
-        if ross_score >= 90:
-            grade = "A+"
-            recommendation = "STRONG BUY"
-        elif ross_score >= 85:
-            grade = "A"
-            recommendation = "STRONG BUY"
-        elif ross_score >= 75:
-            grade = "B+"
-            recommendation = "BUY"
-        elif ross_score >= 65:
-            grade = "B"
-            recommendation = "BUY"
-        elif ross_score >= 55:
-            grade = "C"
-            recommendation = "HOLD"
-        else:
-            grade = "D"
-            recommendation = "AVOID"
-        
-        return StockAnalysis(
-            symbol=symbol,
-            company=company_name,
-            price=round(current_price, 2),
-            change=round(gap_percent, 2),
-            volume=volume_display,
-            relativeVolume=round(relative_volume, 1),
-            float=float_display,
-            rossScore=ross_score,
-            grade=grade,
-            recommendation=recommendation,
-            pillars=pillars,
-            hasOptions=has_options
-        )
+        # These are reported as-is, and a NaN can't be formatted as a share count
+        if not np.isfinite([close[-1], volume[-1], float_shares]).all():
+            print(f"Error analyzing {symbol}: missing latest price, volume or float")
+            continue
         
+        # Current and previous close, today's and average volume (nan-aware,
+        # matching pandas' skipna), and float
+        rows.append((close[-1], close[-2], volume[-1], np.nanmean(volume[:-1]), float_shares))
+        kept.append(symbol)
+        companies.append(info.get('longName', info.get('shortName', symbol)))
+        has_options.append(options)
+        sector_codes.append(_sector_code(info.get('sector', 'Unknown'), info.get('industry', 'Unknown')))
+    
+    current_price, prev_close, current_volume, avg_volume, float_shares = (
+        np.array(rows, dtype=np.float64).reshape(-1, 5).T
+    )
+    return ScanBatch(
+        symbols=kept,
+        companies=companies,
+        has_options=has_options,
+        current_price=current_price,
+        gap_percent=((current_price - prev_close) / prev_close) * 100,
+        current_volume=current_volume,
+        relative_volume=np.divide(current_volume, avg_volume, out=np.zeros_like(current_volume),
+                                  where=avg_volume > 0),
+        float_shares=float_shares,
+        sector_code=np.array(sector_codes, dtype=np.int64)
+    )
+
+def _format_shares(count: float, precision: int) -> str:
+    """Share count shortened to millions (with `precision` decimals) or thousands"""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.{precision}f}M"
+    elif count >= 1_000:
+        return f"{count / 1_000:.0f}K"
+    return str(int(count))
+
+def score_symbols(batch: ScanBatch) -> List[dict]:
+    """Score a whole batch in one pass, then build each symbol's StockAnalysis dict"""
+    if not batch.symbols:
+        return []
+    
+    pillar_scores, ross_scores = score_batch(
+        batch.relative_volume, batch.gap_percent, batch.float_shares, batch.current_price, batch.sector_code
+    )
+    overall = np.searchsorted(OVERALL_THRESH, ross_scores, side='right')
+    
+    return [
+        {
+            'symbol': symbol,
+            'company': batch.companies[i],
+            'price': float(round(batch.current_price[i], 2)),
+            'change': float(round(batch.gap_percent[i], 2)),
+            'volume': _format_shares(batch.current_volume[i], 1),
+            'relativeVolume': float(round(batch.relative_volume[i], 1)),
+            'float': _format_shares(batch.float_shares[i], 2),
+            'rossScore': int(ross_scores[i]),
+            'grade': OVERALL_GRADES[overall[i]],
+            'recommendation': OVERALL_RECOMMENDATIONS[overall[i]],
+            'pillars': dict(zip(PILLARS, pillar_scores[i].tolist())),
+            'hasOptions': bool(batch.has_options[i])
+        }
+        for i, symbol in enumerate(batch.symbols)
+    ]
+
+def analyze_stock_live(symbol: str) -> Optional[dict]:
+    """Analyze a stock using Ross Cameron methodology with live data"""
+    try:
+        info, has_options = fetch_info(symbol)
+        hist = fetch_histories([symbol])[symbol]
     except Exception as e:
         print(f"Error analyzing {symbol}: {e}")
         return None
+    
+    results = score_symbols(build_batch([symbol], {symbol: hist}, {symbol: (info, has_options)}))
+    return results[0] if results else None
+
+async def _refresh_static_info():
+    """Reload STATIC_INFO for DEFAULT_SYMBOLS every STATIC_INFO_REFRESH seconds"""
+    loop = asyncio.get_running_loop()
+    symbols = DEFAULT_SYMBOLS.split(',')
+    while True:
+        fetched = await asyncio.gather(
+            *(loop.run_in_executor(EXECUTOR, _load_info, symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, info in zip(symbols, fetched):
+            if isinstance(info, Exception):
+                print(f"Error loading info for {symbol}: {info}")
+            else:
+                STATIC_INFO[symbol] = info
+        await asyncio.sleep(STATIC_INFO_REFRESH)
+
+@app.on_event("startup")
+async def start_static_info_refresh():
+    """Start keeping the default symbols' info warm"""
+    app.state.static_info_task = asyncio.create_task(_refresh_static_info())
 
 @app.get("/")
 async def root():
@@ -233,8 +328,8 @@ async def health():
         "timestamp": datetime.now().isoformat()
     }
 
-@app.get("/stocks", response_model=List[StockAnalysis])
-async def get_stocks(symbols: str = "GITS,CPOP,CLBR,SQFT"):
+@app.get("/stocks", responses={200: {"model": List[StockAnalysis]}})
+async def get_stocks(symbols: str = DEFAULT_SYMBOLS):
     """
     Get Ross Cameron analysis for multiple stocks
     
@@ -242,19 +337,32 @@ async def get_stocks(symbols: str = "GITS,CPOP,CLBR,SQFT"):
     - symbols: Comma-separated list of stock symbols (default: GITS,CPOP,CLBR,SQFT)
     """
     symbol_list = [s.strip().upper() for s in symbols.split(',')]
-    results = []
     
-    for symbol in symbol_list:
-        analysis = analyze_stock_live(symbol)
-        if analysis:
-            results.append(analysis)
+    # Info lookups run concurrently on the executor alongside one batched
+    # history download
+    loop = asyncio.get_running_loop()
+    unique_symbols = list(dict.fromkeys(symbol_list))
+    histories, *fetched = await asyncio.gather(
+        loop.run_in_executor(EXECUTOR, fetch_histories, symbol_list),
+        *(loop.run_in_executor(EXECUTOR, fetch_info, symbol) for symbol in unique_symbols),
+        return_exceptions=True
+    )
     
-    # Sort by Ross score descending
-    results.sort(key=lambda x: x.rossScore, reverse=True)
+    if isinstance(histories, Exception):
+        print(f"Error downloading {symbols}: {histories}")
+        histories = {}
+    infos = {}
+    for symbol, info in zip(unique_symbols, fetched):
+        if isinstance(info, Exception):
+            print(f"Error analyzing {symbol}: {info}")
+        else:
+            infos[symbol] = info
     
-    return results
+    # Sort by Ross score descending
+    return sorted(score_symbols(build_batch(symbol_list, histories, infos)),
+                  key=itemgetter('rossScore'), reverse=True)
 
-@app.get("/stocks/{symbol}", response_model=StockAnalysis)
+@app.get("/stocks/{symbol}", responses={200: {"model": StockAnalysis}})
 async def get_stock(symbol: str):
     """
     Get Ross Cameron analysis for a specific stock
@@ -263,7 +371,7 @@ async def get_stock(symbol: str):
     - symbol: Stock ticker symbol (e.g., GITS, CPOP)
     """
     symbol = symbol.upper()
-    analysis = analyze_stock_live(symbol)
+    analysis = await asyncio.get_running_loop().run_in_executor(EXECUTOR, analyze_stock_live, symbol)
     
     if not analysis:
         raise HTTPException(status_code=404, detail=f"Stock {symbol} not found or insufficient data")
@@ -278,10 +386,15 @@ if __name__ == "__main__":
     print(f"📖 API docs at: http://0.0.0.0:{port}/docs")
     print("")
     
+    # uvloop and httptools come with uvicorn[standard]. Workers need the app as
+    # an import string so each process can load it.
     uvicorn.run(
-        app,
+        "api_server:app",
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", os.cpu_count() or 1))
     )
 
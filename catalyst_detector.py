@@ -9,6 +9,16 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import re
 
+try:
+    import hyperscan
+except ImportError:  # Fall back to pyahocorasick when Hyperscan isn't installed
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to a compiled regex when pyahocorasick isn't installed
+    ahocorasick = None
+
 from ..core.logger import get_logger
 from .news_scraper import NewsArticle, NewsAnalysisResult
 
@@ -211,8 +221,82 @@ class CatalystDetector:
             ]
         }
         
+        # Articles are lowercased before matching, so keywords are lowercased once here
+        for patterns in (self.catalyst_patterns, self.negative_catalysts):
+            for config in patterns.values():
+                config['keywords'] = [keyword.lower() for keyword in config['keywords']]
+        self.urgency_indicators = {
+            timing: [indicator.lower() for indicator in indicators]
+            for timing, indicators in self.urgency_indicators.items()
+        }
+        
+        # Every catalyst keyword and urgency indicator goes into one automaton
+        # so an article is scanned once
+        self._all_keywords = list(dict.fromkeys(
+            [keyword
+             for patterns in (self.catalyst_patterns, self.negative_catalysts)
+             for config in patterns.values()
+             for keyword in config['keywords']]
+            + [indicator for indicators in self.urgency_indicators.values() for indicator in indicators]
+        ))
+        # Prefer Hyperscan, then pyahocorasick, then a compiled regex
+        self._keyword_database = self._build_keyword_database(self._all_keywords)
+        self._keyword_automaton = (self._build_keyword_automaton(self._all_keywords)
+                                   if self._keyword_database is None else None)
+        self._keyword_pattern = (self._build_keyword_pattern(self._all_keywords)
+                                 if self._keyword_database is None and self._keyword_automaton is None
+                                 else None)
+        
         logger.info("Catalyst Detector initialized")
     
+    @staticmethod
+    def _build_keyword_database(keywords: List[str]):
+        """Hyperscan database with one pattern id per keyword (None without hyperscan)"""
+        if hyperscan is None:
+            return None
+        
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[re.escape(keyword).encode() for keyword in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords)
+        )
+        return database
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: List[str]):
+        """Aho-Corasick automaton over the keywords (None without pyahocorasick)"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _build_keyword_pattern(keywords: List[str]) -> re.Pattern:
+        """Regex matching the longest keyword that starts at each position"""
+        alternation = '|'.join(re.escape(keyword)
+                               for keyword in sorted(keywords, key=len, reverse=True))
+        return re.compile(f'(?=({alternation}))')
+    
+    def _find_keywords(self, text: str) -> set:
+        """Keywords and urgency indicators that occur anywhere in the lowercased text"""
+        if self._keyword_database is not None:
+            hits = set()
+            self._keyword_database.scan(text.encode('utf-8', 'surrogatepass'),
+                                        match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id))
+            return {self._all_keywords[pattern_id] for pattern_id in hits}
+        if self._keyword_automaton is None:
+            # Any keyword starting where a hit starts is a prefix of that hit
+            hits = set(self._keyword_pattern.findall(text))
+            return {keyword for keyword in self._all_keywords
+                    if any(hit.startswith(keyword) for hit in hits)}
+        return {keyword for _, keyword in self._keyword_automaton.iter(text)}
+    
     def detect_catalysts(self, news_result: NewsAnalysisResult) -> CatalystAnalysis:
         """
         Detect and analyze catalysts from news articles
@@ -277,33 +361,37 @@ class CatalystDetector:
         catalysts = []
         
         try:
-            text = f"{article.title} {article.content}".lower()
+            # Lowercase the title once and reuse it for the full text and title scans
+            title_lc = article.title.lower()
+            text = f"{title_lc} {article.content.lower()}"
+            
+            # One scan of the article finds the keywords of every catalyst type
+            found = self._find_keywords(text)
+            if not found:
+                return catalysts
+            title_found = self._find_keywords(title_lc)
+            urgent_timing = self._determine_catalyst_timing(found, None)
+            hours_old = (datetime.now() - article.published_date).total_seconds() / 3600
             
             # Check positive catalysts
             for catalyst_type, config in self.catalyst_patterns.items():
-                matched_keywords = []
-                confidence = 0
-                
-                for keyword in config['keywords']:
-                    if keyword.lower() in text:
-                        matched_keywords.append(keyword)
-                        confidence += 10  # Base confidence per keyword
+                matched_keywords = [keyword for keyword in config['keywords'] if keyword in found]
+                confidence = len(matched_keywords) * 10  # Base confidence per keyword
                 
                 if matched_keywords:
                     # Boost confidence based on title vs content
-                    title_matches = sum(1 for kw in matched_keywords if kw.lower() in article.title.lower())
+                    title_matches = sum(1 for kw in matched_keywords if kw in title_found)
                     if title_matches > 0:
                         confidence += title_matches * 20  # Title matches are more important
                     
                     # Boost confidence based on recency
-                    hours_old = (datetime.now() - article.published_date).total_seconds() / 3600
                     if hours_old <= 1:
                         confidence += 20
                     elif hours_old <= 6:
                         confidence += 10
                     
                     # Determine timing
-                    timing = self._determine_catalyst_timing(text, config['timing'])
+                    timing = urgent_timing or config['timing']
                     
                     # Create catalyst event
                     catalyst = CatalystEvent(
@@ -322,21 +410,15 @@ class CatalystDetector:
             
             # Check negative catalysts
             for catalyst_type, config in self.negative_catalysts.items():
-                matched_keywords = []
-                confidence = 0
-                
-                for keyword in config['keywords']:
-                    if keyword.lower() in text:
-                        matched_keywords.append(keyword)
-                        confidence += 15  # Negative catalysts get higher base confidence
+                matched_keywords = [keyword for keyword in config['keywords'] if keyword in found]
+                confidence = len(matched_keywords) * 15  # Negative catalysts get higher base confidence
                 
                 if matched_keywords:
                     # Title boost
-                    title_matches = sum(1 for kw in matched_keywords if kw.lower() in article.title.lower())
+                    title_matches = sum(1 for kw in matched_keywords if kw in title_found)
                     confidence += title_matches * 25
                     
                     # Recency boost
-                    hours_old = (datetime.now() - article.published_date).total_seconds() / 3600
                     if hours_old <= 1:
                         confidence += 25
                     
@@ -360,14 +442,13 @@ class CatalystDetector:
             logger.warning(f"Error analyzing article for catalysts: {e}")
             return []
     
-    def _determine_catalyst_timing(self, text: str, default_timing: str) -> str:
-        """Determine timing of catalyst based on text analysis"""
+    def _determine_catalyst_timing(self, found: set, default_timing: Optional[str]) -> Optional[str]:
+        """Determine timing of catalyst from the indicators found in the article"""
         try:
             # Check for urgency indicators
             for timing, indicators in self.urgency_indicators.items():
-                for indicator in indicators:
-                    if indicator in text:
-                        return timing
+                if any(indicator in found for indicator in indicators):
+                    return timing
             
             return default_timing
             
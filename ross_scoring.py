@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Ross Cameron 5 pillar scoring shared by api_server.py and analyze_sqft.py
+
+Pillar scores are on one canonical 0-100 scale; callers convert to their own
+point scale. Each caller supplies its own thresholds through PillarTables.
+"""
+from typing import NamedTuple
+
+import numpy as np
+from numba import njit
+
+# Pillar order in the tier/score rows returned by score_pillars
+PILLARS = ('volume', 'gap', 'float', 'price', 'sector')
+VOLUME, GAP, FLOAT, PRICE, SECTOR = range(len(PILLARS))
+
+UNKNOWN_FLOAT_TIER = -1  # Float tier when Yahoo has no float (0)
+
+class PillarTables(NamedTuple):
+    """
+    Threshold and 0-100 score tables for the five pillars
+    
+    Each metric is searched in its *_thresh array and the tier it lands in
+    indexes *_scores. Volume and gap tiers start at the threshold (>=), float
+    tiers end at it (<=). Price bands that include their upper edge should
+    nudge it up one ulp. Sector tiers are codes picked by the caller.
+    """
+    vol_thresh: np.ndarray
+    vol_scores: np.ndarray
+    gap_thresh: np.ndarray
+    gap_scores: np.ndarray
+    float_thresh: np.ndarray
+    float_scores: np.ndarray
+    unknown_float_score: int
+    price_thresh: np.ndarray
+    price_scores: np.ndarray
+    sector_scores: np.ndarray
+
+@njit(cache=True, nogil=True)
+def score_pillars(relative_volume, gap_percent, float_shares, current_price, sector_code, tables):
+    """
+    Tiers and 0-100 scores of the five pillars for a batch of symbols
+    
+    Takes one array per metric, one entry per symbol, and returns two (n, 5)
+    arrays in PILLARS order. The float tier is UNKNOWN_FLOAT_TIER when the
+    float is unknown; a NaN volume or gap scores the bottom tier.
+    """
+    tiers = np.empty((relative_volume.shape[0], len(PILLARS)), dtype=np.int64)
+    # NaN sorts past every threshold, so a missing volume or gap is sent to the
+    # bottom tier explicitly (a NaN price or float already lands on a 0 score)
+    tiers[:, VOLUME] = np.where(np.isnan(relative_volume), 0,
+                                np.searchsorted(tables.vol_thresh, relative_volume, side='right'))
+    tiers[:, GAP] = np.where(np.isnan(gap_percent), 0,
+                             np.searchsorted(tables.gap_thresh, np.abs(gap_percent), side='right'))
+    tiers[:, FLOAT] = np.where(float_shares == 0, UNKNOWN_FLOAT_TIER,
+                               np.searchsorted(tables.float_thresh, float_shares, side='left'))
+    tiers[:, PRICE] = np.searchsorted(tables.price_thresh, current_price, side='right')
+    tiers[:, SECTOR] = sector_code
+    
+    scores = np.empty_like(tiers)
+    scores[:, VOLUME] = tables.vol_scores[tiers[:, VOLUME]]
+    scores[:, GAP] = tables.gap_scores[tiers[:, GAP]]
+    scores[:, FLOAT] = np.where(tiers[:, FLOAT] == UNKNOWN_FLOAT_TIER, tables.unknown_float_score,
+                                tables.float_scores[np.maximum(tiers[:, FLOAT], 0)])
+    scores[:, PRICE] = tables.price_scores[tiers[:, PRICE]]
+    scores[:, SECTOR] = tables.sector_scores[tiers[:, SECTOR]]
+    return tiers, scores
@@ -334,8 +334,8 @@ class TechnicalAnalyzer:
             # Check ABCD patterns
             if abcd_analysis.entry_signals:
                 for signal in abcd_analysis.entry_signals:
-                    if signal['signal_strength'] in ['strong', 'moderate']:
-                        recommendation['reasons'].append(f"ABCD {signal['pattern_type']} entry signal")
+                    if signal.signal_strength in ['strong', 'moderate']:
+                        recommendation['reasons'].append(f"ABCD {signal.pattern_type} entry signal")
                         recommendation['confidence'] += 15
             
             # Check RSI
@@ -398,10 +398,10 @@ class TechnicalAnalyzer:
             # Check ABCD patterns
             if abcd_analysis.exit_signals:
                 for signal in abcd_analysis.exit_signals:
-                    if signal['type'] == 'take_profit':
+                    if signal.type == 'take_profit':
                         recommendation['reasons'].append('ABCD pattern target reached')
                         recommendation['confidence'] += 20
-                    elif signal['type'] == 'stop_loss':
+                    elif signal.type == 'stop_loss':
                         recommendation['reasons'].append('ABCD pattern stop loss hit')
                         recommendation['confidence'] += 30
                         recommendation['urgency'] = 'high'
@@ -611,10 +611,13 @@ class TechnicalAnalyzer:
     def _assess_volatility(self, price_data: pd.DataFrame) -> str:
         """Assess price volatility"""
         try:
-            # Calculate recent volatility (last 20 periods)
-            recent_data = price_data.tail(20)
-            returns = recent_data['close'].pct_change().dropna()
-            volatility = returns.std() * np.sqrt(252)  # Annualized
+            # Calculate recent volatility (last 20 periods) straight from the
+            # close array; nanstd skips missing returns the way dropna() did
+            close = price_data['close'].to_numpy(dtype=np.float64)[-20:]
+            returns = close[1:] / close[:-1] - 1
+            if np.count_nonzero(~np.isnan(returns)) < 2:
+                return 'low'  # Too few returns to measure
+            volatility = np.nanstd(returns, ddof=1) * np.sqrt(252)  # Annualized
             
             if volatility > 0.5:  # 50%+ annualized
                 return 'high'
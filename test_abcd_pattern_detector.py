@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for ABCD swing detection and the batch/streaming analysis paths
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from scipy.signal import find_peaks
+
+from src.analysis.abcd_pattern_detector import ABCDPatternDetector, ABCDStreamState, _find_swing_extrema
+
+DISTANCE = 3  # Minimum distance between swings used by the detector
+
+def scipy_swings(high_prices, low_prices, distance=DISTANCE):
+    """Reference swing highs and lows from scipy.signal.find_peaks"""
+    peaks, _ = find_peaks(high_prices, distance=distance, prominence=0.5 * np.std(high_prices))
+    troughs, _ = find_peaks(-low_prices, distance=distance, prominence=0.5 * np.std(low_prices))
+    return peaks, troughs
+
+def assert_matches_scipy(high_prices, low_prices, distance=DISTANCE):
+    """_find_swing_extrema picks exactly the swings scipy does"""
+    high_prices = np.asarray(high_prices, dtype=np.float64)
+    low_prices = np.asarray(low_prices, dtype=np.float64)
+    peaks, troughs = _find_swing_extrema(high_prices, low_prices, distance)
+    expected_peaks, expected_troughs = scipy_swings(high_prices, low_prices, distance)
+    np.testing.assert_array_equal(peaks, expected_peaks)
+    np.testing.assert_array_equal(troughs, expected_troughs)
+
+def random_bars(rng, n_bars, decimals=None):
+    """Random-walk OHLCV bars, optionally rounded so equal prices (plateaus, ties) are common"""
+    close = 10 + np.cumsum(rng.normal(0, 0.3, n_bars))
+    high = close + np.abs(rng.normal(0, 0.2, n_bars))
+    low = close - np.abs(rng.normal(0, 0.2, n_bars))
+    if decimals is not None:
+        close, high, low = np.round(close, decimals), np.round(high, decimals), np.round(low, decimals)
+    
+    return pd.DataFrame({
+        'open': close,
+        'high': np.maximum(high, close),
+        'low': np.minimum(low, close),
+        'close': close,
+        'volume': rng.integers(100_000, 1_000_000, n_bars)
+    }, index=pd.date_range('2024-01-01', periods=n_bars, freq='D'))
+
+def test_random_series_match_scipy():
+    """Random walks, full precision and rounded to one decimal, across distances"""
+    rng = np.random.default_rng(42)
+    for trial in range(500):
+        bars = random_bars(rng, int(rng.integers(1, 300)), decimals=1 if trial % 2 else None)
+        for distance in (1, 2, 3, 5):
+            assert_matches_scipy(bars['high'], bars['low'], distance)
+
+def test_plateaus_match_scipy():
+    """Flat tops and bottoms resolve to the same (middle) sample as scipy"""
+    high = [1, 2, 5, 5, 5, 2, 1, 3, 3, 1, 4, 4, 4, 4, 0, 1]
+    low = [0, 1, 4, 4, 1, -1, -1, -1, 0, 2, 0, 0, 3, 3, 1, 0]
+    assert_matches_scipy(high, low)
+    assert_matches_scipy(high, low, distance=1)
+
+def test_ties_match_scipy():
+    """Equal peaks closer than the distance are resolved the same way as scipy"""
+    high = [0, 5, 0, 5, 0, 5, 0, 5, 0, 1, 0, 5, 0, 5, 0]
+    low = [5, 0, 5, 0, 5, 0, 5, 0, 5, 4, 5, 0, 5, 0, 5]
+    assert_matches_scipy(high, low)
+    assert_matches_scipy(high, low, distance=5)
+
+def test_flat_and_short_series():
+    """Flat series have no swings; series too short for a peak have none either"""
+    for n_bars in (1, 2, 3, 10):
+        peaks, troughs = _find_swing_extrema(np.full(n_bars, 7.0), np.full(n_bars, 6.0), DISTANCE)
+        assert len(peaks) == 0 and len(troughs) == 0
+    
+    for high, low in (([1.0], [0.5]), ([1.0, 2.0], [0.5, 0.4]), ([1.0, 2.0, 1.0], [0.5, 0.2, 0.5])):
+        assert_matches_scipy(high, low)
+
+def test_nan_gap_between_highs_and_lows():
+    """
+    Highs and negated lows are scanned as one series joined by a NaN gap; a
+    rising edge at the end of the highs and at the start of the negated lows
+    must not become a swing or lend prominence across the gap
+    """
+    # Highs rise into the last bar, lows fall from the first bar
+    high = [1, 3, 1, 2, 1, 4, 1, 5, 6, 7, 8]
+    low = [-9, -8, -7, -6, 1, 0, 2, 0, 3, 0, 2]
+    assert_matches_scipy(high, low)
+    
+    # A peak right next to the gap on either side
+    high = [1, 2, 1, 3, 1, 2, 1, 2, 1, 9, 1]
+    low = [1, -9, 1, 0, 1, 0, 1, 0, 1, 0, 1]
+    assert_matches_scipy(high, low)
+
+def test_batch_matches_single():
+    """analyze_abcd_patterns_batch returns the same analysis as per-symbol calls"""
+    detector = ABCDPatternDetector()
+    rng = np.random.default_rng(7)
+    price_data = {f"SYM{n}": random_bars(rng, n_bars)
+                  for n, n_bars in enumerate((5, 40, 120, 250, 250, 400))}
+    price_data['FLAT'] = random_bars(rng, 60).assign(high=5.0, low=5.0, close=5.0)
+    
+    batch = detector.analyze_abcd_patterns_batch(price_data)
+    assert list(batch) == list(price_data)
+    
+    total_patterns = 0
+    for symbol, frame in price_data.items():
+        assert batch[symbol] == detector.analyze_abcd_patterns(frame), symbol
+        total_patterns += len(batch[symbol].patterns_found)
+    assert total_patterns > 0  # The comparison exercised real patterns
+
+def test_stream_matches_recent_swings():
+    """
+    On a clean wave, streaming swings equal the full-history swings within the
+    two pattern lengths the stream keeps
+    """
+    detector = ABCDPatternDetector()
+    n_bars = 120
+    bar = np.arange(n_bars)
+    close = 10 + 2 * np.sin(2 * np.pi * bar / 16) + 0.01 * bar
+    frame = pd.DataFrame({'high': close + 0.1, 'low': close - 0.1, 'close': close},
+                         index=pd.date_range('2024-01-01', periods=n_bars, freq='D'))
+    
+    stream = ABCDStreamState(detector)
+    for ts, row in frame.iterrows():
+        analysis = stream.update(row['high'], row['low'], row['close'], ts)
+    
+    swings = detector._find_swing_points(frame['high'].to_numpy(), frame['low'].to_numpy(), frame.index)
+    recent = swings.idx >= n_bars - 2 * detector.max_pattern_length
+    streamed = stream.swing_points()
+    
+    np.testing.assert_array_equal(streamed.idx, swings.idx[recent])
+    np.testing.assert_array_equal(streamed.is_peak, swings.is_peak[recent])
+    np.testing.assert_array_equal(streamed.price, swings.price[recent])
+    assert list(streamed.timestamps) == list(swings.timestamps[recent])
+    assert analysis.pattern_summary['total_complete_patterns'] == len(analysis.patterns_found)
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing ABCD swing detection")
+    tests = (test_random_series_match_scipy, test_plateaus_match_scipy, test_ties_match_scipy,
+             test_flat_and_short_series, test_nan_gap_between_highs_and_lows,
+             test_batch_matches_single, test_stream_matches_recent_swings)
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 All {len(tests)} ABCD checks passed")
+
+if __name__ == "__main__":
+    main()
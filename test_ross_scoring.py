@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Ross Cameron pillar scoring kernel
+"""
+import numpy as np
+
+from ross_scoring import PILLARS, VOLUME, GAP, FLOAT, PRICE, SECTOR, PillarTables, score_pillars
+
+# Same thresholds as the API scoring tables
+TABLES = PillarTables(
+    vol_thresh=np.array([1.5, 2.0, 3.0, 5.0, 10.0]),
+    vol_scores=np.array([0, 50, 70, 80, 90, 100]),
+    gap_thresh=np.array([2.0, 4.0, 10.0, 20.0, 30.0]),
+    gap_scores=np.array([0, 50, 70, 80, 90, 100]),
+    float_thresh=np.array([5e6, 10e6, 20e6, 50e6, 100e6]),
+    float_scores=np.array([100, 90, 80, 70, 50, 0]),
+    unknown_float_score=50,
+    price_thresh=np.array([0.5, 1.0, 2.0, *np.nextafter([20.0, 30.0, 50.0, 100.0], np.inf)]),
+    price_scores=np.array([40, 60, 80, 100, 80, 60, 40, 0]),
+    sector_scores=np.array([100, 80, 60, 25]),
+)
+
+def score(relative_volume, gap_percent, float_shares, current_price, sector_code=0):
+    """Tiers and scores for a single symbol"""
+    tiers, scores = score_pillars(np.array([relative_volume], dtype=np.float64),
+                                  np.array([gap_percent], dtype=np.float64),
+                                  np.array([float_shares], dtype=np.float64),
+                                  np.array([current_price], dtype=np.float64),
+                                  np.array([sector_code], dtype=np.int64), TABLES)
+    return tiers[0], scores[0]
+
+def test_tiers():
+    """Values on and around the thresholds land in the same tiers as the if/elif ladders"""
+    tiers, scores = score(10.0, -30.0, 5e6, 20.0)
+    assert list(scores) == [100, 100, 100, 100, 100]
+    
+    tiers, scores = score(1.49, 1.99, 100e6 + 1, 100.01, 3)
+    assert list(scores) == [0, 0, 0, 0, 25]
+    
+    tiers, scores = score(2.0, 4.0, 0, 30.0)
+    assert scores[VOLUME] == 70 and scores[GAP] == 70
+    assert scores[FLOAT] == 50 and scores[PRICE] == 80
+
+def test_nan_inputs():
+    """A missing metric scores the bottom tier rather than the top one"""
+    tiers, scores = score(np.nan, np.nan, np.nan, np.nan)
+    assert tiers[VOLUME] == 0 and scores[VOLUME] == 0
+    assert tiers[GAP] == 0 and scores[GAP] == 0
+    assert scores[FLOAT] == 0
+    assert scores[PRICE] == 0
+    assert scores[SECTOR] == 100
+    
+    # Only the NaN entries of a batch are affected
+    tiers, scores = score_pillars(np.array([np.nan, 12.0]), np.array([35.0, np.nan]),
+                                  np.array([3e6, 3e6]), np.array([5.0, 5.0]),
+                                  np.array([0, 0], dtype=np.int64), TABLES)
+    assert list(scores[:, VOLUME]) == [0, 100]
+    assert list(scores[:, GAP]) == [100, 0]
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Ross Cameron pillar scoring")
+    for test in (test_tiers, test_nan_inputs):
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 All {len(PILLARS)} pillars scored correctly")
+
+if __name__ == "__main__":
+    main()
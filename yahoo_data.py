@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Yahoo Finance data helpers shared by api_server.py, activate_real_screening.py
+and the analyze_* scripts
+
+Heavy dependencies are imported at their call sites, so importing this module
+stays cheap for the scripts that only need part of it.
+"""
+import functools
+
+@functools.lru_cache(maxsize=None)
+def yahoo_session():
+    """HTTP session shared by every Yahoo call, so connections and cookies are reused"""
+    from curl_cffi import requests as cureq
+    
+    return cureq.Session(impersonate='chrome')
+
+def last_complete_bars(complete):
+    """
+    Row of each symbol's latest and previous complete bar
+    
+    ``complete`` is a (days, symbols) mask of the bars with no missing field.
+    Returns (last, prev, prior) where ``prior`` masks each symbol's complete
+    bars before ``last``. ``last`` and ``prev`` are only meaningful for
+    symbols with at least two complete bars.
+    """
+    import numpy as np
+    
+    cols = np.arange(complete.shape[1])
+    last = len(complete) - 1 - np.argmax(complete[::-1], axis=0)
+    prior = complete.copy()
+    prior[last, cols] = False  # Exclude today
+    prev = len(prior) - 1 - np.argmax(prior[::-1], axis=0)
+    return last, prev, prior
+
+@functools.lru_cache(maxsize=None)
+def disk_cache(cache_dir):
+    """On-disk cache for Yahoo responses in ``cache_dir``, opened once per directory"""
+    import diskcache
+    
+    return diskcache.Cache(cache_dir)
+
+def fetch_info(symbol, fields, cache_dir, ttl):
+    """The ``fields`` of one symbol's company info, cached in ``cache_dir`` for ``ttl`` seconds"""
+    cache = disk_cache(cache_dir)
+    key = ('info', symbol)
+    info = cache.get(key)
+    if info is None:
+        import yfinance as yf
+        
+        full_info = yf.Ticker(symbol, session=yahoo_session()).get_info()
+        info = {field: full_info[field] for field in fields if field in full_info}
+        cache.set(key, info, expire=ttl)
+    return info
+
+def fetch_histories(symbols, period, cache_dir, ttl, auto_adjust=True):
+    """
+    Daily history for every symbol, keyed by symbol
+    
+    Histories cached in ``cache_dir`` within ``ttl`` seconds are reused; the
+    rest come from a single yf.download call. Symbols Yahoo returned nothing
+    for get an empty frame.
+    """
+    import pandas as pd
+    
+    cache = disk_cache(cache_dir)
+    histories = {symbol: cache.get(('history', symbol, period)) for symbol in symbols}
+    missing = [symbol for symbol, hist in histories.items() if hist is None]
+    if not missing:
+        return histories
+    
+    import yfinance as yf
+    
+    hist_all = yf.download(" ".join(missing), period=period, group_by='ticker', threads=True,
+                           progress=False, auto_adjust=auto_adjust, session=yahoo_session())
+    returned = set(hist_all.columns.get_level_values(0))
+    for symbol in missing:
+        if symbol in returned:
+            histories[symbol] = hist_all[symbol].dropna(how='all')
+            cache.set(('history', symbol, period), histories[symbol], expire=ttl)
+        else:
+            histories[symbol] = pd.DataFrame()
+    return histories